@@ -1,6 +1,6 @@
 """Brand reporting domain models and pipelines."""
 
-from .models import BrandReport, BrandSignal
+from .models import BrandReport, BrandSignal, SignalBatch
 from .pipeline import BrandReportPipeline, BrandReportResult, BrandReportToolkit, BrandTask
 from .sources import (
     FileSignalsProvider,
@@ -9,9 +9,12 @@ from .sources import (
     WebPageSignalsProvider,
     GoogleNewsProvider,
 )
-from .summarizer import HeuristicSummarizer
+from .gather import ConcurrentSignalsGatherer, GatherResult, ProviderOutcome
+from .http_cache import HttpCache
+from .summarizer import HeuristicSummarizer, StreamingSummarizer
+from .transport import HttpTransport, default_transport
 from .emailer import EmailSender, InMemoryEmailSender, ResendEmailSender, build_resend_from_env
-from .config import BrandProfile, get_brand_profile
+from .config import BrandProfile, CompiledProfile, get_brand_profile, get_compiled_profile
 from .relevance import apply_relevance_filter, RejectedSignal
 
 __all__ = [
@@ -21,18 +24,28 @@ __all__ = [
     "BrandReportToolkit",
     "BrandSignal",
     "BrandTask",
+    "SignalBatch",
     "FileSignalsProvider",
     "SignalsProvider",
     "StaticSignalsProvider",
     "WebPageSignalsProvider",
     "GoogleNewsProvider",
+    "ConcurrentSignalsGatherer",
+    "GatherResult",
+    "ProviderOutcome",
     "HeuristicSummarizer",
+    "StreamingSummarizer",
+    "HttpCache",
+    "HttpTransport",
+    "default_transport",
     "EmailSender",
     "InMemoryEmailSender",
     "ResendEmailSender",
     "build_resend_from_env",
     "BrandProfile",
     "get_brand_profile",
+    "CompiledProfile",
+    "get_compiled_profile",
     "apply_relevance_filter",
     "RejectedSignal",
 ]
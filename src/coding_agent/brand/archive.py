@@ -0,0 +1,554 @@
+"""Archives for raw signals and report summaries (JSON files or partitioned Parquet)."""
+
+from __future__ import annotations
+
+import fcntl
+import gzip
+import json
+import os
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Protocol, Set, Tuple
+
+from coding_agent.brand.fileio import AtomicWriteBatch, dumps_json, write_json
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.paths import DATA_ROOT, sanitize_brand_id
+
+try:  # optional columnar backend
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = None
+
+ARCHIVE_FORMAT = os.environ.get("BRANDOS_ARCHIVE_FORMAT", "auto")
+_PERIOD_WIDTH = {"day": 10, "month": 7}
+_COMPACTED = "compacted.parquet"
+
+
+@dataclass(frozen=True)
+class ArchivedSignal:
+    """A signal together with the brand and report date it was archived under."""
+
+    brand_id: str
+    report_date: date
+    signal: BrandSignal
+
+
+@dataclass(frozen=True)
+class SignalQuery:
+    """Predicates pushed down to the archive; ``None`` means no constraint."""
+
+    brand_ids: Tuple[str, ...] | None = None
+    start: date | None = None
+    end: date | None = None
+    sources: Tuple[str, ...] | None = None
+    impacts: Tuple[str, ...] | None = None
+
+    def matches(self, brand_id: str, report_date: date, signal: BrandSignal | None = None) -> bool:
+        if self.brand_ids is not None and brand_id not in self.brand_ids:
+            return False
+        if self.start is not None and report_date < self.start:
+            return False
+        if self.end is not None and report_date > self.end:
+            return False
+        if signal is not None:
+            if self.sources is not None and signal.source not in self.sources:
+                return False
+            if self.impacts is not None and signal.impact not in self.impacts:
+                return False
+        return True
+
+
+class SignalArchive(Protocol):
+    """Stores per-brand, per-day signals and summaries and scans them back."""
+
+    def write_signals(self, brand_id: str, report_date: date, signals: Iterable[BrandSignal]) -> Path: ...
+
+    def write_summary(self, brand_id: str, report: BrandReport, message_id: str) -> Path: ...
+
+    def scan_signals(
+        self, query: SignalQuery = SignalQuery(), *, batch_size: int = 1024
+    ) -> Iterator[Tuple[ArchivedSignal, ...]]: ...
+
+    def read_summaries(self, query: SignalQuery = SignalQuery()) -> List[Tuple[BrandReport, str]]: ...
+
+    def compact(self, before: date) -> int:
+        """Fold days older than ``before`` into per-period files; returns the brand-days folded."""
+        ...
+
+    def prune(self, before: date) -> int:
+        """Delete everything dated before ``before``; returns the brand-days removed."""
+        ...
+
+
+def _batched(items: Iterable[ArchivedSignal], size: int) -> Iterator[Tuple[ArchivedSignal, ...]]:
+    batch: List[ArchivedSignal] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+class JsonSignalArchive:
+    """Original layout: ``{brand_id}/{YYYY-MM-DD}/signals.json`` and ``summary.json``.
+
+    Files are replaced atomically and are compact JSON unless ``pretty`` is
+    set. Writes made inside :func:`~coding_agent.brand.fileio.write_batch` are
+    published together when the batch commits. :meth:`compact` folds old day
+    folders into one gzipped ``{brand_id}/{YYYY-MM}.json.gz`` per month, which
+    scans read transparently; a day folder wins over its compacted copy.
+    """
+
+    def __init__(self, root: Path | None = None, *, pretty: bool = False) -> None:
+        self.root = Path(root or DATA_ROOT)
+        self.pretty = pretty
+
+    def _folder(self, brand_id: str, report_date: date) -> Path:
+        return self.root / sanitize_brand_id(brand_id) / report_date.isoformat()
+
+    def write_signals(self, brand_id: str, report_date: date, signals: Iterable[BrandSignal]) -> Path:
+        payload = [signal.to_record() for signal in signals]
+        return write_json(self._folder(brand_id, report_date) / "signals.json", payload, pretty=self.pretty)
+
+    def write_summary(self, brand_id: str, report: BrandReport, message_id: str) -> Path:
+        payload = {
+            "report": report.model_dump(mode="json"),
+            "message_id": message_id,
+        }
+        return write_json(self._folder(brand_id, report.report_date) / "summary.json", payload, pretty=self.pretty)
+
+    @staticmethod
+    def _load_month(path: Path) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(gzip.decompress(path.read_bytes()))["days"]
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _month_bytes(days: Dict[str, Dict[str, Any]]) -> bytes:
+        return gzip.compress(dumps_json({"days": dict(sorted(days.items()))}), mtime=0)
+
+    def _brand_dirs(self) -> Iterator[Path]:
+        # Skips dot-prefixed service directories such as .http-cache and .runs.
+        for brand_dir in sorted(self.root.glob("[!.]*")):
+            if brand_dir.is_dir():
+                yield brand_dir
+
+    @staticmethod
+    def _day_dirs(brand_dir: Path) -> Iterator[Tuple[date, Path]]:
+        for day_dir in sorted(brand_dir.glob("????-??-??")):
+            try:
+                yield date.fromisoformat(day_dir.name), day_dir
+            except ValueError:
+                continue
+
+    def _entries(self, kind: str, query: SignalQuery) -> Iterator[Tuple[str, date, Any]]:
+        """Yield ``(brand_id, report_date, payload)`` for ``kind`` (``signals`` or ``summary``) in date order."""
+
+        first_month = query.start.isoformat()[:7] if query.start else ""
+        last_month = query.end.isoformat()[:7] if query.end else "9999-99"
+        for brand_dir in self._brand_dirs():
+            brand_id = brand_dir.name
+            if query.brand_ids is not None and brand_id not in query.brand_ids:
+                continue
+            loaders: Dict[date, Callable[[], Any]] = {}
+            for month_path in sorted(brand_dir.glob("????-??.json.gz")):
+                if not first_month <= month_path.name[:7] <= last_month:
+                    continue
+                for day, record in self._load_month(month_path).items():
+                    report_date = date.fromisoformat(day)
+                    if kind in record and query.matches(brand_id, report_date):
+                        loaders[report_date] = lambda payload=record[kind]: payload
+            for report_date, day_dir in self._day_dirs(brand_dir):
+                path = day_dir / f"{kind}.json"
+                if path.is_file() and query.matches(brand_id, report_date):
+                    loaders[report_date] = lambda path=path: json.loads(path.read_text(encoding="utf-8"))
+            for report_date in sorted(loaders):
+                yield brand_id, report_date, loaders[report_date]()
+
+    def scan_signals(
+        self, query: SignalQuery = SignalQuery(), *, batch_size: int = 1024
+    ) -> Iterator[Tuple[ArchivedSignal, ...]]:
+        def records() -> Iterator[ArchivedSignal]:
+            for brand_id, report_date, payload in self._entries("signals", query):
+                for item in payload:
+                    signal = BrandSignal.model_validate(item)
+                    if query.matches(brand_id, report_date, signal):
+                        yield ArchivedSignal(brand_id, report_date, signal)
+
+        return _batched(records(), batch_size)
+
+    def read_summaries(self, query: SignalQuery = SignalQuery()) -> List[Tuple[BrandReport, str]]:
+        return [
+            (BrandReport.model_validate(payload["report"]), payload["message_id"])
+            for _brand_id, _report_date, payload in self._entries("summary", query)
+        ]
+
+    def compact(self, before: date) -> int:
+        compacted = 0
+        for brand_dir in self._brand_dirs():
+            months: Dict[str, List[Tuple[date, Path]]] = {}
+            for report_date, day_dir in self._day_dirs(brand_dir):
+                if report_date < before:
+                    months.setdefault(report_date.isoformat()[:7], []).append((report_date, day_dir))
+            if not months:
+                continue
+            batch = AtomicWriteBatch()
+            for month, day_dirs in months.items():
+                month_path = brand_dir / f"{month}.json.gz"
+                days = self._load_month(month_path)
+                for report_date, day_dir in day_dirs:
+                    days[report_date.isoformat()] = {
+                        path.stem: json.loads(path.read_text(encoding="utf-8")) for path in day_dir.glob("*.json")
+                    }
+                batch.write_bytes(month_path, self._month_bytes(days))
+            # Day folders are only removed once their compacted copies are durable.
+            batch.commit()
+            for day_dirs in months.values():
+                for _report_date, day_dir in day_dirs:
+                    shutil.rmtree(day_dir)
+                    compacted += 1
+        return compacted
+
+    def prune(self, before: date) -> int:
+        removed = 0
+        for brand_dir in self._brand_dirs():
+            batch = AtomicWriteBatch()
+            for month_path in sorted(brand_dir.glob("????-??.json.gz")):
+                if month_path.name[:7] > before.isoformat()[:7]:
+                    continue
+                days = self._load_month(month_path)
+                kept = {day: record for day, record in days.items() if day >= before.isoformat()}
+                removed += len(days) - len(kept)
+                if not kept:
+                    month_path.unlink()
+                elif len(kept) < len(days):
+                    batch.write_bytes(month_path, self._month_bytes(kept))
+            batch.commit()
+            for report_date, day_dir in self._day_dirs(brand_dir):
+                if report_date < before:
+                    shutil.rmtree(day_dir)
+                    removed += 1
+        return removed
+
+
+class ParquetSignalArchive:
+    """Columnar, zstd-compressed archive partitioned by period.
+
+    Each brand's day is written as its own part file,
+    ``.archive/signals/period=<YYYY-MM>/part-<YYYY-MM-DD>-<brand_id>.parquet``
+    (or per day with ``partition="day"``), with summaries alongside under
+    ``.archive/summaries``. Rewriting a brand's day replaces only its part,
+    so reruns behave like the JSON layout's overwrite and a write costs the
+    size of that day rather than the whole period. :meth:`compact` merges old
+    parts into one ``compacted.parquet`` per period, sorted by brand and date
+    so row-group statistics let scans skip data; period directories are
+    pruned before any file is opened. Writes, compaction and pruning hold an
+    ``fcntl`` lock on the period directory, so several processes can share
+    one archive.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        partition: str = "month",
+        compression: str = "zstd",
+        row_group_size: int = 64 * 1024,
+    ) -> None:
+        if pa is None:
+            raise RuntimeError("pyarrow is not installed")
+        if partition not in _PERIOD_WIDTH:
+            raise ValueError(f"Unknown archive partition: {partition}")
+        self.root = Path(root or DATA_ROOT) / ".archive"
+        self.partition = partition
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self._lock = threading.Lock()
+        self.signal_schema = pa.schema(
+            [
+                ("brand_id", pa.string()),
+                ("report_date", pa.date32()),
+                ("source", pa.string()),
+                ("headline", pa.string()),
+                ("impact", pa.string()),
+                ("url", pa.string()),
+                ("summary", pa.string()),
+                ("first_seen", pa.date32()),
+                ("cluster_size", pa.int64()),
+                ("keyword_hits", pa.int64()),
+            ]
+        )
+        self.summary_schema = pa.schema(
+            [
+                ("brand_id", pa.string()),
+                ("report_date", pa.date32()),
+                ("message_id", pa.string()),
+                ("report", pa.string()),
+            ]
+        )
+
+    def _period(self, report_date: date) -> str:
+        return report_date.isoformat()[: _PERIOD_WIDTH[self.partition]]
+
+    def _folder(self, kind: str, report_date: date) -> Path:
+        return self.root / kind / f"period={self._period(report_date)}"
+
+    def _schema(self, kind: str) -> "pa.Schema":
+        return self.signal_schema if kind == "signals" else self.summary_schema
+
+    @staticmethod
+    def _parts(folder: Path) -> Iterator[Tuple[str, date, Path]]:
+        """Yield ``(brand_id, report_date, path)`` for the part files in ``folder``."""
+
+        for path in sorted(folder.glob("part-*.parquet")):
+            yield path.stem[16:], date.fromisoformat(path.stem[5:15]), path
+
+    @contextmanager
+    def _locked(self, folder: Path) -> Iterator[None]:
+        folder.mkdir(parents=True, exist_ok=True)
+        with self._lock, (folder / ".lock").open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _day_keys(table: "pa.Table") -> "pa.Array":
+        return pc.binary_join_element_wise(table["brand_id"], pc.cast(table["report_date"], pa.string()), "/")
+
+    @staticmethod
+    def _may_hold(path: Path, brand_id: str, report_date: date) -> bool:
+        """Whether any row group of ``path`` could hold rows for the brand's day, from footer statistics."""
+
+        metadata = pq.ParquetFile(path).metadata
+        for index in range(metadata.num_row_groups):
+            group = metadata.row_group(index)
+            brands, dates = group.column(0).statistics, group.column(1).statistics
+            if brands is None or dates is None or not (brands.has_min_max and dates.has_min_max):
+                return True
+            if brands.min <= brand_id <= brands.max and dates.min <= report_date <= dates.max:
+                return True
+        return False
+
+    def _upsert(self, kind: str, table: "pa.Table", brand_id: str, report_date: date) -> Path:
+        folder = self._folder(kind, report_date)
+        with self._locked(folder):
+            compacted = folder / _COMPACTED
+            # A rerun of an already compacted day must not leave its old rows behind.
+            if compacted.exists() and self._may_hold(compacted, brand_id, report_date):
+                existing = pq.read_table(compacted, schema=table.schema, partitioning=None)
+                stale = pc.equal(self._day_keys(existing), f"{brand_id}/{report_date.isoformat()}")
+                if pc.any(stale).as_py():
+                    self._write(compacted, existing.filter(pc.invert(stale)))
+            path = folder / f"part-{report_date.isoformat()}-{brand_id}.parquet"
+            self._write(path, table)
+        return path
+
+    def _write(self, path: Path, table: "pa.Table") -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Dot-prefixed, so dataset discovery skips temporaries that are still being written.
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            pq.write_table(
+                table,
+                tmp_path,
+                compression=self.compression,
+                row_group_size=self.row_group_size,
+                use_dictionary=["brand_id", "source", "impact"],
+            )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def write_signals(self, brand_id: str, report_date: date, signals: Iterable[BrandSignal]) -> Path:
+        brand_id = sanitize_brand_id(brand_id)
+        rows = list(signals)
+        table = pa.table(
+            {
+                "brand_id": [brand_id] * len(rows),
+                "report_date": [report_date] * len(rows),
+                **{name: [getattr(signal, name) for signal in rows] for name in self.signal_schema.names[2:]},
+            },
+            schema=self.signal_schema,
+        )
+        return self._upsert("signals", table, brand_id, report_date)
+
+    def write_summary(self, brand_id: str, report: BrandReport, message_id: str) -> Path:
+        brand_id = sanitize_brand_id(brand_id)
+        table = pa.table(
+            {
+                "brand_id": [brand_id],
+                "report_date": [report.report_date],
+                "message_id": [message_id],
+                "report": [report.model_dump_json()],
+            },
+            schema=self.summary_schema,
+        )
+        return self._upsert("summaries", table, brand_id, report.report_date)
+
+    def _dataset(self, kind: str, schema: "pa.Schema") -> "ds.Dataset | None":
+        folder = self.root / kind
+        if not folder.exists():
+            return None
+        partitioning = ds.partitioning(pa.schema([("period", pa.string())]), flavor="hive")
+        return ds.dataset(folder, schema=schema, format="parquet", partitioning=partitioning)
+
+    def _filter(self, query: SignalQuery, *, signal_columns: bool) -> "ds.Expression | None":
+        clauses = []
+        if query.brand_ids is not None:
+            clauses.append(ds.field("brand_id").isin(list(query.brand_ids)))
+        if query.start is not None:
+            clauses.append(ds.field("period") >= self._period(query.start))
+            clauses.append(ds.field("report_date") >= pa.scalar(query.start, pa.date32()))
+        if query.end is not None:
+            clauses.append(ds.field("period") <= self._period(query.end))
+            clauses.append(ds.field("report_date") <= pa.scalar(query.end, pa.date32()))
+        if signal_columns and query.sources is not None:
+            clauses.append(ds.field("source").isin(list(query.sources)))
+        if signal_columns and query.impacts is not None:
+            clauses.append(ds.field("impact").isin(list(query.impacts)))
+        if not clauses:
+            return None
+        expression = clauses[0]
+        for clause in clauses[1:]:
+            expression = expression & clause
+        return expression
+
+    def scan_signals(
+        self, query: SignalQuery = SignalQuery(), *, batch_size: int = 1024
+    ) -> Iterator[Tuple[ArchivedSignal, ...]]:
+        dataset = self._dataset("signals", self.signal_schema.append(pa.field("period", pa.string())))
+        if dataset is None:
+            return iter(())
+        scanner = dataset.scanner(
+            columns=self.signal_schema.names,
+            filter=self._filter(query, signal_columns=True),
+            batch_size=batch_size,
+        )
+
+        fields = self.signal_schema.names[2:]
+
+        def batches() -> Iterator[Tuple[ArchivedSignal, ...]]:
+            for record_batch in scanner.to_batches():
+                if record_batch.num_rows == 0:
+                    continue
+                columns: Dict[str, list] = record_batch.to_pydict()
+                # Files written before a column existed read back as nulls; the model defaults fill them.
+                yield tuple(
+                    ArchivedSignal(
+                        brand_id,
+                        report_date,
+                        BrandSignal(**{name: value for name, value in zip(fields, values) if value is not None}),
+                    )
+                    for brand_id, report_date, *values in zip(*(columns[name] for name in self.signal_schema.names))
+                )
+
+        return batches()
+
+    def read_summaries(self, query: SignalQuery = SignalQuery()) -> List[Tuple[BrandReport, str]]:
+        dataset = self._dataset("summaries", self.summary_schema.append(pa.field("period", pa.string())))
+        if dataset is None:
+            return []
+        table = dataset.to_table(
+            columns=["message_id", "report"], filter=self._filter(query, signal_columns=False)
+        )
+        return [
+            (BrandReport.model_validate_json(report), message_id)
+            for message_id, report in zip(table["message_id"].to_pylist(), table["report"].to_pylist())
+        ]
+
+    def _period_folders(self, kind: str) -> Iterator[Path]:
+        yield from sorted((self.root / kind).glob("period=*"))
+
+    def compact(self, before: date) -> int:
+        folded: Set[Tuple[str, date]] = set()
+        for kind in ("signals", "summaries"):
+            schema = self._schema(kind)
+            for folder in self._period_folders(kind):
+                with self._locked(folder):
+                    parts = [(brand_id, day, path) for brand_id, day, path in self._parts(folder) if day < before]
+                    if not parts:
+                        continue
+                    tables = [pq.read_table(path, schema=schema, partitioning=None) for _brand, _day, path in parts]
+                    compacted = folder / _COMPACTED
+                    if compacted.exists():
+                        existing = pq.read_table(compacted, schema=schema, partitioning=None)
+                        # Drops rows a part supersedes, including leftovers of an interrupted compaction.
+                        keys = pa.array([f"{brand_id}/{day.isoformat()}" for brand_id, day, _path in parts])
+                        tables.insert(0, existing.filter(pc.invert(pc.is_in(self._day_keys(existing), keys))))
+                    merged = pa.concat_tables(tables).sort_by([("brand_id", "ascending"), ("report_date", "ascending")])
+                    self._write(compacted, merged)
+                    for brand_id, day, path in parts:
+                        path.unlink()
+                        folded.add((brand_id, day))
+        return len(folded)
+
+    def prune(self, before: date) -> int:
+        removed: Set[Tuple[str, date]] = set()
+        cutoff = pa.scalar(before, pa.date32())
+        for kind in ("signals", "summaries"):
+            for folder in self._period_folders(kind):
+                if folder.name.split("=", 1)[1] > self._period(before):
+                    continue
+                with self._locked(folder):
+                    for brand_id, day, path in self._parts(folder):
+                        if day < before:
+                            path.unlink()
+                            removed.add((brand_id, day))
+                    compacted = folder / _COMPACTED
+                    if not compacted.exists():
+                        continue
+                    table = pq.read_table(compacted, columns=["brand_id", "report_date"], partitioning=None)
+                    expired = pc.less(table["report_date"], cutoff)
+                    old = table.filter(expired)
+                    removed.update(zip(old["brand_id"].to_pylist(), old["report_date"].to_pylist()))
+                    if old.num_rows == table.num_rows:
+                        compacted.unlink()
+                    elif old.num_rows:
+                        kept = pq.read_table(compacted, schema=self._schema(kind), partitioning=None)
+                        self._write(compacted, kept.filter(pc.invert(expired)))
+        return len(removed)
+
+
+ARCHIVES = {"json": JsonSignalArchive, "parquet": ParquetSignalArchive}
+
+_archives: Dict[Tuple[str, Path], SignalArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_signal_archive(name: str | None = None, root: Path | None = None) -> SignalArchive:
+    """Return the shared archive for ``name``; ``auto`` prefers Parquet when pyarrow is installed.
+
+    The default comes from ``BRANDOS_ARCHIVE_FORMAT``.
+    """
+
+    name = name or ARCHIVE_FORMAT
+    if name == "auto":
+        name = "parquet" if pa is not None else "json"
+    if name not in ARCHIVES:
+        raise ValueError(f"Unknown signal archive: {name}")
+    key = (name, Path(root or DATA_ROOT))
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = _archives[key] = ARCHIVES[name](key[1])
+        return archive
+
+
+__all__ = [
+    "ArchivedSignal",
+    "JsonSignalArchive",
+    "ParquetSignalArchive",
+    "SignalArchive",
+    "SignalQuery",
+    "get_signal_archive",
+]
@@ -0,0 +1,175 @@
+"""Multi-brand batch execution with per-brand isolation and a run manifest."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Callable, Sequence, Tuple
+
+from coding_agent.brand.config import get_compiled_profile
+from coding_agent.brand.fileio import write_json
+from coding_agent.brand.models import BrandReport, BrandSignal, SignalBatch
+from coding_agent.brand.relevance import apply_relevance_filter
+from coding_agent.brand.summarizer import StreamingSummarizer
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class BrandRunRecord:
+    """Outcome of one brand within a batch run."""
+
+    brand_id: str
+    status: str
+    started_at: str
+    elapsed: float
+    message_id: str | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchManifest:
+    """Summary of a batch run, written to disk for operators and schedulers."""
+
+    run_id: str
+    started_at: str
+    finished_at: str
+    elapsed: float
+    records: Tuple[BrandRunRecord, ...]
+
+    @property
+    def succeeded(self) -> Tuple[str, ...]:
+        return tuple(record.brand_id for record in self.records if record.status == STATUS_OK)
+
+    @property
+    def failed(self) -> Tuple[str, ...]:
+        return tuple(record.brand_id for record in self.records if record.status == STATUS_FAILED)
+
+    def to_dict(self) -> dict:
+        payload = asdict(self)
+        payload["succeeded"] = len(self.succeeded)
+        payload["failed"] = len(self.failed)
+        return payload
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _run_one(brand_id: str, run_brand: Callable[[str], str]) -> BrandRunRecord:
+    started_at = _utc_now().isoformat()
+    started = time.perf_counter()
+    try:
+        message_id = run_brand(brand_id)
+    except Exception as error:
+        logger.exception("Brand %s failed", brand_id)
+        return BrandRunRecord(
+            brand_id=brand_id,
+            status=STATUS_FAILED,
+            started_at=started_at,
+            elapsed=round(time.perf_counter() - started, 3),
+            error=f"{type(error).__name__}: {error}",
+        )
+    return BrandRunRecord(
+        brand_id=brand_id,
+        status=STATUS_OK,
+        started_at=started_at,
+        elapsed=round(time.perf_counter() - started, 3),
+        message_id=message_id,
+    )
+
+
+def run_brand_batch(
+    brand_ids: Sequence[str],
+    run_brand: Callable[[str], str],
+    *,
+    executor: Executor | None = None,
+    max_workers: int = 8,
+) -> BatchManifest:
+    """Run ``run_brand`` for every brand on a shared thread pool.
+
+    A failure in one brand is recorded in the manifest and never aborts the
+    others. Records keep the order of ``brand_ids``.
+    """
+
+    started_dt = _utc_now()
+    started = time.perf_counter()
+    unique_ids = list(dict.fromkeys(brand_ids))
+
+    owned_executor = None
+    if executor is None:
+        owned_executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(unique_ids) or 1)),
+            thread_name_prefix="brand-batch",
+        )
+        executor = owned_executor
+    try:
+        futures = [executor.submit(_run_one, brand_id, run_brand) for brand_id in unique_ids]
+        records = tuple(future.result() for future in futures)
+    finally:
+        if owned_executor is not None:
+            owned_executor.shutdown(wait=True)
+
+    return BatchManifest(
+        run_id=started_dt.strftime("%Y%m%dT%H%M%S%fZ"),
+        started_at=started_dt.isoformat(),
+        finished_at=_utc_now().isoformat(),
+        elapsed=round(time.perf_counter() - started, 3),
+        records=records,
+    )
+
+
+def write_run_manifest(manifest: BatchManifest, root: Path) -> Path:
+    return write_json(root / ".runs" / f"{manifest.run_id}.json", manifest.to_dict(), pretty=True)
+
+
+def cpu_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """Bounded process pool for CPU-heavy stages.
+
+    Workers are spawned rather than forked because the batch also runs I/O
+    threads, and forking a multi-threaded process can deadlock.
+    """
+
+    workers = max_workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+# Module-level jobs so they can be pickled into the process pool.
+
+
+def filter_signals_job(
+    brand_id: str, signals: Tuple[BrandSignal, ...] | SignalBatch
+) -> Tuple[Tuple[BrandSignal, ...], Tuple[Tuple[str, str], ...]]:
+    """Relevance-filter ``signals``; rejections come back as (headline, reason) pairs.
+
+    Pass a ``SignalBatch`` to a process pool: its columns pickle far smaller
+    and faster than one model per signal.
+    """
+
+    filtered, rejected = apply_relevance_filter(signals, get_compiled_profile(brand_id))
+    return filtered, tuple((entry.signal.headline, entry.reason) for entry in rejected)
+
+
+def summarize_job(brand_id: str, report_date: date, signals: Tuple[BrandSignal, ...]) -> BrandReport:
+    summarizer = StreamingSummarizer(scoring=get_compiled_profile(brand_id).scoring)
+    return summarizer.summarize(brand_id, report_date, signals)
+
+
+__all__ = [
+    "BatchManifest",
+    "BrandRunRecord",
+    "cpu_pool",
+    "filter_signals_job",
+    "run_brand_batch",
+    "summarize_job",
+    "write_run_manifest",
+]
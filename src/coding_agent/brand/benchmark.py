@@ -0,0 +1,158 @@
+"""Per-signal cost of validated versus trusted model handling.
+
+Usage::
+
+    python -m coding_agent.brand.benchmark [--signals N] [--repeat N]
+
+Each row times one internal step over ``--signals`` synthetic signals, both
+through pydantic (validating constructor, ``model_copy``, ``model_dump``)
+and through the trusted factories on ``BrandSignal``. The last rows time
+the relevance filter, the near-duplicate signature and the summarizer as
+they run today, for reference. ``--min-rate`` turns the summarizer row into
+a throughput check: the command exits with status 1 when fewer signals per
+second are summarized.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date
+from typing import Callable, List, Sequence, Tuple
+
+from coding_agent.brand.config import BrandProfile, compile_profile
+from coding_agent.brand.models import IMPACT_LEVELS, BrandSignal
+from coding_agent.brand.neardup import MinHashLSH
+from coding_agent.brand.relevance import apply_relevance_filter
+from coding_agent.brand.summarizer import HeuristicSummarizer
+
+_PROFILE = BrandProfile(
+    brand_id="acme",
+    company_summary="Acme builds rockets.",
+    keywords=["acme", "rocket"],
+    competitors=["globex"],
+    stop_phrases=["looney"],
+)
+
+
+_WORDS = (
+    "launch recall merger award lawsuit hires opens closes expands partners sponsors unveils delays "
+    "acquires invests cuts raises wins loses tests ships pauses reviews"
+).split()
+
+
+def _phrase(index: int, length: int = 5) -> str:
+    words = []
+    for _ in range(length):
+        index, digit = divmod(index * 7919 + 104729, len(_WORDS))
+        words.append(_WORDS[digit])
+    return " ".join(words)
+
+
+def synthetic_fields(count: int) -> List[dict]:
+    """Field dicts for ``count`` distinct, relevant signals."""
+
+    return [
+        {
+            "source": f"outlet-{index % 40}",
+            "headline": f"Acme {_phrase(index)} {index:x}",
+            "impact": IMPACT_LEVELS[index % len(IMPACT_LEVELS)],
+            "url": f"https://news.example.com/acme/{index}",
+            "summary": f"Globex responds to Acme item {index}.",
+            "first_seen": date(2025, 1, 1 + index % 28),
+            "cluster_size": 1,
+            "keyword_hits": index % 3,
+        }
+        for index in range(count)
+    ]
+
+
+def _best_of(repeat: int, action: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(signals: int = 10_000, repeat: int = 5) -> List[Tuple[str, float, float | None]]:
+    """Rows of (step, validated µs per signal, trusted µs per signal)."""
+
+    fields = synthetic_fields(signals)
+    models = [BrandSignal(**entry) for entry in fields]
+    per_signal = 1e6 / signals
+    pairs = [
+        (
+            "construct",
+            lambda: [BrandSignal(**entry) for entry in fields],
+            lambda: [BrandSignal.trusted(**entry) for entry in fields],
+        ),
+        (
+            "copy with update",
+            lambda: [signal.model_copy(update={"cluster_size": 2}) for signal in models],
+            lambda: [signal.trusted_copy(cluster_size=2) for signal in models],
+        ),
+        (
+            "serialize",
+            lambda: [signal.model_dump(mode="json") for signal in models],
+            lambda: [signal.to_record() for signal in models],
+        ),
+    ]
+    rows: List[Tuple[str, float, float | None]] = [
+        (name, _best_of(repeat, validated) * per_signal, _best_of(repeat, trusted) * per_signal)
+        for name, validated, trusted in pairs
+    ]
+
+    compiled = compile_profile(_PROFILE)
+    accepted, _rejected = apply_relevance_filter(models, compiled)
+    summarizer = HeuristicSummarizer()
+    lsh = MinHashLSH()
+    rows.append(("relevance filter", _best_of(repeat, lambda: apply_relevance_filter(models, compiled)) * per_signal, None))
+    rows.append(
+        ("near-dup signature", _best_of(repeat, lambda: [lsh.signature(signal.headline) for signal in models]) * per_signal, None)
+    )
+    rows.append(
+        (
+            "summarize",
+            _best_of(max(1, repeat // 2), lambda: summarizer.summarize("acme", date(2025, 1, 31), accepted))
+            * per_signal,
+            None,
+        )
+    )
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time validated versus trusted BrandSignal handling")
+    parser.add_argument("--signals", type=int, default=10_000, help="Synthetic signals per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per step; the fastest is reported")
+    parser.add_argument(
+        "--min-rate", type=float, default=None, help="Fail unless at least this many signals per second are summarized"
+    )
+    args = parser.parse_args(argv)
+    if args.signals < 1 or args.repeat < 1:
+        print("--signals and --repeat must be positive", file=sys.stderr)
+        return 2
+
+    rows = run_benchmark(args.signals, args.repeat)
+    print(f"{'step':<20} {'validated µs':>13} {'trusted µs':>11} {'speedup':>8}")
+    for name, validated, trusted in rows:
+        if trusted is None:
+            print(f"{name:<20} {validated:>13.2f} {'':>11} {'':>8}")
+        else:
+            print(f"{name:<20} {validated:>13.2f} {trusted:>11.2f} {validated / trusted:>7.1f}x")
+    rate = 1e6 / dict((name, validated) for name, validated, _trusted in rows)["summarize"]
+    print(f"summarize throughput: {rate:,.0f} signals/s")
+    if args.min_rate is not None and rate < args.min_rate:
+        print(f"summarize throughput is below --min-rate {args.min_rate:,.0f}", file=sys.stderr)
+        return 1
+    return 0
+
+
+__all__ = ["main", "run_benchmark", "synthetic_fields"]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from functools import lru_cache
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Tuple
 
 import yaml
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
+from coding_agent.brand.matcher import TermMatcher
+from coding_agent.brand.scoring import ScoringPolicy, build_scoring_policy
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
 CONFIG_PATH = PROJECT_ROOT / "config" / "brand_profiles.yaml"
 
+STOP = "stop"
+KEYWORD = "keyword"
+COMPETITOR = "competitor"
+
 
 @dataclass(frozen=True)
 class BrandProfile:
@@ -20,6 +34,7 @@ class BrandProfile:
     keywords: List[str] = field(default_factory=list)
     competitors: List[str] = field(default_factory=list)
     stop_phrases: List[str] = field(default_factory=list)
+    scoring: Dict[str, Any] = field(default_factory=dict)
 
     def keyword_set(self) -> set[str]:
         return {kw.lower() for kw in self.keywords if kw}
@@ -31,33 +46,316 @@ class BrandProfile:
         return {kw.lower() for kw in self.stop_phrases if kw}
 
 
-@lru_cache(maxsize=1)
-def _raw_profiles(path: Path | None = None) -> Dict[str, dict]:
-    config_path = path or CONFIG_PATH
-    if not config_path.exists():
-        return {}
-    with config_path.open("r", encoding="utf-8") as handle:
-        loaded = yaml.safe_load(handle) or {}
-    return loaded
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
-def get_brand_profile(brand_id: str, *, path: Path | None = None) -> BrandProfile:
-    brand_id_normalized = brand_id.lower()
-    raw = _raw_profiles(path).get(brand_id_normalized)
-    if raw is None:
+@dataclass(frozen=True)
+class _ProfilesSnapshot:
+    version: int
+    signature: Tuple[int, int]
+    file_hash: str
+    raw: Mapping[str, dict]
+    brand_hashes: Mapping[str, str]
+    brand_versions: Mapping[str, int]
+
+
+def _entry_hash(entry: object) -> str:
+    return hashlib.sha256(json.dumps(entry, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return (0, -1)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class ProfileStore:
+    """Hot-reloading view of the brand profile YAML file.
+
+    Each access stats the file (at most once per ``check_interval`` seconds).
+    When the mtime or size moved and the content hash really changed, the file
+    is re-parsed (with libyaml's ``CSafeLoader`` when available) and a complete
+    new snapshot is swapped in at once, so readers never observe a half-loaded
+    config. Unchanged brands keep their previous entry and per-brand version;
+    ``version`` increases on every content change so dependent caches can key
+    on it. A file that fails to parse leaves the last good snapshot in place.
+    """
+
+    def __init__(self, path: Path | None = None, *, check_interval: float = 0.0) -> None:
+        self.path = path or CONFIG_PATH
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._snapshot = _ProfilesSnapshot(
+            version=0,
+            signature=(0, -2),
+            file_hash="",
+            raw=MappingProxyType({}),
+            brand_hashes=MappingProxyType({}),
+            brand_versions=MappingProxyType({}),
+        )
+        self.refresh(force=True)
+
+    @property
+    def version(self) -> int:
+        return self._current().version
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Reload the file if it changed; returns True when a new version was published."""
+
+        with self._lock:
+            self._checked_at = time.monotonic()
+            current = self._snapshot
+            signature = _file_signature(self.path)
+            if signature == current.signature and not force:
+                return False
+            try:
+                content = self.path.read_bytes() if signature[1] >= 0 else b""
+            except FileNotFoundError:
+                content = b""
+            file_hash = hashlib.sha256(content).hexdigest()
+            if file_hash == current.file_hash:
+                self._snapshot = replace(current, signature=signature)
+                return False
+            try:
+                loaded = (yaml.load(content, Loader=_YAML_LOADER) or {}) if content else {}
+            except yaml.YAMLError as error:
+                logger.warning("Keeping previous brand profiles; %s failed to parse: %s", self.path, error)
+                self._snapshot = replace(current, signature=signature)
+                return False
+            if not isinstance(loaded, dict):
+                logger.warning("Keeping previous brand profiles; %s is not a mapping", self.path)
+                self._snapshot = replace(current, signature=signature)
+                return False
+
+            version = current.version + 1
+            raw: Dict[str, dict] = {}
+            brand_hashes: Dict[str, str] = {}
+            brand_versions: Dict[str, int] = {}
+            changed = []
+            for brand_id, entry in loaded.items():
+                key = str(brand_id).lower()
+                entry_hash = _entry_hash(entry)
+                if current.brand_hashes.get(key) == entry_hash:
+                    raw[key] = current.raw[key]
+                    brand_versions[key] = current.brand_versions[key]
+                else:
+                    raw[key] = entry or {}
+                    brand_versions[key] = version
+                    changed.append(key)
+                brand_hashes[key] = entry_hash
+            removed = set(current.raw) - set(raw)
+            if changed or removed:
+                logger.info(
+                    "Loaded brand profiles v%d from %s (changed: %s; removed: %s)",
+                    version,
+                    self.path,
+                    ", ".join(changed) or "none",
+                    ", ".join(sorted(removed)) or "none",
+                )
+            self._snapshot = _ProfilesSnapshot(
+                version=version,
+                signature=signature,
+                file_hash=file_hash,
+                raw=MappingProxyType(raw),
+                brand_hashes=MappingProxyType(brand_hashes),
+                brand_versions=MappingProxyType(brand_versions),
+            )
+            return True
+
+    def _current(self) -> _ProfilesSnapshot:
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self.refresh()
+        return self._snapshot
+
+    def raw(self, brand_id: str) -> dict | None:
+        return self._current().raw.get(brand_id.lower())
+
+    def brand_version(self, brand_id: str) -> int:
+        """Version at which ``brand_id`` last changed (0 when it is not configured)."""
+
+        return self._current().brand_versions.get(brand_id.lower(), 0)
+
+    def brand_ids(self) -> Tuple[str, ...]:
+        return tuple(self._current().raw)
+
+    def profile(self, brand_id: str) -> BrandProfile:
+        brand_id_normalized = brand_id.lower()
+        raw = self.raw(brand_id_normalized)
+        if raw is None:
+            return BrandProfile(
+                brand_id=brand_id_normalized,
+                company_summary=f"Monitoring updates for {brand_id_normalized}.",
+                keywords=[brand_id_normalized.replace("_", " ")],
+            )
+
         return BrandProfile(
             brand_id=brand_id_normalized,
-            company_summary=f"Monitoring updates for {brand_id_normalized}.",
-            keywords=[brand_id_normalized.replace("_", " ")],
+            company_summary=raw.get("company_summary", f"Monitoring updates for {brand_id_normalized}."),
+            keywords=list(raw.get("keywords", []) or []),
+            competitors=list(raw.get("competitors", []) or []),
+            stop_phrases=list(raw.get("stop_phrases", []) or []),
+            scoring=dict(raw.get("scoring", {}) or {}),
         )
 
-    return BrandProfile(
-        brand_id=brand_id_normalized,
-        company_summary=raw.get("company_summary", f"Monitoring updates for {brand_id_normalized}."),
-        keywords=raw.get("keywords", []) or [],
-        competitors=raw.get("competitors", []) or [],
-        stop_phrases=raw.get("stop_phrases", []) or [],
+
+_stores: Dict[Path, ProfileStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_profile_store(path: Path | None = None) -> ProfileStore:
+    config_path = path or CONFIG_PATH
+    with _stores_lock:
+        store = _stores.get(config_path)
+        if store is None:
+            store = _stores[config_path] = ProfileStore(config_path)
+        return store
+
+
+def get_brand_profile(brand_id: str, *, path: Path | None = None) -> BrandProfile:
+    return get_profile_store(path).profile(brand_id)
+
+
+def list_brand_ids(*, path: Path | None = None) -> Tuple[str, ...]:
+    return get_profile_store(path).brand_ids()
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """Immutable, ready-to-match view of a ``BrandProfile``.
+
+    Built once per profile content and shared by the relevance filter and any
+    other per-signal consumer instead of re-deriving term sets for every batch.
+    """
+
+    profile: BrandProfile
+    keywords: FrozenSet[str]
+    competitors: FrozenSet[str]
+    stop_phrases: FrozenSet[str]
+    matcher: TermMatcher
+    boundary_matcher: TermMatcher
+    content_hash: str
+    scoring: ScoringPolicy = field(default_factory=ScoringPolicy)
+
+    @property
+    def brand_id(self) -> str:
+        return self.profile.brand_id
+
+    def matcher_for(self, word_boundary: bool = False) -> TermMatcher:
+        return self.boundary_matcher if word_boundary else self.matcher
+
+
+def _profile_hash(profile: BrandProfile) -> str:
+    payload = json.dumps(
+        [
+            profile.brand_id,
+            profile.company_summary,
+            profile.keywords,
+            profile.competitors,
+            profile.stop_phrases,
+            profile.scoring,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_compiled_by_hash: Dict[str, CompiledProfile] = {}
+_compiled_lock = threading.Lock()
+_COMPILED_CACHE_SIZE = 512
+
+
+def compile_profile(profile: BrandProfile) -> CompiledProfile:
+    """Compile ``profile``, reusing an earlier compilation with identical content."""
+
+    content_hash = _profile_hash(profile)
+    with _compiled_lock:
+        cached = _compiled_by_hash.get(content_hash)
+    if cached is not None:
+        return cached
+
+    stop_phrases = frozenset(profile.stop_phrase_set())
+    keywords = frozenset(profile.keyword_set())
+    competitors = frozenset(profile.competitor_set())
+    categories = {STOP: stop_phrases, KEYWORD: keywords, COMPETITOR: competitors}
+    try:
+        scoring = build_scoring_policy(profile.scoring)
+    except (TypeError, ValueError) as error:
+        logger.warning("Using default scoring for %s; invalid scoring config: %s", profile.brand_id, error)
+        scoring = ScoringPolicy()
+    compiled = CompiledProfile(
+        profile=profile,
+        keywords=keywords,
+        competitors=competitors,
+        stop_phrases=stop_phrases,
+        matcher=TermMatcher(categories),
+        boundary_matcher=TermMatcher(categories, word_boundary=True),
+        content_hash=content_hash,
+        scoring=scoring,
     )
+    with _compiled_lock:
+        if len(_compiled_by_hash) >= _COMPILED_CACHE_SIZE:
+            _compiled_by_hash.pop(next(iter(_compiled_by_hash)))
+        return _compiled_by_hash.setdefault(content_hash, compiled)
+
+
+class ProfileRegistry:
+    """Caches compiled profiles keyed by brand and profile store version.
+
+    Only brands whose entry changed in the config are recompiled after a reload.
+    """
+
+    def __init__(self, path: Path | None = None, *, store: ProfileStore | None = None) -> None:
+        self.store = store or get_profile_store(path)
+        self._compiled: Dict[str, Tuple[int, CompiledProfile]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.store.path
+
+    def get(self, brand_id: str) -> CompiledProfile:
+        brand_key = brand_id.lower()
+        version = self.store.brand_version(brand_key)
+        with self._lock:
+            cached = self._compiled.get(brand_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        compiled = compile_profile(self.store.profile(brand_key))
+        with self._lock:
+            self._compiled[brand_key] = (version, compiled)
+        return compiled
+
+
+_registries: Dict[Path, ProfileRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_profile_registry(path: Path | None = None) -> ProfileRegistry:
+    config_path = path or CONFIG_PATH
+    with _registries_lock:
+        registry = _registries.get(config_path)
+        if registry is None:
+            registry = _registries[config_path] = ProfileRegistry(config_path)
+        return registry
+
+
+def get_compiled_profile(brand_id: str, *, path: Path | None = None) -> CompiledProfile:
+    return get_profile_registry(path).get(brand_id)
 
 
-__all__ = ["BrandProfile", "get_brand_profile"]
+__all__ = [
+    "BrandProfile",
+    "CompiledProfile",
+    "ProfileRegistry",
+    "ProfileStore",
+    "compile_profile",
+    "get_brand_profile",
+    "get_compiled_profile",
+    "get_profile_registry",
+    "get_profile_store",
+    "list_brand_ids",
+]
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import os
+import threading
 from dataclasses import dataclass, field
 from typing import List
 
-import requests
-
 from coding_agent.brand.pipeline import BrandTask
+from coding_agent.brand.transport import HttpTransport, default_transport
 
 
 class EmailSender:
@@ -23,17 +23,19 @@ class InMemoryEmailSender(EmailSender):
     """Collects emails in memory (useful for tests)."""
 
     sent_messages: List[dict] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def send(self, task: BrandTask, subject: str, body: str) -> str:
-        message_id = f"mem-{len(self.sent_messages) + 1}"
-        self.sent_messages.append(
-            {
-                "task": task,
-                "subject": subject,
-                "body": body,
-                "message_id": message_id,
-            }
-        )
+        with self._lock:
+            message_id = f"mem-{len(self.sent_messages) + 1}"
+            self.sent_messages.append(
+                {
+                    "task": task,
+                    "subject": subject,
+                    "body": body,
+                    "message_id": message_id,
+                }
+            )
         return message_id
 
 
@@ -43,6 +45,7 @@ class ResendEmailSender(EmailSender):
 
     api_key: str
     sender: str
+    transport: HttpTransport | None = field(default=None, repr=False)
 
     def send(self, task: BrandTask, subject: str, body: str) -> str:
         url = "https://api.resend.com/emails"
@@ -56,17 +59,21 @@ class ResendEmailSender(EmailSender):
             "subject": subject,
             "text": body,
         }
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        transport = self.transport or default_transport()
+        response = transport.post(url, json=payload, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         return data.get("id", "")
 
 
-def build_resend_from_env(sender: str | None = None) -> ResendEmailSender:
+def build_resend_from_env(
+    sender: str | None = None,
+    transport: HttpTransport | None = None,
+) -> ResendEmailSender:
     api_key = os.environ.get("RESEND_API_KEY")
     if not api_key:
         raise RuntimeError("RESEND_API_KEY environment variable not set")
     from_address = sender or os.environ.get("RESEND_FROM_ADDRESS")
     if not from_address:
         raise RuntimeError("Resend sender address not provided")
-    return ResendEmailSender(api_key=api_key, sender=from_address)
+    return ResendEmailSender(api_key=api_key, sender=from_address, transport=transport)
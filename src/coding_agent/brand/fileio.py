@@ -0,0 +1,175 @@
+"""Atomic artifact writes with directory creation and fsyncs batched per run."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+try:  # optional fast encoder
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def dumps_json(payload: Any, *, pretty: bool = False) -> bytes:
+    """Encode ``payload`` as UTF-8 JSON, compact unless ``pretty`` is set.
+
+    Uses ``orjson`` when it is installed and the standard library otherwise.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class AtomicWriteBatch:
+    """Stages file contents and publishes them together on :meth:`commit`.
+
+    Every file is written to a temporary sibling and renamed over its target,
+    so readers only ever see the old or the complete new content. Directories
+    are created once per distinct parent. With ``durable`` set, every
+    temporary is written first and only then fsynced, so the kernel can flush
+    them together, and each parent directory is fsynced once after the
+    renames. Writing the same path twice keeps the last content.
+    """
+
+    def __init__(self, *, durable: bool = True) -> None:
+        self.durable = durable
+        self._staged: Dict[Path, bytes] = {}
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._staged)
+
+    def write_bytes(self, path: Path, data: bytes) -> Path:
+        path = Path(path)
+        with self._lock:
+            self._staged[path] = data
+        return path
+
+    def write_json(self, path: Path, payload: Any, *, pretty: bool = False) -> Path:
+        return self.write_bytes(path, dumps_json(payload, pretty=pretty))
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the staged files have been published."""
+
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def discard(self) -> None:
+        with self._lock:
+            self._staged.clear()
+            self._callbacks.clear()
+
+    def commit(self) -> List[Path]:
+        """Publish everything staged; returns the written paths.
+
+        On failure no staged file is left behind under a temporary name, and
+        targets that were not yet renamed keep their previous content.
+        """
+
+        with self._lock:
+            staged, self._staged = self._staged, {}
+            callbacks, self._callbacks = self._callbacks, []
+        if not staged:
+            for callback in callbacks:
+                callback()
+            return []
+
+        folders = sorted({path.parent for path in staged})
+        for folder in folders:
+            folder.mkdir(parents=True, exist_ok=True)
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        temporaries = {path: path.with_name(f".{path.name}{suffix}") for path in staged}
+        try:
+            for path, data in staged.items():
+                temporaries[path].write_bytes(data)
+            if self.durable:
+                for tmp_path in temporaries.values():
+                    _fsync_path(tmp_path)
+            for path, tmp_path in temporaries.items():
+                os.replace(tmp_path, path)
+        finally:
+            for tmp_path in temporaries.values():
+                tmp_path.unlink(missing_ok=True)
+        if self.durable:
+            for folder in folders:
+                _fsync_path(folder)
+        for callback in callbacks:
+            callback()
+        return list(staged)
+
+
+_active = threading.local()
+
+
+def current_batch() -> AtomicWriteBatch | None:
+    """The batch opened by :func:`write_batch` on this thread, if any."""
+
+    return getattr(_active, "batch", None)
+
+
+@contextmanager
+def write_batch(*, durable: bool = True) -> Iterator[AtomicWriteBatch]:
+    """Route this thread's :func:`write_json` calls into one batch.
+
+    The batch is committed when the block exits normally and discarded when it
+    raises. A nested block joins the outer batch.
+    """
+
+    outer = current_batch()
+    if outer is not None:
+        yield outer
+        return
+    batch = _active.batch = AtomicWriteBatch(durable=durable)
+    try:
+        yield batch
+    except BaseException:
+        batch.discard()
+        raise
+    else:
+        batch.commit()
+    finally:
+        _active.batch = None
+
+
+def write_json(path: Path, payload: Any, *, pretty: bool = False) -> Path:
+    """Write ``payload`` to ``path`` atomically.
+
+    Inside :func:`write_batch` the file is staged and published with the rest
+    of the batch; otherwise it is written and made durable immediately.
+    """
+
+    batch = current_batch()
+    if batch is not None:
+        return batch.write_json(path, payload, pretty=pretty)
+    single = AtomicWriteBatch()
+    single.write_json(path, payload, pretty=pretty)
+    single.commit()
+    return Path(path)
+
+
+__all__ = [
+    "AtomicWriteBatch",
+    "current_batch",
+    "dumps_json",
+    "write_batch",
+    "write_json",
+]
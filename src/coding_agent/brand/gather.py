@@ -0,0 +1,173 @@
+"""Concurrent fan-out gathering across multiple signal providers."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.sources import SignalsProvider
+
+logger = logging.getLogger(__name__)
+
+STATUS_OK = "ok"
+STATUS_TIMEOUT = "timeout"
+STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ProviderOutcome:
+    """Result of running a single provider during a gather."""
+
+    name: str
+    status: str
+    signal_count: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class GatherResult:
+    """Merged signals plus a per-provider status report."""
+
+    signals: Tuple[BrandSignal, ...]
+    outcomes: Tuple[ProviderOutcome, ...]
+
+    def _names(self, status: str) -> Tuple[str, ...]:
+        return tuple(outcome.name for outcome in self.outcomes if outcome.status == status)
+
+    @property
+    def finished(self) -> Tuple[str, ...]:
+        return self._names(STATUS_OK)
+
+    @property
+    def timed_out(self) -> Tuple[str, ...]:
+        return self._names(STATUS_TIMEOUT)
+
+    @property
+    def failed(self) -> Tuple[str, ...]:
+        return self._names(STATUS_FAILED)
+
+
+def _provider_names(providers: Sequence[SignalsProvider]) -> List[str]:
+    names: List[str] = []
+    counts: Dict[str, int] = {}
+    for provider in providers:
+        base = type(provider).__name__
+        counts[base] = counts.get(base, 0) + 1
+        names.append(base if counts[base] == 1 else f"{base}#{counts[base]}")
+    return names
+
+
+def _load_all(
+    provider: SignalsProvider, brand_id: str
+) -> Tuple[Tuple[BrandSignal, ...], float, Exception | None]:
+    started = time.perf_counter()
+    try:
+        # Providers may return lazy generators; drain them on the worker thread.
+        signals = tuple(provider.load(brand_id))
+    except Exception as error:
+        return (), time.perf_counter() - started, error
+    return signals, time.perf_counter() - started, None
+
+
+@dataclass
+class ConcurrentSignalsGatherer:
+    """Runs every provider at once and merges whatever arrives before the deadline.
+
+    Signals are collected as each provider completes and returned in provider
+    order, so earlier providers keep priority in the merged output. Providers
+    still running when ``deadline`` seconds elapse are reported as timed out and
+    their results discarded.
+    """
+
+    providers: Sequence[SignalsProvider]
+    deadline: float = 10.0
+    max_workers: int | None = None
+    executor: Executor | None = None
+
+    def gather(self, brand_id: str) -> GatherResult:
+        names = _provider_names(self.providers)
+        if not self.providers:
+            return GatherResult(signals=(), outcomes=())
+
+        owned_executor = None
+        executor = self.executor
+        if executor is None:
+            owned_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers or len(self.providers),
+                thread_name_prefix="brand-gather",
+            )
+            executor = owned_executor
+
+        started = time.perf_counter()
+        pending: Dict[Future, int] = {
+            executor.submit(_load_all, provider, brand_id): index
+            for index, provider in enumerate(self.providers)
+        }
+        collected: Dict[int, Tuple[BrandSignal, ...]] = {}
+        outcomes: Dict[int, ProviderOutcome] = {}
+
+        try:
+            while pending:
+                remaining = self.deadline - (time.perf_counter() - started)
+                if remaining <= 0:
+                    break
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    signals, elapsed, error = future.result()
+                    if error is not None:
+                        logger.warning("Provider %s failed for %s: %s", names[index], brand_id, error)
+                        outcomes[index] = ProviderOutcome(
+                            name=names[index],
+                            status=STATUS_FAILED,
+                            elapsed=elapsed,
+                            error=str(error),
+                        )
+                        continue
+                    collected[index] = signals
+                    outcomes[index] = ProviderOutcome(
+                        name=names[index],
+                        status=STATUS_OK,
+                        signal_count=len(signals),
+                        elapsed=elapsed,
+                    )
+
+            for future, index in pending.items():
+                future.cancel()
+                logger.warning(
+                    "Provider %s timed out for %s after %.1fs", names[index], brand_id, self.deadline
+                )
+                outcomes[index] = ProviderOutcome(
+                    name=names[index],
+                    status=STATUS_TIMEOUT,
+                    elapsed=self.deadline,
+                    error=f"exceeded {self.deadline}s deadline",
+                )
+        finally:
+            if owned_executor is not None:
+                # Do not block on stragglers; their results are already discarded.
+                owned_executor.shutdown(wait=False, cancel_futures=True)
+
+        merged: List[BrandSignal] = []
+        for index in sorted(collected):
+            merged.extend(collected[index])
+
+        return GatherResult(
+            signals=tuple(merged),
+            outcomes=tuple(outcomes[index] for index in range(len(self.providers))),
+        )
+
+    def load(self, brand_id: str) -> Iterable[BrandSignal]:
+        return self.gather(brand_id).signals
+
+
+__all__ = [
+    "ConcurrentSignalsGatherer",
+    "GatherResult",
+    "ProviderOutcome",
+]
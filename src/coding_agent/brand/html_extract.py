@@ -0,0 +1,246 @@
+"""Pluggable HTML extraction backends for ``WebPageSignalsProvider``."""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Iterable, List, Protocol, Tuple
+
+from bs4 import BeautifulSoup
+
+try:  # optional C-accelerated parser
+    import lxml.html as lxml_html
+except ImportError:  # pragma: no cover - exercised when lxml is absent
+    lxml_html = None
+
+HEADING_TAGS = ("h1", "h2", "h3")
+_CHARSET_PATTERN = re.compile(rb"""charset=["']?([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PageExtract:
+    """Title, meta description and leading headings pulled from a page.
+
+    Each heading carries the text of the first ``<p>`` that follows it in
+    document order (``None`` when there is none), mirroring BeautifulSoup's
+    ``find_next("p")``.
+    """
+
+    title: str = ""
+    description: str = ""
+    headings: Tuple[Tuple[str, str | None], ...] = ()
+
+
+class HtmlExtractor(Protocol):
+    """Turns a (possibly partial) stream of HTML bytes into a ``PageExtract``."""
+
+    def extract(self, chunks: Iterable[bytes], max_headings: int) -> PageExtract: ...
+
+
+def _joined_text(pieces: Iterable[str]) -> str:
+    # Equivalent to BeautifulSoup's get_text(strip=True).
+    return "".join(piece.strip() for piece in pieces)
+
+
+def _sniff_encoding(head: bytes) -> str:
+    match = _CHARSET_PATTERN.search(head[:2048])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+class _StopParsing(Exception):
+    pass
+
+
+class _HeadlineTokenizer(HTMLParser):
+    def __init__(self, max_headings: int):
+        super().__init__(convert_charrefs=True)
+        self.max_headings = max_headings
+        self.title: str | None = None
+        self.description: str | None = None
+        self.head_closed = False
+        self.headings: List[List[str]] = []
+        self.paragraphs: List[str | None] = []
+        self._title_parts: List[str] | None = None
+        self._heading_parts: List[str] | None = None
+        self._heading_depth = 0
+        self._paragraph_parts: List[str] | None = None
+        self._paragraph_targets: List[int] = []
+
+    def _awaiting(self) -> List[int]:
+        return [index for index, paragraph in enumerate(self.paragraphs) if paragraph is None]
+
+    def _check_done(self) -> None:
+        if len(self.headings) < self.max_headings or self._heading_parts is not None:
+            return
+        if self._awaiting() or self._paragraph_parts is not None:
+            return
+        if (self.title is not None and self.description is not None) or self.head_closed:
+            raise _StopParsing
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "title" and self.title is None and self._title_parts is None:
+            self._title_parts = []
+        elif tag == "meta" and self.description is None:
+            attributes = dict(attrs)
+            if attributes.get("name") == "description" and attributes.get("content"):
+                self.description = (attributes["content"] or "").strip()
+        elif tag == "body":
+            self.head_closed = True
+        elif tag in HEADING_TAGS:
+            if self._heading_parts is not None:
+                self._heading_depth += 1
+            elif len(self.headings) < self.max_headings:
+                self._heading_parts = []
+                self.headings.append(self._heading_parts)
+                self.paragraphs.append(None)
+        elif tag == "p" and self._paragraph_parts is None:
+            targets = self._awaiting()
+            if targets:
+                self._paragraph_parts = []
+                self._paragraph_targets = targets
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+            self._title_parts = None
+        elif tag == "head":
+            self.head_closed = True
+        elif tag in HEADING_TAGS and self._heading_parts is not None:
+            if self._heading_depth:
+                self._heading_depth -= 1
+            else:
+                self._heading_parts = None
+        elif tag == "p" and self._paragraph_parts is not None:
+            self._finish_paragraph()
+        self._check_done()
+
+    def _finish_paragraph(self) -> None:
+        text = _joined_text(self._paragraph_parts or [])[:280]
+        for index in self._paragraph_targets:
+            self.paragraphs[index] = text
+        self._paragraph_parts = None
+        self._paragraph_targets = []
+
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._heading_parts is not None:
+            self._heading_parts.append(data)
+        if self._paragraph_parts is not None:
+            self._paragraph_parts.append(data)
+
+    def result(self) -> PageExtract:
+        if self._paragraph_parts is not None:
+            self._finish_paragraph()
+        if self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+        return PageExtract(
+            title=self.title or "",
+            description=self.description or "",
+            headings=tuple(
+                (_joined_text(parts), paragraph or None)
+                for parts, paragraph in zip(self.headings, self.paragraphs)
+            ),
+        )
+
+
+class StreamingHtmlExtractor:
+    """Pure-Python tokenizer that stops reading once it has what it needs.
+
+    Parsing ends after the title and meta description (or the end of ``<head>``)
+    have been seen and the first ``max_headings`` headings each have their
+    following paragraph, so the rest of a heavy page is never decoded.
+    """
+
+    def extract(self, chunks: Iterable[bytes], max_headings: int) -> PageExtract:
+        tokenizer = _HeadlineTokenizer(max_headings)
+        decoder = None
+        try:
+            for chunk in chunks:
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(_sniff_encoding(chunk))(errors="replace")
+                tokenizer.feed(decoder.decode(chunk))
+            if decoder is not None:
+                tokenizer.feed(decoder.decode(b"", final=True))
+            tokenizer.close()
+        except _StopParsing:
+            pass
+        return tokenizer.result()
+
+
+class LxmlHtmlExtractor:
+    """libxml2-backed extractor; parses the byte-capped document in C."""
+
+    def __init__(self) -> None:
+        if lxml_html is None:
+            raise RuntimeError("lxml is not installed")
+
+    def extract(self, chunks: Iterable[bytes], max_headings: int) -> PageExtract:
+        body = b"".join(chunks)
+        if not body.strip():
+            return PageExtract()
+        document = lxml_html.document_fromstring(body)
+        title_node = document.find(".//title")
+        title = (title_node.text_content() if title_node is not None else "").strip()
+        descriptions = document.xpath('//meta[@name="description"]/@content')
+        description = next((value.strip() for value in descriptions if value), "")
+
+        headings = []
+        for heading in document.xpath("//h1 | //h2 | //h3")[:max_headings]:
+            paragraph = heading.xpath("(descendant::p | following::p)[1]")
+            summary = _joined_text(paragraph[0].itertext())[:280] if paragraph else None
+            headings.append((_joined_text(heading.itertext()), summary or None))
+        return PageExtract(title=title, description=description, headings=tuple(headings))
+
+
+class SoupHtmlExtractor:
+    """Original BeautifulSoup ``html.parser`` extraction, kept for parity checks."""
+
+    def extract(self, chunks: Iterable[bytes], max_headings: int) -> PageExtract:
+        soup = BeautifulSoup(b"".join(chunks), "html.parser")
+        title = (soup.title.string if soup.title and soup.title.string else "").strip()
+        description_tag = soup.find("meta", attrs={"name": "description"})
+        description = (
+            description_tag["content"].strip() if description_tag and description_tag.get("content") else ""
+        )
+        headings = []
+        for heading in soup.find_all(list(HEADING_TAGS), limit=max_headings):
+            paragraph = heading.find_next("p")
+            summary = paragraph.get_text(strip=True)[:280] if paragraph else None
+            headings.append((heading.get_text(strip=True), summary or None))
+        return PageExtract(title=title, description=description, headings=tuple(headings))
+
+
+EXTRACTORS = {
+    "stream": StreamingHtmlExtractor,
+    "lxml": LxmlHtmlExtractor,
+    "soup": SoupHtmlExtractor,
+}
+
+
+def get_extractor(name: str = "auto") -> HtmlExtractor:
+    """Return the named backend; ``auto`` prefers lxml and falls back to streaming."""
+
+    if name == "auto":
+        name = "lxml" if lxml_html is not None else "stream"
+    try:
+        return EXTRACTORS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown HTML extractor: {name}") from None
+
+
+__all__ = [
+    "HtmlExtractor",
+    "LxmlHtmlExtractor",
+    "PageExtract",
+    "SoupHtmlExtractor",
+    "StreamingHtmlExtractor",
+    "get_extractor",
+]
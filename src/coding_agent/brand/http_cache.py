@@ -0,0 +1,361 @@
+"""On-disk conditional-GET cache for provider HTTP fetches."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Dict, Generator, Iterable, Iterator, Mapping
+
+from coding_agent.brand.paths import DATA_ROOT
+from coding_agent.brand.transport import HttpTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_ROOT = DATA_ROOT / ".http-cache"
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Metadata stored next to each cached body."""
+
+    key: str
+    url: str
+    stored_at: float
+    size: int
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how requests were served."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def capped_chunks(
+    chunks: Iterable[bytes], max_bytes: int, *, sink: bytearray | None = None
+) -> Generator[bytes, None, bool]:
+    """Yield ``chunks`` up to ``max_bytes`` in total, appending what was yielded to ``sink``.
+
+    Returns True when ``chunks`` ended within the cap and False when it was cut.
+    """
+
+    remaining = max_bytes
+    for chunk in chunks:
+        if len(chunk) > remaining:
+            if remaining:
+                if sink is not None:
+                    sink += chunk[:remaining]
+                yield chunk[:remaining]
+            return False
+        remaining -= len(chunk)
+        if sink is not None:
+            sink += chunk
+        yield chunk
+    return True
+
+
+def stream_body(
+    transport: HttpTransport,
+    cache: "HttpCache | None",
+    url: str,
+    *,
+    timeout: float,
+    max_bytes: int,
+    chunk_size: int = 16 * 1024,
+) -> Iterator[bytes]:
+    """Yield at most ``max_bytes`` of the body for ``url``, through ``cache`` when given.
+
+    Closing the generator early closes the response without reading the rest.
+    """
+
+    if cache is not None:
+        yield from cache.stream(transport, url, timeout=timeout, max_bytes=max_bytes, chunk_size=chunk_size)
+        return
+    response = transport.get(url, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+        yield from capped_chunks(response.iter_content(chunk_size), max_bytes)
+    finally:
+        response.close()
+
+
+class HttpCache:
+    """Stores response bodies with their validators and revalidates them via conditional GET.
+
+    Entries younger than ``ttl`` seconds are served without touching the network;
+    older entries are revalidated with ``If-None-Match``/``If-Modified-Since`` so
+    an unchanged resource costs a 304 round trip. Total body size is bounded by
+    ``max_bytes`` with least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        ttl: float = 900.0,
+        max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.root = Path(root) if root is not None else DEFAULT_CACHE_ROOT
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[str, CacheEntry] | None = None
+        self._total_bytes = 0
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.root / f"{key}.body"
+
+    def _index(self) -> OrderedDict[str, CacheEntry]:
+        if self._entries is not None:
+            return self._entries
+        loaded: list[tuple[float, CacheEntry]] = []
+        if self.root.exists():
+            for meta_path in self.root.glob("*.json"):
+                try:
+                    entry = CacheEntry(**json.loads(meta_path.read_text(encoding="utf-8")))
+                    last_access = meta_path.stat().st_mtime
+                except (OSError, TypeError, ValueError) as error:
+                    logger.debug("Dropping unreadable cache entry %s: %s", meta_path, error)
+                    continue
+                loaded.append((last_access, entry))
+        loaded.sort(key=lambda item: item[0])
+        self._entries = OrderedDict((entry.key, entry) for _, entry in loaded)
+        self._total_bytes = sum(entry.size for entry in self._entries.values())
+        return self._entries
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        with self._lock:
+            return self._index().get(self._key(url))
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+    def read_body(self, entry: CacheEntry) -> bytes:
+        with self._lock:
+            body = self._body_path(entry.key).read_bytes()
+            self._touch(entry.key)
+            return body
+
+    def _touch(self, key: str) -> None:
+        entries = self._index()
+        if key in entries:
+            entries.move_to_end(key)
+        try:
+            os.utime(self._meta_path(key))
+        except OSError:
+            pass
+
+    @staticmethod
+    def validators(entry: CacheEntry | None) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        tmp = self._meta_path(entry.key).with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+        os.replace(tmp, self._meta_path(entry.key))
+
+    def store(self, url: str, body: bytes, headers: Mapping[str, str]) -> CacheEntry | None:
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return None
+        key = self._key(url)
+        entry = CacheEntry(
+            key=key,
+            url=url,
+            stored_at=time.time(),
+            size=len(body),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        if entry.size > self.max_bytes:
+            return None
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self._body_path(key).with_suffix(".body.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, self._body_path(key))
+            self._write_meta(entry)
+
+            entries = self._index()
+            previous = entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            entries[key] = entry
+            self._total_bytes += entry.size
+            self._evict()
+        return entry
+
+    def revalidated(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Record a 304 response: restart the TTL and adopt any refreshed validators."""
+
+        updated = replace(
+            entry,
+            stored_at=time.time(),
+            etag=headers.get("ETag") or entry.etag,
+            last_modified=headers.get("Last-Modified") or entry.last_modified,
+        )
+        with self._lock:
+            self._write_meta(updated)
+            self._index()[entry.key] = updated
+            self._touch(entry.key)
+        return updated
+
+    def _evict(self) -> None:
+        entries = self._index()
+        while self._total_bytes > self.max_bytes and entries:
+            key, entry = entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self.stats.evictions += 1
+            for path in (self._body_path(key), self._meta_path(key)):
+                path.unlink(missing_ok=True)
+
+    def fetch(
+        self,
+        transport: HttpTransport,
+        url: str,
+        *,
+        timeout: float,
+        headers: Mapping[str, str] | None = None,
+    ) -> bytes:
+        """Return the body for ``url``, hitting the network only when needed."""
+
+        entry = self.lookup(url)
+        if entry is not None and self.is_fresh(entry):
+            try:
+                body = self.read_body(entry)
+            except OSError:
+                entry = None
+            else:
+                with self._lock:
+                    self.stats.hits += 1
+                return body
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.validators(entry))
+        response = transport.get(url, timeout=timeout, headers=request_headers)
+        if response.status_code == 304 and entry is not None:
+            try:
+                body = self.read_body(entry)
+            except OSError:
+                # Body vanished underneath us; refetch unconditionally.
+                response = transport.get(url, timeout=timeout, headers=headers)
+            else:
+                self.revalidated(entry, response.headers)
+                with self._lock:
+                    self.stats.revalidated += 1
+                return body
+
+        response.raise_for_status()
+        body = response.content
+        with self._lock:
+            self.stats.misses += 1
+        self.store(url, body, response.headers)
+        return body
+
+    def _iter_body(self, entry: CacheEntry, chunk_size: int) -> Iterator[bytes]:
+        with self._body_path(entry.key).open("rb") as handle:
+            with self._lock:
+                self._touch(entry.key)
+            while chunk := handle.read(chunk_size):
+                yield chunk
+
+    def stream(
+        self,
+        transport: HttpTransport,
+        url: str,
+        *,
+        timeout: float,
+        max_bytes: int,
+        chunk_size: int = 16 * 1024,
+        headers: Mapping[str, str] | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the body for ``url`` in chunks, reading at most ``max_bytes`` from the network.
+
+        A network body is cached only when it was read to the end within
+        ``max_bytes``. If the consumer stops early the response is closed at
+        once and nothing is cached, so early-stopping parsers really stop
+        reading the socket.
+        """
+
+        entry = self.lookup(url)
+        if entry is not None and self.is_fresh(entry) and self._body_path(entry.key).exists():
+            with self._lock:
+                self.stats.hits += 1
+            yield from self._iter_body(entry, chunk_size)
+            return
+
+        request_headers = dict(headers or {})
+        request_headers.update(self.validators(entry))
+        response = transport.get(url, timeout=timeout, headers=request_headers, stream=True)
+        try:
+            if response.status_code == 304:
+                if entry is not None and self._body_path(entry.key).exists():
+                    self.revalidated(entry, response.headers)
+                    with self._lock:
+                        self.stats.revalidated += 1
+                    yield from self._iter_body(entry, chunk_size)
+                    return
+                # Body vanished underneath us; refetch unconditionally.
+                response.close()
+                response = transport.get(url, timeout=timeout, headers=headers, stream=True)
+
+            response.raise_for_status()
+            with self._lock:
+                self.stats.misses += 1
+            body = bytearray()
+            complete = yield from capped_chunks(response.iter_content(chunk_size), max_bytes, sink=body)
+            if complete and response.status_code != 304:
+                self.store(url, bytes(body), response.headers)
+        finally:
+            response.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index()):
+                for path in (self._body_path(key), self._meta_path(key)):
+                    path.unlink(missing_ok=True)
+            self._index().clear()
+            self._total_bytes = 0
+
+
+_default_cache: HttpCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_http_cache() -> HttpCache:
+    """Return the process-wide cache rooted under ``BRANDOS_DATA_ROOT``."""
+
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = HttpCache()
+        return _default_cache
+
+
+__all__ = ["CacheEntry", "CacheStats", "HttpCache", "capped_chunks", "default_http_cache", "stream_body"]
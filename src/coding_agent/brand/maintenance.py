@@ -0,0 +1,147 @@
+"""Retention, compaction and metric rollups for stored report history.
+
+Usage::
+
+    python -m coding_agent.brand.maintenance [--retention-days N] [--compact-after-days N]
+                                             [--data-root PATH] [--db PATH] [--batch-size N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Sequence
+
+from coding_agent.brand.archive import SignalArchive, SignalQuery, get_signal_archive
+from coding_agent.brand.paths import DATA_ROOT, KUZU_PATH
+from coding_agent.brand.rollups import GRANULARITIES, RollupStore
+from coding_agent.brand.storage import PRUNE_BATCH_SIZE, KuzuStorageEngine, prune_reports
+
+logger = logging.getLogger(__name__)
+
+RETENTION_DAYS = int(os.environ.get("BRANDOS_RETENTION_DAYS", "365"))
+COMPACT_AFTER_DAYS = int(os.environ.get("BRANDOS_COMPACT_AFTER_DAYS", "30"))
+
+
+@dataclass(frozen=True)
+class MaintenanceResult:
+    """What one maintenance pass changed."""
+
+    rollup_periods: int
+    compacted_days: int
+    pruned_days: int
+    pruned_manifests: int
+    pruned_reports: int = 0
+    pruned_highlights: int = 0
+
+
+def _prune_manifests(root: Path, before: date) -> int:
+    removed = 0
+    for path in (root / ".runs").glob("*.json"):
+        # Run ids start with the UTC start date: YYYYMMDDTHHMMSS...
+        try:
+            started = date(int(path.name[:4]), int(path.name[4:6]), int(path.name[6:8]))
+        except ValueError:
+            continue
+        if started < before:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def run_maintenance(
+    *,
+    today: date | None = None,
+    retention_days: int = RETENTION_DAYS,
+    compact_after_days: int = COMPACT_AFTER_DAYS,
+    root: Path | None = None,
+    archive: SignalArchive | None = None,
+    engine: KuzuStorageEngine | None = None,
+    batch_size: int = PRUNE_BATCH_SIZE,
+) -> MaintenanceResult:
+    """Roll up metrics, then compact and prune everything older than the retention window.
+
+    Rollups run first so they still see the reports that are about to expire;
+    the Kùzu store is only pruned when ``engine`` is given.
+    """
+
+    if retention_days < 1 or compact_after_days < 0:
+        raise ValueError("retention_days must be positive and compact_after_days non-negative")
+    today = today or date.today()
+    root = Path(root or DATA_ROOT)
+    archive = archive or get_signal_archive(root=root)
+    retain_from = today - timedelta(days=retention_days)
+
+    summaries = [report for report, _message_id in archive.read_summaries(SignalQuery())]
+    rollups = RollupStore(root)
+    rollup_periods = sum(
+        rollups.merge(granularity, summaries, frozen_before=retain_from) for granularity in GRANULARITIES
+    )
+    compacted = archive.compact(today - timedelta(days=compact_after_days))
+    pruned_days = archive.prune(retain_from)
+    manifests = _prune_manifests(root, retain_from)
+    reports = highlights = 0
+    if engine is not None:
+        reports, highlights = prune_reports(retain_from, batch_size=batch_size, engine=engine)
+
+    result = MaintenanceResult(
+        rollup_periods=rollup_periods,
+        compacted_days=compacted,
+        pruned_days=pruned_days,
+        pruned_manifests=manifests,
+        pruned_reports=reports,
+        pruned_highlights=highlights,
+    )
+    logger.info("Maintenance before %s: %s", retain_from.isoformat(), result)
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compact, roll up and expire BrandOS report history")
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=RETENTION_DAYS,
+        help="Keep this many days of history (defaults to BRANDOS_RETENTION_DAYS or 365)",
+    )
+    parser.add_argument(
+        "--compact-after-days",
+        type=int,
+        default=COMPACT_AFTER_DAYS,
+        help="Fold daily archive files older than this into monthly files",
+    )
+    parser.add_argument("--data-root", type=Path, default=DATA_ROOT, help="Archive root (defaults to BRANDOS_DATA_ROOT)")
+    parser.add_argument("--db", type=Path, default=KUZU_PATH, help="Kùzu database (defaults to BRANDOS_KUZU_PATH)")
+    parser.add_argument("--batch-size", type=int, default=PRUNE_BATCH_SIZE, help="Reports deleted per transaction")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    engine = KuzuStorageEngine(args.db) if args.db.exists() else None
+    try:
+        result = run_maintenance(
+            retention_days=args.retention_days,
+            compact_after_days=args.compact_after_days,
+            root=args.data_root,
+            engine=engine,
+            batch_size=args.batch_size,
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    finally:
+        if engine is not None:
+            engine.close()
+    print(" ".join(f"{name}={value}" for name, value in asdict(result).items()))
+    return 0
+
+
+__all__ = ["MaintenanceResult", "main", "run_maintenance"]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
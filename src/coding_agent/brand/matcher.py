@@ -0,0 +1,112 @@
+"""Compiled multi-pattern term matching (Aho–Corasick)."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TermMatcher:
+    """Finds every occurrence of many lowercase terms in one pass over the text.
+
+    Terms are grouped into named categories (for example ``stop``, ``keyword``
+    and ``competitor``); a term may belong to several. By default a term matches
+    anywhere as a substring, exactly like ``term in text.lower()``. With
+    ``word_boundary=True`` a match must not be flanked by letters, digits or
+    underscores.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]], *, word_boundary: bool = False) -> None:
+        self.word_boundary = word_boundary
+        self.categories: Tuple[str, ...] = tuple(categories)
+
+        term_categories: Dict[str, Set[str]] = {}
+        for category, terms in categories.items():
+            for term in terms:
+                normalized = term.lower()
+                if normalized:
+                    term_categories.setdefault(normalized, set()).add(category)
+
+        self._terms: List[str] = sorted(term_categories)
+        self._term_categories: List[Tuple[str, ...]] = [
+            tuple(sorted(term_categories[term])) for term in self._terms
+        ]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        goto, fail = self._goto, self._fail
+        outputs: List[List[int]] = [[]]
+        for term_id, term in enumerate(self._terms):
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(term_id)
+
+        # Depth-one states fail back to the root; deeper ones follow their parent's
+        # failure chain. Outputs are merged so each state lists every term ending there.
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                if state:
+                    fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[fail[next_state]])
+        self._output = [tuple(output) for output in outputs]
+
+    @property
+    def terms(self) -> Tuple[str, ...]:
+        return tuple(self._terms)
+
+    def _bounded(self, text: str, end: int, length: int) -> bool:
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            return False
+        return True
+
+    def find(self, text: str) -> Dict[str, Set[str]]:
+        """Return the matched terms for each category (empty sets when nothing matched)."""
+
+        hits: Dict[str, Set[str]] = {category: set() for category in self.categories}
+        if not self._terms:
+            return hits
+        lowered = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        terms, term_categories = self._terms, self._term_categories
+        seen: Set[int] = set()
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_id in output[state]:
+                if term_id in seen:
+                    continue
+                if self.word_boundary and not self._bounded(lowered, index, len(terms[term_id])):
+                    continue
+                seen.add(term_id)
+                for category in term_categories[term_id]:
+                    hits[category].add(terms[term_id])
+        return hits
+
+
+__all__ = ["TermMatcher"]
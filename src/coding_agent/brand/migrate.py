@@ -0,0 +1,51 @@
+"""Upgrade an existing Kùzu brand database to the current schema.
+
+Usage::
+
+    python -m coding_agent.brand.migrate [--db PATH] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Sequence
+
+from coding_agent.brand.storage import KUZU_PATH, SCHEMA_VERSION, KuzuStorageEngine
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Migrate the BrandOS Kùzu database schema")
+    parser.add_argument("--db", type=Path, default=KUZU_PATH, help="Database path (defaults to BRANDOS_KUZU_PATH)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Report the stored version and exit non-zero when a migration is pending",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if not args.db.exists():
+        print(f"{args.db}: no database found", file=sys.stderr)
+        return 1
+
+    engine = KuzuStorageEngine(args.db)
+    try:
+        current = engine.stored_version()
+        if args.check:
+            print(f"{args.db}: schema version {current} (current is {SCHEMA_VERSION})")
+            return 0 if current >= SCHEMA_VERSION else 1
+        if current >= SCHEMA_VERSION:
+            print(f"{args.db}: already at schema version {current}")
+            return 0
+        migrated = engine.migrate()
+        print(f"{args.db}: migrated schema from version {current} to {migrated}")
+        return 0
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -2,23 +2,208 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Dict, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+IMPACT_LEVELS: Tuple[str, ...] = ("high", "medium", "low")
+
+_Model = TypeVar("_Model", bound=BaseModel)
+
+
+def _trusted(cls: Type[_Model], values: Dict[str, Any]) -> _Model:
+    """Instance of ``cls`` holding ``values`` as-is; every field must be present, in declaration order.
+
+    ``model_construct`` also skips validation but is slower than validating
+    for a model this small, so the instance state is set directly.
+    """
+
+    model = object.__new__(cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
 
 class BrandSignal(BaseModel):
-    """Represents a single brand-related signal from an external source."""
+    """Represents a single brand-related signal from an external source.
+
+    Calling the class validates and is the path for untrusted input (files,
+    HTTP payloads, scraped pages). Internal transforms of signals that were
+    already validated use :meth:`trusted`, :meth:`trusted_copy` and
+    :meth:`to_record`, which skip pydantic entirely.
+    """
 
     source: str
     headline: str
     impact: str = "medium"
     url: str | None = None
     summary: str | None = None
+    first_seen: date | None = None
+    cluster_size: int = 1
+    keyword_hits: int = 0
 
     model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
 
+    @classmethod
+    def trusted(
+        cls,
+        *,
+        source: str,
+        headline: str,
+        impact: str = "medium",
+        url: str | None = None,
+        summary: str | None = None,
+        first_seen: date | None = None,
+        cluster_size: int = 1,
+        keyword_hits: int = 0,
+    ) -> "BrandSignal":
+        """Build without validation; the caller guarantees types and stripped strings."""
+
+        return _trusted(
+            cls,
+            {
+                "source": source,
+                "headline": headline,
+                "impact": impact,
+                "url": url,
+                "summary": summary,
+                "first_seen": first_seen,
+                "cluster_size": cluster_size,
+                "keyword_hits": keyword_hits,
+            },
+        )
+
+    def trusted_copy(self, **changes: Any) -> "BrandSignal":
+        """Like ``model_copy(update=...)`` for already-valid ``changes``, without its overhead.
+
+        Raises ``TypeError`` for names that are not fields, as :meth:`trusted` does.
+        """
+
+        unknown = changes.keys() - type(self).model_fields.keys()
+        if unknown:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {', '.join(sorted(unknown))}")
+        return _trusted(type(self), {**self.__dict__, **changes})
+
+    def to_record(self) -> Dict[str, Any]:
+        """Same dict as ``model_dump(mode="json")``, built directly."""
+
+        record = dict(self.__dict__)
+        if record["first_seen"] is not None:
+            record["first_seen"] = record["first_seen"].isoformat()
+        return record
+
+
+@dataclass(frozen=True)
+class SignalBatch:
+    """Column-oriented form of many ``BrandSignal`` values.
+
+    Every ``BrandSignal`` field is a parallel column. Sources are interned and
+    impacts are stored as one-byte codes into ``impact_levels``, which starts
+    with ``IMPACT_LEVELS`` in rank order and is extended with any other impact
+    names seen. Hot loops can then walk plain strings and ints without
+    building one model per signal, and converting back is lossless.
+    """
+
+    sources: Tuple[str, ...] = ()
+    headlines: Tuple[str, ...] = ()
+    impact_codes: array = field(default_factory=lambda: array("B"))
+    urls: Tuple[str | None, ...] = ()
+    summaries: Tuple[str | None, ...] = ()
+    first_seen: Tuple[date | None, ...] = ()
+    cluster_sizes: array = field(default_factory=lambda: array("q"))
+    keyword_hits: array = field(default_factory=lambda: array("q"))
+    impact_levels: Tuple[str, ...] = IMPACT_LEVELS
+
+    @classmethod
+    def from_signals(cls, signals: Iterable[BrandSignal]) -> "SignalBatch":
+        levels: List[str] = list(IMPACT_LEVELS)
+        codes = {name: code for code, name in enumerate(levels)}
+        sources: List[str] = []
+        headlines: List[str] = []
+        impact_codes = array("B")
+        urls: List[str | None] = []
+        summaries: List[str | None] = []
+        first_seen: List[date | None] = []
+        cluster_sizes = array("q")
+        keyword_hits = array("q")
+        for signal in signals:
+            code = codes.get(signal.impact)
+            if code is None:
+                code = codes[signal.impact] = len(levels)
+                levels.append(signal.impact)
+            sources.append(sys.intern(signal.source))
+            headlines.append(signal.headline)
+            impact_codes.append(code)
+            urls.append(signal.url)
+            summaries.append(signal.summary)
+            first_seen.append(signal.first_seen)
+            cluster_sizes.append(signal.cluster_size)
+            keyword_hits.append(signal.keyword_hits)
+        return cls(
+            sources=tuple(sources),
+            headlines=tuple(headlines),
+            impact_codes=impact_codes,
+            urls=tuple(urls),
+            summaries=tuple(summaries),
+            first_seen=tuple(first_seen),
+            cluster_sizes=cluster_sizes,
+            keyword_hits=keyword_hits,
+            impact_levels=tuple(levels),
+        )
+
+    def __len__(self) -> int:
+        return len(self.headlines)
+
+    def __iter__(self) -> Iterator[BrandSignal]:
+        return map(self.signal, range(len(self)))
+
+    def impact(self, index: int) -> str:
+        return self.impact_levels[self.impact_codes[index]]
+
+    def signal(self, index: int) -> BrandSignal:
+        return BrandSignal.trusted(
+            source=self.sources[index],
+            headline=self.headlines[index],
+            impact=self.impact(index),
+            url=self.urls[index],
+            summary=self.summaries[index],
+            first_seen=self.first_seen[index],
+            cluster_size=self.cluster_sizes[index],
+            keyword_hits=self.keyword_hits[index],
+        )
+
+    def to_signals(self) -> Tuple[BrandSignal, ...]:
+        return tuple(self)
+
+    def take(self, indices: Sequence[int]) -> "SignalBatch":
+        """Rows at ``indices``, in that order."""
+
+        return replace(
+            self,
+            sources=tuple(self.sources[index] for index in indices),
+            headlines=tuple(self.headlines[index] for index in indices),
+            impact_codes=array("B", (self.impact_codes[index] for index in indices)),
+            urls=tuple(self.urls[index] for index in indices),
+            summaries=tuple(self.summaries[index] for index in indices),
+            first_seen=tuple(self.first_seen[index] for index in indices),
+            cluster_sizes=array("q", (self.cluster_sizes[index] for index in indices)),
+            keyword_hits=array("q", (self.keyword_hits[index] for index in indices)),
+        )
+
+    def impact_counts(self) -> Dict[str, int]:
+        """Rows per impact name, counted over the code column."""
+
+        counts = [0] * len(self.impact_levels)
+        for code in self.impact_codes:
+            counts[code] += 1
+        return {name: count for name, count in zip(self.impact_levels, counts) if count}
+
 
 class BrandReport(BaseModel):
     """Structured output produced by the ReporterAgent."""
@@ -32,3 +217,30 @@ class BrandReport(BaseModel):
     risks: Tuple[str, ...] = ()
 
     model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+    @classmethod
+    def trusted(
+        cls,
+        *,
+        brand_id: str,
+        report_date: date,
+        highlights: Tuple[BrandSignal, ...] = (),
+        metrics: Dict[str, float] | None = None,
+        actions: Tuple[str, ...] = (),
+        overview: str | None = None,
+        risks: Tuple[str, ...] = (),
+    ) -> "BrandReport":
+        """Build without validation from internally produced, already-valid parts."""
+
+        return _trusted(
+            cls,
+            {
+                "brand_id": brand_id,
+                "report_date": report_date,
+                "highlights": highlights,
+                "metrics": {} if metrics is None else metrics,
+                "actions": actions,
+                "overview": overview,
+                "risks": risks,
+            },
+        )
@@ -0,0 +1,25 @@
+"""Filesystem locations and brand id validation shared by persistence backends."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+DATA_ROOT = Path(os.environ.get("BRANDOS_DATA_ROOT", "data/reports"))
+KUZU_PATH = Path(os.environ.get("BRANDOS_KUZU_PATH", "data/kuzu/brandos.db"))
+
+# Pattern for valid brand IDs: alphanumeric, hyphens, underscores only
+_BRAND_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+
+def sanitize_brand_id(brand_id: str) -> str:
+    """Validate brand_id to prevent path traversal attacks."""
+    if not brand_id:
+        raise ValueError("brand_id must not be empty")
+    if not _BRAND_ID_PATTERN.match(brand_id):
+        raise ValueError("brand_id must contain only alphanumeric characters, hyphens, and underscores")
+    return brand_id
+
+
+__all__ = ["DATA_ROOT", "KUZU_PATH", "sanitize_brand_id"]
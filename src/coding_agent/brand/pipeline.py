@@ -23,7 +23,7 @@ class BrandReportToolkit:
     """Collection of pluggable callables for the brand reporting pipeline."""
 
     gather_signals: Callable[[BrandTask], Iterable[BrandSignal]]
-    summarize: Callable[[BrandTask, Tuple[BrandSignal, ...]], BrandReport]
+    summarize: Callable[[BrandTask, Iterable[BrandSignal]], BrandReport]
     compose_email: Callable[[BrandTask, BrandReport], Tuple[str, str]]
     send_email: Callable[[BrandTask, str, str], str]
     filter_signals: Callable[[BrandTask, Tuple[BrandSignal, ...]], Tuple[BrandSignal, ...]] | None = None
@@ -0,0 +1,176 @@
+"""Read-side history queries over the Kùzu brand graph."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+from coding_agent.brand.storage import KuzuStorageEngine, get_storage_engine
+
+PERIODS = {"day": 10, "month": 7, "year": 4}
+
+
+@dataclass(frozen=True)
+class ReportRecord:
+    """A stored report, as returned by :func:`last_reports`."""
+
+    id: str
+    brand_id: str
+    report_date: date
+    overview: str
+    metrics: Dict[str, float]
+    message_id: str
+    highlight_count: int
+
+
+@dataclass(frozen=True)
+class HighlightRecord:
+    """A stored highlight together with the report it belongs to."""
+
+    id: str
+    brand_id: str
+    report_id: str
+    report_date: date
+    headline: str
+    impact: str
+    source: str
+    summary: str
+    url: str
+    first_seen: date | None = None
+
+    @property
+    def is_new(self) -> bool:
+        """True when this report is the first one to carry the highlight."""
+
+        return self.first_seen is None or self.first_seen >= self.report_date
+
+
+@dataclass(frozen=True)
+class SourceCount:
+    """Number of highlights from ``source`` within one ``period`` bucket."""
+
+    period: str
+    source: str
+    count: int
+
+
+def _rows(engine: KuzuStorageEngine, query: str, parameters: Dict[str, Any]) -> List[List[Any]]:
+    engine.ensure_schema()
+    with engine.connection() as conn:
+        result = conn.execute(query, parameters)
+        rows = []
+        while result.has_next():
+            rows.append(result.get_next())
+        return rows
+
+
+def _reports(brand_id: str | None) -> Tuple[str, Dict[str, Any]]:
+    # Anchoring on the Brand primary key turns the lookup into a traversal
+    # instead of a scan over every report.
+    if brand_id is None:
+        return "(r:Report)", {}
+    return "(:Brand {id: $brand_id})-[:HAS_REPORT]->(r:Report)", {"brand_id": brand_id}
+
+
+def last_reports(
+    brand_id: str, limit: int = 10, *, engine: KuzuStorageEngine | None = None
+) -> List[ReportRecord]:
+    """Most recent reports for ``brand_id``, newest first."""
+
+    reports, parameters = _reports(brand_id)
+    rows = _rows(
+        engine or get_storage_engine(),
+        f"MATCH {reports} OPTIONAL MATCH (r)-[:HAS_HIGHLIGHT]->(h:Highlight) "
+        "WITH r, count(h) AS highlights "
+        "RETURN r.id, r.report_date, r.overview, r.metrics, r.message_id, highlights "
+        "ORDER BY r.report_date DESC, r.id DESC LIMIT $limit",
+        {**parameters, "limit": limit},
+    )
+    return [
+        ReportRecord(
+            id=report_id,
+            brand_id=brand_id,
+            report_date=date.fromisoformat(report_date),
+            overview=overview or "",
+            metrics=json.loads(metrics or "{}"),
+            message_id=message_id or "",
+            highlight_count=highlight_count,
+        )
+        for report_id, report_date, overview, metrics, message_id, highlight_count in rows
+    ]
+
+
+def highlights_mentioning(
+    term: str,
+    start: date,
+    end: date,
+    *,
+    brand_id: str | None = None,
+    engine: KuzuStorageEngine | None = None,
+) -> List[HighlightRecord]:
+    """Highlights whose headline or summary contains ``term`` (case-insensitive).
+
+    ``start`` and ``end`` are inclusive report dates.
+    """
+
+    reports, parameters = _reports(brand_id)
+    rows = _rows(
+        engine or get_storage_engine(),
+        f"MATCH {reports}-[e:HAS_HIGHLIGHT]->(h:Highlight) "
+        "WHERE r.report_date >= $from_date AND r.report_date <= $to_date "
+        "AND (lower(h.headline) CONTAINS $term OR lower(h.summary) CONTAINS $term) "
+        "RETURN h.id, r.brand_id, r.id, r.report_date, h.headline, h.impact, h.source, h.summary, h.url, h.first_seen "
+        "ORDER BY r.report_date DESC, r.id, e.position",
+        {**parameters, "term": term.lower(), "from_date": start.isoformat(), "to_date": end.isoformat()},
+    )
+    return [
+        HighlightRecord(
+            id=highlight_id,
+            brand_id=row_brand_id,
+            report_id=report_id,
+            report_date=date.fromisoformat(report_date),
+            headline=headline,
+            impact=impact,
+            source=source,
+            summary=summary or "",
+            url=url or "",
+            first_seen=date.fromisoformat(first_seen) if first_seen else None,
+        )
+        for highlight_id, row_brand_id, report_id, report_date, headline, impact, source, summary, url, first_seen in rows
+    ]
+
+
+def source_frequency(
+    start: date,
+    end: date,
+    *,
+    brand_id: str | None = None,
+    period: str = "day",
+    engine: KuzuStorageEngine | None = None,
+) -> List[SourceCount]:
+    """Highlight counts per source, bucketed by ``day``, ``month`` or ``year``."""
+
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period}")
+    reports, parameters = _reports(brand_id)
+    rows = _rows(
+        engine or get_storage_engine(),
+        f"MATCH {reports}-[:HAS_HIGHLIGHT]->(:Highlight)-[:FROM_SOURCE]->(s:Source) "
+        "WHERE r.report_date >= $from_date AND r.report_date <= $to_date "
+        "WITH substring(r.report_date, 1, $width) AS bucket, s.name AS source, count(*) AS total "
+        "RETURN bucket, source, total ORDER BY bucket, total DESC, source",
+        {**parameters, "from_date": start.isoformat(), "to_date": end.isoformat(), "width": PERIODS[period]},
+    )
+    return [SourceCount(period=bucket, source=source, count=total) for bucket, source, total in rows]
+
+
+__all__ = [
+    "HighlightRecord",
+    "ReportRecord",
+    "SourceCount",
+    "highlights_mentioning",
+    "last_reports",
+    "source_frequency",
+]
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from array import array
+from dataclasses import dataclass, replace
+from typing import List, Sequence, Tuple
 
-from coding_agent.brand.config import BrandProfile
-from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.config import (
+    COMPETITOR,
+    KEYWORD,
+    STOP,
+    BrandProfile,
+    CompiledProfile,
+    compile_profile,
+)
+from coding_agent.brand.models import BrandSignal, SignalBatch
 
 
 @dataclass(frozen=True)
@@ -15,36 +23,38 @@ class RejectedSignal:
     reason: str
 
 
-def apply_relevance_filter(
-    signals: Sequence[BrandSignal],
-    profile: BrandProfile,
+def filter_signal_batch(
+    batch: SignalBatch,
+    profile: BrandProfile | CompiledProfile,
     *,
     min_keyword_hits: int = 1,
-) -> Tuple[Tuple[BrandSignal, ...], Tuple[RejectedSignal, ...]]:
-    """Filter signals using brand keywords, competitor mentions, and stop phrases."""
+    word_boundary: bool = False,
+) -> Tuple[SignalBatch, Tuple[RejectedSignal, ...]]:
+    """Columnar form of :func:`apply_relevance_filter`; only rejections become ``BrandSignal`` objects."""
 
-    keywords = profile.keyword_set()
-    competitor_terms = profile.competitor_set()
-    stop_terms = profile.stop_phrase_set()
+    compiled = profile if isinstance(profile, CompiledProfile) else compile_profile(profile)
+    matcher = compiled.matcher_for(word_boundary)
 
-    accepted: List[BrandSignal] = []
+    kept: List[int] = []
+    summaries: List[str] = []
+    hit_counts = array("q")
     rejected: List[RejectedSignal] = []
 
-    for signal in signals:
-        text = f"{signal.headline} {signal.summary or ''}".lower()
-        stop_matches = {term for term in stop_terms if term and term in text}
+    for index, (headline, summary) in enumerate(zip(batch.headlines, batch.summaries)):
+        hits = matcher.find(f"{headline} {summary or ''}")
+        stop_matches = hits[STOP]
         if stop_matches:
             rejected.append(
-                RejectedSignal(signal=signal, reason=f"stop phrase(s) {sorted(stop_matches)}")
+                RejectedSignal(signal=batch.signal(index), reason=f"stop phrase(s) {sorted(stop_matches)}")
             )
             continue
 
-        keyword_hits = {term for term in keywords if term and term in text}
-        competitor_hits = {term for term in competitor_terms if term and term in text}
+        keyword_hits = hits[KEYWORD]
+        competitor_hits = hits[COMPETITOR]
 
         if len(keyword_hits) < min_keyword_hits and not competitor_hits:
             rejected.append(
-                RejectedSignal(signal=signal, reason="no matching brand keywords")
+                RejectedSignal(signal=batch.signal(index), reason="no matching brand keywords")
             )
             continue
 
@@ -55,11 +65,29 @@ def apply_relevance_filter(
             relevance_clauses.append("competitors " + ", ".join(sorted(competitor_hits)))
 
         addendum = " (Relevance: " + "; ".join(relevance_clauses) + ")"
-        existing_summary = signal.summary or ""
-        new_summary = (existing_summary + addendum).strip() if existing_summary else addendum.strip()
-        accepted.append(signal.model_copy(update={"summary": new_summary}))
+        existing_summary = summary or ""
+        kept.append(index)
+        summaries.append((existing_summary + addendum).strip() if existing_summary else addendum.strip())
+        hit_counts.append(len(keyword_hits) + len(competitor_hits))
+
+    accepted = replace(batch.take(kept), summaries=tuple(summaries), keyword_hits=hit_counts)
+    return accepted, tuple(rejected)
+
+
+def apply_relevance_filter(
+    signals: Sequence[BrandSignal] | SignalBatch,
+    profile: BrandProfile | CompiledProfile,
+    *,
+    min_keyword_hits: int = 1,
+    word_boundary: bool = False,
+) -> Tuple[Tuple[BrandSignal, ...], Tuple[RejectedSignal, ...]]:
+    """Filter signals using brand keywords, competitor mentions, and stop phrases."""
 
-    return tuple(accepted), tuple(rejected)
+    batch = signals if isinstance(signals, SignalBatch) else SignalBatch.from_signals(signals)
+    accepted, rejected = filter_signal_batch(
+        batch, profile, min_keyword_hits=min_keyword_hits, word_boundary=word_boundary
+    )
+    return accepted.to_signals(), rejected
 
 
-__all__ = ["apply_relevance_filter", "RejectedSignal"]
+__all__ = ["apply_relevance_filter", "filter_signal_batch", "RejectedSignal"]
@@ -0,0 +1,107 @@
+"""TTL-bounded DNS cache shared by URL validation and the HTTP connection layer."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+AddrInfo = List[Tuple[Any, ...]]
+
+
+def is_internal_address(ip_str: str) -> bool:
+    ip = ipaddress.ip_address(ip_str)
+    return ip.is_private or ip.is_loopback or ip.is_reserved or ip.is_link_local
+
+
+def _addresses(infos: AddrInfo) -> Tuple[str, ...]:
+    seen: Dict[str, None] = {}
+    for _family, _type, _proto, _canonname, sockaddr in infos:
+        seen.setdefault(sockaddr[0], None)
+    return tuple(seen)
+
+
+@dataclass
+class DnsCache:
+    """Resolves each host at most once per ``ttl`` seconds.
+
+    The SSRF check in ``_validate_url`` and the pinned connections created by
+    ``HttpTransport`` read the same entries, so the socket is opened against the
+    exact addresses that were validated instead of a second, independent lookup.
+    Failed lookups are not cached.
+    """
+
+    ttl: float = 300.0
+    getaddrinfo: Callable[..., AddrInfo] = field(default=socket.getaddrinfo, repr=False)
+    _entries: Dict[str, Tuple[float, Tuple[str, ...]]] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _cached(self, host: str) -> Tuple[str, ...] | None:
+        with self._lock:
+            entry = self._entries.get(host)
+        if entry is None:
+            return None
+        expires_at, addresses = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return addresses
+
+    def _remember(self, host: str, addresses: Tuple[str, ...]) -> Tuple[str, ...]:
+        with self._lock:
+            self._entries[host] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def resolve(self, host: str) -> Tuple[str, ...]:
+        """Return the addresses for ``host``; raises ``socket.gaierror`` on failure."""
+
+        host = host.lower()
+        cached = self._cached(host)
+        if cached is not None:
+            return cached
+        infos = self.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        return self._remember(host, _addresses(infos))
+
+    async def resolve_async(self, host: str) -> Tuple[str, ...]:
+        """Non-blocking variant of :meth:`resolve` backed by the event loop's resolver."""
+
+        host = host.lower()
+        cached = self._cached(host)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        return self._remember(host, _addresses(infos))
+
+    async def resolve_many(self, hosts: Iterable[str]) -> Dict[str, Tuple[str, ...] | BaseException]:
+        """Resolve several hosts concurrently, e.g. to warm the cache before a gather."""
+
+        unique = list(dict.fromkeys(host.lower() for host in hosts))
+        results = await asyncio.gather(
+            *(self.resolve_async(host) for host in unique), return_exceptions=True
+        )
+        return dict(zip(unique, results))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_default_resolver: DnsCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_resolver() -> DnsCache:
+    """Return the process-wide resolution cache."""
+
+    global _default_resolver
+    with _default_lock:
+        if _default_resolver is None:
+            _default_resolver = DnsCache()
+        return _default_resolver
+
+
+__all__ = ["DnsCache", "default_resolver", "is_internal_address"]
@@ -0,0 +1,131 @@
+"""Weekly and monthly pre-aggregates of ``BrandReport.metrics``."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+from coding_agent.brand.fileio import write_json
+from coding_agent.brand.models import BrandReport
+from coding_agent.brand.paths import DATA_ROOT, sanitize_brand_id
+
+GRANULARITIES = ("week", "month")
+
+# brand_id -> period label -> metric name -> stats
+Rollups = Dict[str, Dict[str, Dict[str, "MetricStats"]]]
+
+
+@dataclass(frozen=True)
+class MetricStats:
+    """Count, sum and range of one metric over a period."""
+
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float) -> "MetricStats":
+        return MetricStats(
+            count=self.count + 1,
+            total=self.total + value,
+            minimum=min(self.minimum, value),
+            maximum=max(self.maximum, value),
+        )
+
+    @classmethod
+    def of(cls, value: float) -> "MetricStats":
+        return cls(count=1, total=value, minimum=value, maximum=value)
+
+
+def period_of(day: date, granularity: str) -> Tuple[str, date]:
+    """Label and first day of the ``week`` (ISO) or ``month`` containing ``day``."""
+
+    if granularity == "week":
+        year, week, weekday = day.isocalendar()
+        return f"{year}-W{week:02d}", day - timedelta(days=weekday - 1)
+    if granularity == "month":
+        return day.isoformat()[:7], day.replace(day=1)
+    raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+
+def rollup_reports(reports: Iterable[BrandReport], granularity: str) -> Tuple[Rollups, Dict[str, date]]:
+    """Aggregate report metrics per brand and period; also returns each period's first day."""
+
+    rollups: Rollups = {}
+    starts: Dict[str, date] = {}
+    for report in reports:
+        period, start = period_of(report.report_date, granularity)
+        starts[period] = start
+        metrics = rollups.setdefault(report.brand_id, {}).setdefault(period, {})
+        for name, value in report.metrics.items():
+            current = metrics.get(name)
+            metrics[name] = MetricStats.of(value) if current is None else current.add(value)
+    return rollups, starts
+
+
+class RollupStore:
+    """One JSON document per brand under ``.rollups`` holding every granularity."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = Path(root or DATA_ROOT) / ".rollups"
+
+    def _path(self, brand_id: str) -> Path:
+        return self.root / f"{sanitize_brand_id(brand_id)}.json"
+
+    def _load(self, brand_id: str) -> dict:
+        try:
+            return json.loads(self._path(brand_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def read(self, brand_id: str, granularity: str) -> Dict[str, Dict[str, MetricStats]]:
+        """Stored rollups for ``brand_id`` keyed by period label, oldest first."""
+
+        periods = self._load(brand_id).get(granularity, {})
+        return {
+            period: {name: MetricStats(**stats) for name, stats in entry["metrics"].items()}
+            for period, entry in sorted(periods.items())
+        }
+
+    def merge(self, granularity: str, reports: Iterable[BrandReport], *, frozen_before: date) -> int:
+        """Recompute rollups from ``reports`` and store them; returns the periods written.
+
+        Periods starting before ``frozen_before`` may have lost reports to
+        retention, so a stored rollup for them is kept and only missing ones
+        are filled in.
+        """
+
+        rollups, starts = rollup_reports(reports, granularity)
+        written = 0
+        for brand_id, periods in rollups.items():
+            document = self._load(brand_id)
+            stored = document.setdefault(granularity, {})
+            for period, metrics in periods.items():
+                if starts[period] < frozen_before and period in stored:
+                    continue
+                stored[period] = {
+                    "start": starts[period].isoformat(),
+                    "metrics": {
+                        name: {
+                            "count": stats.count,
+                            "total": stats.total,
+                            "minimum": stats.minimum,
+                            "maximum": stats.maximum,
+                        }
+                        for name, stats in sorted(metrics.items())
+                    },
+                }
+                written += 1
+            document[granularity] = dict(sorted(stored.items()))
+            write_json(self._path(brand_id), document)
+        return written
+
+
+__all__ = ["GRANULARITIES", "MetricStats", "RollupStore", "period_of", "rollup_reports"]
@@ -0,0 +1,302 @@
+"""Content-addressed store of unique signals with a Bloom-filter "seen before?" front."""
+
+from __future__ import annotations
+
+import atexit
+import dbm
+import fcntl
+import hashlib
+import importlib
+import json
+import math
+import os
+import re
+import struct
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.paths import DATA_ROOT
+
+_WHITESPACE = re.compile(r"\s+")
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref)$", re.IGNORECASE)
+
+
+def _open_index(path: Path):
+    # dbm.sqlite3 (the 3.13 default) binds its connection to the opening
+    # thread, and the store is written from the write-behind thread.
+    if dbm.whichdb(str(path)):
+        return dbm.open(str(path), "w")
+    for name in ("dbm.gnu", "dbm.ndbm", "dbm.dumb"):
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        return module.open(str(path), "c")
+    raise RuntimeError("no thread-safe dbm backend available")  # pragma: no cover - dbm.dumb always exists
+
+
+def _normalize_text(value: str | None) -> str:
+    return _WHITESPACE.sub(" ", (value or "").casefold()).strip()
+
+
+def normalize_url(url: str | None) -> str:
+    """Canonical form used for hashing: lowercase scheme/host, no fragment or tracking params."""
+
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted((key, value) for key, value in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(key)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def content_key(headline: str | None, summary: str | None, url: str | None) -> str:
+    """Stable content hash of a normalized headline, summary and URL."""
+
+    material = "\x1f".join((_normalize_text(headline), _normalize_text(summary), normalize_url(url)))
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def signal_key(signal: BrandSignal) -> str:
+    return content_key(signal.headline, signal.summary, signal.url)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys (double hashing over one blake2b digest).
+
+    Membership tests never give false negatives; false positives occur at about
+    ``error_rate`` while at most ``capacity`` keys have been added.
+    """
+
+    _HEADER = struct.Struct("<QQQ")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.num_hashes):
+            yield (first + index * step) % self.num_bits
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("wb") as handle:
+                handle.write(self._HEADER.pack(self.capacity, self.num_hashes, self.count))
+                handle.write(struct.pack("<d", self.error_rate))
+                handle.write(self._bits)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter | None":
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        header = cls._HEADER.size
+        capacity, num_hashes, count = cls._HEADER.unpack_from(payload)
+        (error_rate,) = struct.unpack_from("<d", payload, header)
+        bloom = cls(capacity, error_rate)
+        bits = payload[header + 8 :]
+        if bloom.num_hashes != num_hashes or len(bits) != len(bloom._bits):
+            return None
+        bloom._bits[:] = bits
+        bloom.count = count
+        return bloom
+
+
+class SignalStore:
+    """Each unique signal stored once, keyed by :func:`signal_key`.
+
+    Bodies and first/last-seen dates live in an on-disk ``dbm`` hash index; a
+    Bloom filter in front answers most "seen before?" checks for new signals
+    without touching the index. Every operation holds an ``fcntl`` lock on
+    the store directory and reopens the index when another process has
+    changed it since, rebuilding the filter if that process added keys, so
+    the filter never reports a stored key as unseen. The filter is saved on
+    :meth:`flush` and :meth:`close` and rebuilt from the index when the saved
+    copy is missing or stale. Safe for concurrent use by threads and
+    processes.
+    """
+
+    def __init__(self, root: Path, *, capacity: int = 100_000, error_rate: float = 0.01) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._index_path = self.root / "index"
+        self._bloom_path = self.root / "bloom.bin"
+        self._lock = threading.RLock()
+        self._index = None
+        self._index_stamp: Tuple[Tuple[str, int, int], ...] | None = None
+        saved = self._bloom = BloomFilter.load(self._bloom_path)
+        with self._locked():
+            if self._bloom is not saved:
+                self._bloom.save(self._bloom_path)
+
+    def _stamp(self) -> Tuple[Tuple[str, int, int], ...]:
+        stamps = []
+        for path in sorted(self.root.glob("index*")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stamps.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(stamps)
+
+    def _refresh(self) -> None:
+        # dbm.dumb keeps its key directory in memory, so another process's
+        # writes are only visible after reopening.
+        if self._index is not None and self._stamp() == self._index_stamp:
+            return
+        if self._index is not None:
+            self._index.close()
+        self._index = _open_index(self._index_path)
+        size = len(self._index)
+        bloom = self._bloom
+        if bloom is None or bloom.count != size or size > bloom.capacity:
+            self._bloom = self._rebuild(max(self.capacity, bloom.capacity if bloom else 0, size * 2))
+        self._index_stamp = self._stamp()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock, (self.root / ".lock").open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            self._refresh()
+            yield
+
+    def _rebuild(self, capacity: int) -> BloomFilter:
+        bloom = BloomFilter(capacity, self.error_rate)
+        for key in self._index.keys():
+            bloom.add(key.decode("ascii"))
+        return bloom
+
+    def __len__(self) -> int:
+        with self._locked():
+            return len(self._index)
+
+    def _entry(self, key: str) -> dict | None:
+        if key not in self._bloom:
+            return None
+        raw = self._index.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def seen(self, key: str) -> bool:
+        with self._locked():
+            return self._entry(key) is not None
+
+    def first_seen(self, key: str) -> date | None:
+        with self._locked():
+            entry = self._entry(key)
+        return date.fromisoformat(entry["first_seen"]) if entry else None
+
+    def get(self, key: str) -> BrandSignal | None:
+        with self._locked():
+            entry = self._entry(key)
+        return BrandSignal.model_validate(entry["signal"]) if entry else None
+
+    def annotate(self, signals: Iterable[BrandSignal], as_of: date) -> Tuple[BrandSignal, ...]:
+        """Copies of ``signals`` with ``first_seen`` set; unseen signals get ``as_of``."""
+
+        annotated = []
+        with self._locked():
+            for signal in signals:
+                entry = self._entry(signal_key(signal))
+                first_seen = date.fromisoformat(entry["first_seen"]) if entry else None
+                if first_seen is None or first_seen > as_of:
+                    first_seen = as_of
+                annotated.append(signal.trusted_copy(first_seen=first_seen))
+        return tuple(annotated)
+
+    def put_many(self, signals: Iterable[BrandSignal], seen_on: date) -> Tuple[str, ...]:
+        """Store unseen signals and extend the seen-range of known ones; returns their keys."""
+
+        keys = []
+        with self._locked():
+            for signal in signals:
+                key = signal_key(signal)
+                keys.append(key)
+                entry = self._entry(key)
+                day = seen_on.isoformat()
+                if entry is None:
+                    body = signal.to_record()
+                    del body["first_seen"]
+                    entry = {"signal": body, "first_seen": day, "last_seen": day}
+                    self._bloom.add(key)
+                elif entry["first_seen"] <= day <= entry["last_seen"]:
+                    continue
+                else:
+                    entry["first_seen"] = min(entry["first_seen"], day)
+                    entry["last_seen"] = max(entry["last_seen"], day)
+                self._index[key] = json.dumps(entry)
+            if hasattr(self._index, "sync"):
+                self._index.sync()
+            self._index_stamp = self._stamp()
+            if self._bloom.count > self._bloom.capacity:
+                self._bloom = self._rebuild(self._bloom.capacity * 2)
+        return tuple(keys)
+
+    def flush(self) -> None:
+        """Sync the index and save the Bloom filter."""
+
+        with self._locked():
+            if hasattr(self._index, "sync"):
+                self._index.sync()
+            self._bloom.save(self._bloom_path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index is None:
+                return
+            self.flush()
+            self._index.close()
+            self._index = None
+
+
+_default_store: SignalStore | None = None
+_default_lock = threading.Lock()
+
+
+def default_signal_store() -> SignalStore:
+    """Process-wide store under ``DATA_ROOT/.signals``."""
+
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = SignalStore(DATA_ROOT / ".signals")
+            atexit.register(_default_store.close)
+        return _default_store
+
+
+__all__ = [
+    "BloomFilter",
+    "SignalStore",
+    "content_key",
+    "default_signal_store",
+    "normalize_url",
+    "signal_key",
+]
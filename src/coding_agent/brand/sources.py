@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-import ipaddress
 import json
+import logging
 import socket
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Iterable, Iterator, Protocol, Tuple
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 from xml.etree import ElementTree as ET
 
+from coding_agent.brand.html_extract import HtmlExtractor, get_extractor
+from coding_agent.brand.http_cache import HttpCache, stream_body
 from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.resolver import DnsCache, default_resolver, is_internal_address
+from coding_agent.brand.transport import HttpTransport, default_transport
 
+logger = logging.getLogger(__name__)
 
-def _validate_url(url: str) -> None:
-    """Validate URL to prevent SSRF attacks."""
+
+def _validate_url(url: str, resolver: DnsCache | None = None) -> Tuple[str, ...]:
+    """Validate URL to prevent SSRF attacks.
+
+    Returns the validated addresses; they stay in the shared ``DnsCache`` so the
+    connection layer reuses them instead of resolving the host a second time.
+    """
     parsed = urlparse(url)
 
     # Only allow http/https schemes
@@ -40,16 +49,15 @@ def _validate_url(url: str) -> None:
 
     # Resolve hostname and check for private IP ranges
     try:
-        resolved_ips = socket.getaddrinfo(hostname, None)
-        for family, type_, proto, canonname, sockaddr in resolved_ips:
-            ip_str = sockaddr[0]
-            ip = ipaddress.ip_address(ip_str)
-            if ip.is_private or ip.is_loopback or ip.is_reserved or ip.is_link_local:
-                raise ValueError(f"URL resolves to private/internal IP: {ip_str}")
+        resolved_ips = (resolver or default_resolver()).resolve(hostname)
     except socket.gaierror:
         # If DNS resolution fails, allow the request to proceed
         # (will fail naturally on the HTTP request)
-        pass
+        return ()
+    for ip_str in resolved_ips:
+        if is_internal_address(ip_str):
+            raise ValueError(f"URL resolves to private/internal IP: {ip_str}")
+    return resolved_ips
 
 
 class SignalsProvider(Protocol):
@@ -83,44 +91,52 @@ class StaticSignalsProvider(SignalsProvider):
 
 @dataclass
 class WebPageSignalsProvider(SignalsProvider):
-    """Fetches a public web page and extracts simple highlight signals."""
+    """Fetches a public web page and extracts simple highlight signals.
+
+    At most ``max_bytes`` of HTML are read. The ``extractor`` backend defaults to
+    lxml when installed, otherwise a streaming tokenizer that stops after the
+    title, meta description and first ``max_headings`` headings.
+    """
 
     url: str
     timeout: float = 8.0
+    transport: HttpTransport | None = field(default=None, repr=False)
+    cache: HttpCache | None = field(default=None, repr=False)
+    extractor: HtmlExtractor | None = field(default=None, repr=False)
+    max_bytes: int = 1024 * 1024
+    max_headings: int = 5
+    chunk_size: int = 16 * 1024
 
     def load(self, brand_id: str) -> Iterable[BrandSignal]:
-        _validate_url(self.url)
-        response = requests.get(self.url, timeout=self.timeout)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
+        transport = self.transport or default_transport()
+        _validate_url(self.url, transport.resolver)
+        chunks = stream_body(
+            transport, self.cache, self.url, timeout=self.timeout, max_bytes=self.max_bytes, chunk_size=self.chunk_size
+        )
+        try:
+            page = (self.extractor or get_extractor()).extract(chunks, self.max_headings)
+        finally:
+            chunks.close()
 
         signals: list[BrandSignal] = []
+        seen_headlines: set[str] = set()
 
-        title = (soup.title.string if soup.title else "").strip()
-        description_tag = soup.find("meta", attrs={"name": "description"})
-        description = (description_tag["content"].strip() if description_tag and description_tag.get("content") else "")
-
-        if title:
+        if page.title:
+            seen_headlines.add(page.title)
             signals.append(
                 BrandSignal(
                     source="web",
-                    headline=title,
+                    headline=page.title,
                     impact="medium",
                     url=self.url,
-                    summary=description or None,
+                    summary=page.description or None,
                 )
             )
 
-        headings = soup.find_all(["h1", "h2", "h3"], limit=5)
-        for heading in headings:
-            text = heading.get_text(strip=True)
-            if not text or any(sig.headline == text for sig in signals):
+        for text, summary in page.headings:
+            if not text or text in seen_headlines:
                 continue
-            summary = None
-            paragraph = heading.find_next("p")
-            if paragraph:
-                summary = paragraph.get_text(strip=True)[:280] or None
+            seen_headlines.add(text)
             signals.append(
                 BrandSignal(
                     source="web",
@@ -145,25 +161,97 @@ class WebPageSignalsProvider(SignalsProvider):
         return signals
 
 
+def _rss_item_signal(item: ET.Element) -> BrandSignal | None:
+    title = (item.findtext("title") or "").strip()
+    link = (item.findtext("link") or "").strip()
+    description = (item.findtext("description") or "").strip()
+    if not title:
+        return None
+    parsed_host = ""
+    if link:
+        parsed_host = requests.utils.urlparse(link).netloc
+    source_label = parsed_host or "google-news"
+    return BrandSignal(
+        source=source_label,
+        headline=title,
+        impact="medium",
+        url=link or None,
+        summary=description or None,
+    )
+
+
+def iter_rss_items(chunks: Iterable[bytes], max_items: int) -> Iterator[ET.Element]:
+    """Incrementally parse RSS bytes and yield up to ``max_items`` channel items.
+
+    Each item is cleared after the consumer resumes, so memory stays flat no
+    matter how large the feed is. A feed cut short by a byte cap simply ends
+    after its last complete item.
+    """
+
+    if max_items <= 0:
+        return
+    parser = ET.XMLPullParser(events=("start", "end"))
+    path: list[str] = []
+    produced = 0
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    path.append(element.tag)
+                    continue
+                path.pop()
+                if element.tag != "item" or path[-1:] != ["channel"]:
+                    continue
+                yield element
+                element.clear()
+                produced += 1
+                if produced >= max_items:
+                    return
+    except ET.ParseError as error:
+        if produced == 0:
+            raise
+        logger.debug("RSS feed truncated after %d items: %s", produced, error)
+
+
 @dataclass
 class GoogleNewsProvider(SignalsProvider):
-    """Pulls recent items from Google News RSS for a query."""
+    """Pulls recent items from Google News RSS for a query.
+
+    By default the feed is parsed incrementally while it downloads and the
+    connection is dropped as soon as ``max_items`` items have been read (or
+    ``max_bytes`` is reached). Set ``streaming=False`` to buffer the full body.
+    """
 
     query: str
     max_items: int = 5
     timeout: float = 8.0
+    transport: HttpTransport | None = field(default=None, repr=False)
+    cache: HttpCache | None = field(default=None, repr=False)
+    streaming: bool = True
+    max_bytes: int = 2 * 1024 * 1024
+    chunk_size: int = 16 * 1024
 
-    def load(self, brand_id: str) -> Iterable[BrandSignal]:
+    def feed_url(self) -> str:
         encoded_query = requests.utils.quote(self.query)
-        url = (
+        return (
             "https://news.google.com/rss/search?q="
             f"{encoded_query}&hl=en-US&gl=US&ceid=US:en"
         )
 
-        response = requests.get(url, timeout=self.timeout)
-        response.raise_for_status()
-
-        root = ET.fromstring(response.text)
+    def load(self, brand_id: str) -> Iterable[BrandSignal]:
+        if self.streaming:
+            return self.iter_signals(brand_id)
+
+        transport = self.transport or default_transport()
+        if self.cache is not None:
+            body: str | bytes = self.cache.fetch(transport, self.feed_url(), timeout=self.timeout)
+        else:
+            response = transport.get(self.feed_url(), timeout=self.timeout)
+            response.raise_for_status()
+            body = response.text
+
+        root = ET.fromstring(body)
         channel = root.find("channel")
         if channel is None:
             return []
@@ -171,22 +259,27 @@ class GoogleNewsProvider(SignalsProvider):
         items = channel.findall("item")[: self.max_items]
         signals: list[BrandSignal] = []
         for item in items:
-            title = (item.findtext("title") or "").strip()
-            link = (item.findtext("link") or "").strip()
-            description = (item.findtext("description") or "").strip()
-            if not title:
-                continue
-            parsed_host = ""
-            if link:
-                parsed_host = requests.utils.urlparse(link).netloc
-            source_label = parsed_host or "google-news"
-            signals.append(
-                BrandSignal(
-                    source=source_label,
-                    headline=title,
-                    impact="medium",
-                    url=link or None,
-                    summary=description or None,
-                )
-            )
+            signal = _rss_item_signal(item)
+            if signal is not None:
+                signals.append(signal)
         return signals
+
+    def iter_signals(self, brand_id: str) -> Iterator[BrandSignal]:
+        """Yield signals one by one while the feed is still downloading."""
+
+        transport = self.transport or default_transport()
+        chunks = stream_body(
+            transport,
+            self.cache,
+            self.feed_url(),
+            timeout=self.timeout,
+            max_bytes=self.max_bytes,
+            chunk_size=self.chunk_size,
+        )
+        try:
+            for item in iter_rss_items(chunks, self.max_items):
+                signal = _rss_item_signal(item)
+                if signal is not None:
+                    yield signal
+        finally:
+            chunks.close()
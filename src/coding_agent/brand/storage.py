@@ -2,145 +2,738 @@
 
 from __future__ import annotations
 
+import atexit
+import csv
 import json
 import logging
 import os
-import re
-from datetime import date
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 
 import kuzu
 
+from coding_agent.brand.archive import SignalArchive, SignalQuery, get_signal_archive
+from coding_agent.brand.fileio import current_batch
 from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.paths import DATA_ROOT, KUZU_PATH
+from coding_agent.brand.paths import sanitize_brand_id as _sanitize_brand_id
+from coding_agent.brand.signal_store import content_key, signal_key
 
 logger = logging.getLogger(__name__)
 
-DATA_ROOT = Path(os.environ.get("BRANDOS_DATA_ROOT", "data/reports"))
-KUZU_PATH = Path(os.environ.get("BRANDOS_KUZU_PATH", "data/kuzu/brandos.db"))
 
-# Pattern for valid brand IDs: alphanumeric, hyphens, underscores only
-_BRAND_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+HISTORY_MAX_ENTRIES = 512
+HISTORY_WARM_DAYS = int(os.environ.get("BRANDOS_HISTORY_WARM_DAYS", "7"))
 
 
-def _sanitize_brand_id(brand_id: str) -> str:
-    """Validate brand_id to prevent path traversal attacks."""
-    if not brand_id:
-        raise ValueError("brand_id must not be empty")
-    if not _BRAND_ID_PATTERN.match(brand_id):
-        raise ValueError("brand_id must contain only alphanumeric characters, hyphens, and underscores")
-    return brand_id
+@dataclass(frozen=True)
+class HistoryEntry:
+    """What the archive holds for one brand and day; ``report`` is ``None`` when nothing was stored."""
 
+    brand_id: str
+    report_date: date
+    report: BrandReport | None
+    message_id: str | None
+    signals: Tuple[BrandSignal, ...]
 
-def _escape(value: str | None) -> str:
-    if value is None:
-        return ""
-    return value.replace("'", "''")
 
+_histories: "weakref.WeakSet[ReportHistory]" = weakref.WeakSet()
 
-def persist_raw_signals(brand_id: str, report_date: date, signals: Iterable[BrandSignal]) -> Path:
-    brand_id = _sanitize_brand_id(brand_id)
-    folder = DATA_ROOT / brand_id / report_date.isoformat()
-    folder.mkdir(parents=True, exist_ok=True)
-    payload = [signal.model_dump(mode="json") for signal in signals]
-    output = folder / "signals.json"
-    with output.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    return output
 
+class ReportHistory:
+    """Read-through LRU of recent reports and signal sets, keyed by brand and day.
 
-def persist_report_summary(brand_id: str, report: BrandReport, message_id: str) -> Path:
-    brand_id = _sanitize_brand_id(brand_id)
-    folder = DATA_ROOT / brand_id / report.report_date.isoformat()
-    folder.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "report": report.model_dump(mode="json"),
-        "message_id": message_id,
-    }
-    output = folder / "summary.json"
-    with output.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    return output
+    Misses load the day from the archive and are cached too (as an empty
+    entry), so probing for the latest earlier report stays in memory. At most
+    ``max_entries`` days are kept. Writes through :func:`persist_raw_signals`
+    and :func:`persist_report_summary` invalidate the day in every live
+    history, again once a surrounding write batch has been published; a load
+    that raced with an invalidation is not cached.
+    """
 
+    def __init__(self, archive: SignalArchive | None = None, *, max_entries: int = HISTORY_MAX_ENTRIES) -> None:
+        self.archive = archive or get_signal_archive()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[str, date], HistoryEntry] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        _histories.add(self)
 
-def _get_connection() -> kuzu.Connection:
-    KUZU_PATH.parent.mkdir(parents=True, exist_ok=True)
-    database = kuzu.Database(str(KUZU_PATH))
-    return kuzu.Connection(database)
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
+    def _store(self, entry: HistoryEntry, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            key = (entry.brand_id, entry.report_date)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
 
-def _ensure_schema(conn: kuzu.Connection) -> None:
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS Brand(id STRING, name STRING, PRIMARY KEY(id));"
+    def _load(self, brand_id: str | None, start: date, end: date) -> Dict[Tuple[str, date], HistoryEntry]:
+        query = SignalQuery(brand_ids=None if brand_id is None else (brand_id,), start=start, end=end)
+        signals: Dict[Tuple[str, date], List[BrandSignal]] = {}
+        for batch in self.archive.scan_signals(query):
+            for item in batch:
+                signals.setdefault((item.brand_id, item.report_date), []).append(item.signal)
+        entries = {
+            key: HistoryEntry(key[0], key[1], None, None, tuple(items)) for key, items in signals.items()
+        }
+        for report, message_id in self.archive.read_summaries(query):
+            key = (report.brand_id, report.report_date)
+            entries[key] = HistoryEntry(key[0], key[1], report, message_id, tuple(signals.get(key, ())))
+        return entries
+
+    def get(self, brand_id: str, report_date: date) -> HistoryEntry:
+        key = (brand_id, report_date)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self._generation
+        entry = self._load(brand_id, report_date, report_date).get(key) or HistoryEntry(
+            brand_id, report_date, None, None, ()
+        )
+        self._store(entry, generation)
+        return entry
+
+    def previous(self, brand_id: str, before: date, *, lookback: int = 7) -> HistoryEntry | None:
+        """Most recent stored report for ``brand_id`` in the ``lookback`` days before ``before``."""
+
+        for offset in range(1, lookback + 1):
+            entry = self.get(brand_id, before - timedelta(days=offset))
+            if entry.report is not None:
+                return entry
+        return None
+
+    def invalidate(self, brand_id: str, report_date: date | None = None) -> None:
+        """Forget one day of ``brand_id``, or all of its days when ``report_date`` is ``None``."""
+
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[0] == brand_id]:
+                if report_date is None or key[1] == report_date:
+                    del self._entries[key]
+
+    def warm(self, days: int = HISTORY_WARM_DAYS, *, today: date | None = None) -> int:
+        """Load every brand's last ``days`` days with one archive scan; returns the entries cached."""
+
+        today = today or date.today()
+        with self._lock:
+            generation = self._generation
+        entries = self._load(None, today - timedelta(days=days), today)
+        for key in sorted(entries, key=lambda key: (key[1], key[0])):
+            self._store(entries[key], generation)
+        return len(entries)
+
+
+def _invalidate_histories(brand_id: str, report_date: date) -> None:
+    def invalidate() -> None:
+        for history in list(_histories):
+            history.invalidate(brand_id, report_date)
+
+    invalidate()
+    batch = current_batch()
+    if batch is not None:
+        batch.after_commit(invalidate)
+
+
+_default_history: ReportHistory | None = None
+_default_history_lock = threading.Lock()
+
+
+def default_report_history() -> ReportHistory:
+    """Process-wide history over the configured archive, warmed with the last ``HISTORY_WARM_DAYS`` days."""
+
+    global _default_history
+    with _default_history_lock:
+        if _default_history is None:
+            _default_history = ReportHistory()
+            try:
+                _default_history.warm()
+            except Exception as error:  # pragma: no cover - a cold cache still works
+                logger.warning("Could not warm report history: %s", error)
+        return _default_history
+
+
+def persist_raw_signals(
+    brand_id: str,
+    report_date: date,
+    signals: Iterable[BrandSignal],
+    *,
+    archive: SignalArchive | None = None,
+) -> Path:
+    path = (archive or get_signal_archive()).write_signals(brand_id, report_date, signals)
+    _invalidate_histories(brand_id, report_date)
+    return path
+
+
+def persist_report_summary(
+    brand_id: str,
+    report: BrandReport,
+    message_id: str,
+    *,
+    archive: SignalArchive | None = None,
+) -> Path:
+    path = (archive or get_signal_archive()).write_summary(brand_id, report, message_id)
+    _invalidate_histories(brand_id, report.report_date)
+    return path
+
+
+def _content_address_highlights(conn: kuzu.Connection) -> None:
+    """Re-key highlights by content so a story repeated across days is stored once."""
+
+    result = conn.execute(
+        "MATCH (r:Report)-[e:HAS_HIGHLIGHT]->(h:Highlight) "
+        "RETURN r.id, r.report_date, e.position, h.headline, h.impact, h.source, h.summary, h.url"
     )
+    highlights: Dict[str, dict] = {}
+    edges: Dict[Tuple[str, str], dict] = {}
+    while result.has_next():
+        report_id, report_date, position, headline, impact, source, summary, url = result.get_next()
+        key = content_key(headline, summary, url)
+        row = highlights.setdefault(
+            key,
+            {
+                "id": key,
+                "headline": headline or "",
+                "impact": impact or "medium",
+                "source": source or "",
+                "summary": summary or "",
+                "url": url or "",
+                "first_seen": report_date or "",
+            },
+        )
+        row["first_seen"] = min(row["first_seen"], report_date or row["first_seen"])
+        edges[(report_id, key)] = {"src": report_id, "dst": key, "position": position}
+
+    for table in ("FROM_SOURCE", "HAS_HIGHLIGHT", "Highlight"):
+        conn.execute(f"DROP TABLE {table}")
     conn.execute(
-        "CREATE TABLE IF NOT EXISTS Report(id STRING, brand_id STRING, report_date STRING, overview STRING, metrics STRING, message_id STRING, PRIMARY KEY(id));"
+        "CREATE NODE TABLE Highlight(id STRING, headline STRING, impact STRING, source STRING, "
+        "summary STRING, url STRING, first_seen STRING, PRIMARY KEY(id))"
     )
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS Highlight(id STRING, report_id STRING, headline STRING, impact STRING, source STRING, summary STRING, url STRING, PRIMARY KEY(id));"
+    conn.execute("CREATE REL TABLE HAS_HIGHLIGHT(FROM Report TO Highlight, position INT64)")
+    conn.execute("CREATE REL TABLE FROM_SOURCE(FROM Highlight TO Source)")
+    if highlights:
+        conn.execute(
+            "UNWIND $rows AS row CREATE (:Highlight {id: row.id, headline: row.headline, impact: row.impact, "
+            "source: row.source, summary: row.summary, url: row.url, first_seen: row.first_seen})",
+            {"rows": list(highlights.values())},
+        )
+        conn.execute(
+            "UNWIND $rows AS row MATCH (r:Report {id: row.src}), (h:Highlight {id: row.dst}) "
+            "CREATE (r)-[:HAS_HIGHLIGHT {position: row.position}]->(h)",
+            {"rows": list(edges.values())},
+        )
+        conn.execute(
+            "UNWIND $rows AS row MATCH (h:Highlight {id: row.id}) MERGE (s:Source {name: row.source}) "
+            "CREATE (h)-[:FROM_SOURCE]->(s)",
+            {"rows": list(highlights.values())},
+        )
+
+
+MigrationStep = str | Callable[[kuzu.Connection], None]
+
+# Each entry upgrades the schema by one version; the list index plus one is the
+# version it produces. Steps are Cypher statements or callables taking the
+# connection. Append new steps, never edit shipped ones.
+SCHEMA_MIGRATIONS: Tuple[Tuple[MigrationStep, ...], ...] = (
+    (
+        "CREATE NODE TABLE IF NOT EXISTS Brand(id STRING, name STRING, PRIMARY KEY(id))",
+        "CREATE NODE TABLE IF NOT EXISTS Report(id STRING, brand_id STRING, report_date STRING, overview STRING, metrics STRING, message_id STRING, PRIMARY KEY(id))",
+        "CREATE NODE TABLE IF NOT EXISTS Highlight(id STRING, report_id STRING, headline STRING, impact STRING, source STRING, summary STRING, url STRING, PRIMARY KEY(id))",
+        "CREATE NODE TABLE IF NOT EXISTS BrandReports(report_id STRING, brand_id STRING, created_at STRING, PRIMARY KEY(report_id))",
+        "CREATE NODE TABLE IF NOT EXISTS ReportHighlights(highlight_id STRING, report_id STRING, PRIMARY KEY(highlight_id))",
+    ),
+    # v2: replace the string-keyed link tables with relationships and add sources.
+    (
+        "CREATE NODE TABLE IF NOT EXISTS Source(name STRING, PRIMARY KEY(name))",
+        "CREATE REL TABLE IF NOT EXISTS HAS_REPORT(FROM Brand TO Report, created_at STRING)",
+        "CREATE REL TABLE IF NOT EXISTS HAS_HIGHLIGHT(FROM Report TO Highlight, position INT64)",
+        "CREATE REL TABLE IF NOT EXISTS FROM_SOURCE(FROM Highlight TO Source)",
+        "MATCH (r:Report) MATCH (b:Brand {id: r.brand_id}) MERGE (b)-[e:HAS_REPORT]->(r) SET e.created_at = r.report_date",
+        "MATCH (h:Highlight) MATCH (r:Report {id: h.report_id}) MERGE (r)-[e:HAS_HIGHLIGHT]->(h) "
+        "SET e.position = CAST(list_element(string_split(h.id, ':'), -1) AS INT64)",
+        "MATCH (h:Highlight) MERGE (s:Source {name: h.source}) MERGE (h)-[:FROM_SOURCE]->(s)",
+        "DROP TABLE IF EXISTS BrandReports",
+        "DROP TABLE IF EXISTS ReportHighlights",
+    ),
+    # v3: highlights keyed by content hash and shared by every report that repeats them.
+    (_content_address_highlights,),
+)
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+
+
+@contextmanager
+def _transaction(conn: kuzu.Connection) -> Iterator[kuzu.Connection]:
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        yield conn
+    except BaseException:
+        # Kùzu already rolls back when a statement fails inside the transaction.
+        try:
+            conn.execute("ROLLBACK")
+        except RuntimeError:
+            pass
+        raise
+    conn.execute("COMMIT")
+
+
+class KuzuStorageEngine:
+    """Long-lived handle on one Kùzu database.
+
+    The database is opened once and connections are pooled, so concurrent
+    writers share the same buffer pool instead of re-opening the file per
+    report. Kùzu allows one write transaction at a time, so :meth:`writer`
+    serializes writes while reads proceed in parallel. Schema migrations run at
+    most once per engine and are skipped when the stored version is current.
+    """
+
+    def __init__(self, path: Path, *, pool_size: int = 4) -> None:
+        self.path = Path(path)
+        self.pool_size = pool_size
+        self._database: kuzu.Database | None = None
+        self._idle: List[kuzu.Connection] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._schema_version: int | None = None
+
+    @property
+    def closed(self) -> bool:
+        return self._database is None
+
+    def _acquire(self) -> kuzu.Connection:
+        with self._lock:
+            if self._database is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._database = kuzu.Database(str(self.path))
+                logger.debug("Opened Kùzu database at %s", self.path)
+            if self._idle:
+                return self._idle.pop()
+            return kuzu.Connection(self._database)
+
+    def _release(self, conn: kuzu.Connection) -> None:
+        with self._lock:
+            if self._database is not None and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[kuzu.Connection]:
+        """Borrow a pooled connection for reads."""
+
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[kuzu.Connection]:
+        """Borrow a connection while holding the engine's write lock."""
+
+        with self._write_lock, self.connection() as conn:
+            yield conn
+
+    def _stored_version(self, conn: kuzu.Connection) -> int:
+        try:
+            result = conn.execute("MATCH (v:SchemaVersion) RETURN v.version")
+        except RuntimeError:  # table missing: a fresh or pre-versioning database
+            return 0
+        return int(result.get_next()[0]) if result.has_next() else 0
+
+    def stored_version(self) -> int:
+        """Schema version recorded in the database (0 for a fresh database)."""
+
+        with self.connection() as conn:
+            return self._stored_version(conn)
+
+    def migrate(self) -> int:
+        """Apply pending schema migrations and return the resulting version."""
+
+        with self.writer() as conn:
+            conn.execute(
+                "CREATE NODE TABLE IF NOT EXISTS SchemaVersion(id INT64, version INT64, PRIMARY KEY(id))"
+            )
+            version = self._stored_version(conn)
+            for target, statements in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+                with _transaction(conn):
+                    for statement in statements:
+                        if callable(statement):
+                            statement(conn)
+                        else:
+                            conn.execute(statement)
+                    conn.execute("MERGE (v:SchemaVersion {id: 0}) SET v.version = $version", {"version": target})
+                logger.info("Migrated Kùzu schema at %s to version %d", self.path, target)
+                version = target
+            self._schema_version = version
+            return version
+
+    def ensure_schema(self) -> None:
+        if self._schema_version != SCHEMA_VERSION:
+            self.migrate()
+
+    def close(self) -> None:
+        with self._write_lock, self._lock:
+            idle, self._idle = self._idle, []
+            database, self._database = self._database, None
+            self._schema_version = None
+        for conn in idle:
+            conn.close()
+        if database is not None:
+            database.close()
+
+
+_engines: Dict[Path, KuzuStorageEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_storage_engine(path: Path | None = None) -> KuzuStorageEngine:
+    """Return the process-wide engine for ``path`` (defaults to ``KUZU_PATH``)."""
+
+    database_path = Path(path or KUZU_PATH).resolve()
+    with _engines_lock:
+        engine = _engines.get(database_path)
+        if engine is None:
+            engine = _engines[database_path] = KuzuStorageEngine(database_path)
+        return engine
+
+
+@atexit.register
+def close_storage_engines() -> None:
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.close()
+
+
+# Column layout per node table; the first column is the primary key.
+# ``_EARLIEST_COLUMNS`` only ever move back in time when a row is merged again.
+_NODE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "Brand": ("id", "name"),
+    "Report": ("id", "brand_id", "report_date", "overview", "metrics", "message_id"),
+    "Highlight": ("id", "headline", "impact", "source", "summary", "url", "first_seen"),
+    "Source": ("name",),
+}
+_EARLIEST_COLUMNS: Dict[str, Tuple[str, ...]] = {"Highlight": ("first_seen",)}
+
+
+@dataclass(frozen=True)
+class _RelSpec:
+    """A relationship table whose edges are replaced per ``owner`` endpoint.
+
+    The owner has at most one such edge unless ``many`` is set, in which case
+    its whole edge set is replaced by the buffered one.
+    """
+
+    source: str
+    target: str
+    owner: str
+    properties: Tuple[str, ...] = ()
+    many: bool = False
+
+    @property
+    def owner_table(self) -> str:
+        return self.target if self.owner == "dst" else self.source
+
+
+_REL_SPECS: Dict[str, _RelSpec] = {
+    "HAS_REPORT": _RelSpec("Brand", "Report", owner="dst", properties=("created_at",)),
+    "HAS_HIGHLIGHT": _RelSpec("Report", "Highlight", owner="src", properties=("position",), many=True),
+    "FROM_SOURCE": _RelSpec("Highlight", "Source", owner="src"),
+}
+BULK_COPY_THRESHOLD = 500
+
+
+def _merge_statement(table: str) -> str:
+    key, *columns = _NODE_COLUMNS[table]
+    if not columns:
+        return f"UNWIND $rows AS row MERGE (n:{table} {{{key}: row.{key}}})"
+    earliest = _EARLIEST_COLUMNS.get(table, ())
+    assignments = ", ".join(
+        f"n.{column} = CASE WHEN n.{column} IS NULL OR row.{column} < n.{column} THEN row.{column} ELSE n.{column} END"
+        if column in earliest
+        else f"n.{column} = row.{column}"
+        for column in columns
     )
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS BrandReports(brand_id STRING, report_id STRING, created_at STRING);"
+    return f"UNWIND $rows AS row MERGE (n:{table} {{{key}: row.{key}}}) SET {assignments}"
+
+
+def _rel_statements(table: str) -> Tuple[str, str]:
+    """Statements that replace the owners' existing edges with the buffered ones.
+
+    The first takes the distinct owner keys as ``$owners``, the second the edge
+    rows as ``$rows``.
+    """
+
+    spec = _REL_SPECS[table]
+    source_key, target_key = _NODE_COLUMNS[spec.source][0], _NODE_COLUMNS[spec.target][0]
+    owner_pattern = (
+        f"()-[old:{table}]->(:{spec.target} {{{target_key}: owner}})"
+        if spec.owner == "dst"
+        else f"(:{spec.source} {{{source_key}: owner}})-[old:{table}]->()"
     )
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS ReportHighlights(report_id STRING, highlight_id STRING);"
+    properties = ", ".join(f"{name}: row.{name}" for name in spec.properties)
+    return (
+        f"UNWIND $owners AS owner MATCH {owner_pattern} DELETE old",
+        f"UNWIND $rows AS row MATCH (a:{spec.source} {{{source_key}: row.src}}), "
+        f"(b:{spec.target} {{{target_key}: row.dst}}) CREATE (a)-[:{table} {{{properties}}}]->(b)",
     )
 
 
-def persist_to_kuzu(brand_id: str, report: BrandReport, message_id: str, signals: Iterable[BrandSignal]) -> None:
-    brand_id = _sanitize_brand_id(brand_id)
+class KuzuBulkWriter:
+    """Buffers brands, reports and highlights and writes them in one transaction.
+
+    Every row is an upsert keyed on its primary key (relationships replace the
+    edges of their owning endpoint), so replaying a report, or a whole run, leaves
+    the store unchanged. Each table is written with one parameterized
+    ``UNWIND`` statement; tables with at least ``copy_threshold`` rows load the
+    rows that are new with ``COPY FROM`` a staged file, and only rows that
+    already exist are merged. Thread-safe, so concurrent brands in a batch can
+    share one writer and flush once.
+    """
+
+    def __init__(self, engine: KuzuStorageEngine | None = None, *, copy_threshold: int = BULK_COPY_THRESHOLD) -> None:
+        self.engine = engine or get_storage_engine()
+        self.copy_threshold = copy_threshold
+        self._rows: Dict[str, Dict[object, dict]] = {table: {} for table in (*_NODE_COLUMNS, *_REL_SPECS)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(rows) for rows in self._rows.values())
+
+    def _put(self, table: str, **row: object) -> None:
+        self._rows[table][row[_NODE_COLUMNS[table][0]]] = row
+
+    def _link(self, table: str, src: str, dst: str, **properties: object) -> None:
+        spec = _REL_SPECS[table]
+        key = (src, dst) if spec.many else dst if spec.owner == "dst" else src
+        self._rows[table][key] = {"src": src, "dst": dst, **properties}
+
+    def add_report(
+        self,
+        brand_id: str,
+        report: BrandReport,
+        message_id: str,
+        signals: Iterable[BrandSignal],
+    ) -> str:
+        """Queue ``report`` and its highlights; returns the report id.
+
+        Highlights are keyed by :func:`signal_key`, so a story carried by
+        several reports is one node with an edge from each of them; its
+        ``first_seen`` is the earliest report date (or ``signal.first_seen``).
+        """
+
+        brand_id = _sanitize_brand_id(brand_id)
+        report_id = f"{brand_id}:{report.report_date.isoformat()}:{message_id}"
+        report_date = report.report_date.isoformat()
+        with self._lock:
+            self._put("Brand", id=brand_id, name=brand_id.title())
+            self._put(
+                "Report",
+                id=report_id,
+                brand_id=brand_id,
+                report_date=report_date,
+                overview=report.overview or "",
+                metrics=json.dumps(report.metrics, sort_keys=True),
+                message_id=message_id,
+            )
+            self._link("HAS_REPORT", brand_id, report_id, created_at=report_date)
+            for index, signal in enumerate(signals):
+                highlight_id = signal_key(signal)
+                first_seen = min(filter(None, (signal.first_seen, report.report_date))).isoformat()
+                buffered = self._rows["Highlight"].get(highlight_id)
+                if buffered is not None:
+                    first_seen = min(first_seen, buffered["first_seen"])
+                self._put(
+                    "Highlight",
+                    id=highlight_id,
+                    headline=signal.headline,
+                    impact=signal.impact,
+                    source=signal.source,
+                    summary=signal.summary or "",
+                    url=signal.url or "",
+                    first_seen=first_seen,
+                )
+                self._put("Source", name=signal.source)
+                self._link("HAS_HIGHLIGHT", report_id, highlight_id, position=index)
+                self._link("FROM_SOURCE", highlight_id, signal.source)
+        return report_id
+
+    def _existing_keys(self, conn: kuzu.Connection, table: str, keys: List[str]) -> set[str]:
+        key = _NODE_COLUMNS[table][0]
+        result = conn.execute(f"MATCH (n:{table}) WHERE n.{key} IN $keys RETURN n.{key}", {"keys": keys})
+        existing = set()
+        while result.has_next():
+            existing.add(result.get_next()[0])
+        return existing
+
+    def _copy(self, conn: kuzu.Connection, table: str, columns: Tuple[str, ...], rows: List[dict], staging: Path) -> None:
+        path = staging / f"{table}.csv"
+        with path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            writer.writerows([row[column] for column in columns] for row in rows)
+        # Values may contain quoted newlines, which Kùzu's parallel CSV reader rejects.
+        literal = path.as_posix().replace("\\", "\\\\").replace("'", "\\'")
+        conn.execute(f"COPY {table} FROM '{literal}' (HEADER=true, PARALLEL=false)")
+
+    def _write(self, conn: kuzu.Connection, pending: Dict[str, List[dict]], staging: Path) -> None:
+        bulk = {table for table, rows in pending.items() if len(rows) >= self.copy_threshold}
+        # Existence has to be checked before anything is written: a node created
+        # by this flush has no edges yet, so its relationships can be copied too.
+        lookups = {table for table in bulk if table in _NODE_COLUMNS}
+        lookups |= {_REL_SPECS[table].owner_table for table in bulk if table in _REL_SPECS}
+        existing = {
+            table: self._existing_keys(conn, table, [row[_NODE_COLUMNS[table][0]] for row in pending[table]])
+            for table in lookups
+        }
+
+        for table, rows in pending.items():
+            if table in _NODE_COLUMNS:
+                key = _NODE_COLUMNS[table][0]
+                if table in bulk:
+                    fresh = [row for row in rows if row[key] not in existing[table]]
+                    rows = [row for row in rows if row[key] in existing[table]]
+                    if fresh:
+                        self._copy(conn, table, _NODE_COLUMNS[table], fresh, staging)
+                if rows:
+                    conn.execute(_merge_statement(table), {"rows": rows})
+                continue
+
+            spec = _REL_SPECS[table]
+            if table in bulk:
+                known = existing[spec.owner_table]
+                fresh = [row for row in rows if row[spec.owner] not in known]
+                rows = [row for row in rows if row[spec.owner] in known]
+                if fresh:
+                    self._copy(conn, table, ("src", "dst", *spec.properties), fresh, staging)
+            if rows:
+                delete, create = _rel_statements(table)
+                conn.execute(delete, {"owners": list(dict.fromkeys(row[spec.owner] for row in rows))})
+                conn.execute(create, {"rows": rows})
+
+    def flush(self) -> Dict[str, int]:
+        """Write everything buffered so far; returns the row count per table.
+
+        Nothing is written when any statement fails: the transaction is rolled
+        back, the rows stay buffered and the error propagates.
+        """
+
+        with self._lock:
+            pending = {table: list(rows.values()) for table, rows in self._rows.items() if rows}
+        if not pending:
+            return {}
+
+        self.engine.ensure_schema()
+        with self.engine.writer() as conn, tempfile.TemporaryDirectory(prefix="kuzu-stage-") as staging:
+            with _transaction(conn):
+                self._write(conn, pending, Path(staging))
+
+        with self._lock:
+            # Rows re-queued while the flush ran are newer and stay buffered.
+            for table, rows in pending.items():
+                written = {id(row) for row in rows}
+                buffered = self._rows[table]
+                for key, row in list(buffered.items()):
+                    if id(row) in written:
+                        del buffered[key]
+        return {table: len(rows) for table, rows in pending.items()}
+
+
+def persist_to_kuzu(
+    brand_id: str,
+    report: BrandReport,
+    message_id: str,
+    signals: Iterable[BrandSignal],
+    *,
+    engine: KuzuStorageEngine | None = None,
+) -> None:
+    writer = KuzuBulkWriter(engine)
+    writer.add_report(brand_id, report, message_id, signals)
     try:
-        conn = _get_connection()
-        _ensure_schema(conn)
+        writer.flush()
     except Exception as error:  # pragma: no cover - environment specific
-        logger.warning("Skipping Kùzu persistence: %s", error)
-        return
+        logger.warning("Skipping Kùzu persistence for %s: %s", brand_id, error)
 
-    brand_node_id = _escape(brand_id)
-    brand_name = _escape(brand_id.title())
-    try:
-        conn.execute(f"INSERT INTO Brand(id, name) VALUES ('{brand_node_id}', '{brand_name}')")
-    except Exception as error:
-        logger.debug("Brand insert skipped (likely exists): %s", error)
 
-    report_id = _escape(f"{brand_id}:{report.report_date.isoformat()}:{message_id}")
-    overview = _escape(report.overview or "")
-    metrics_json = _escape(json.dumps(report.metrics, sort_keys=True))
-    message = _escape(message_id)
-    report_date_str = _escape(report.report_date.isoformat())
+PRUNE_BATCH_SIZE = 500
 
-    try:
-        conn.execute(
-            "INSERT INTO Report(id, brand_id, report_date, overview, metrics, message_id) "
-            f"VALUES ('{report_id}', '{brand_node_id}', '{report_date_str}', '{overview}', '{metrics_json}', '{message}')"
-        )
-    except Exception as error:  # pragma: no cover - duplicates handled by skipping
-        logger.debug("Report insert skipped: %s", error)
-        return
 
-    try:
-        conn.execute(
-            f"INSERT INTO BrandReports(brand_id, report_id, created_at) VALUES ('{brand_node_id}', '{report_id}', '{report_date_str}')"
-        )
-    except Exception as error:
-        logger.debug("BrandReports edge insert skipped: %s", error)
+def prune_reports(
+    before: date,
+    *,
+    batch_size: int = PRUNE_BATCH_SIZE,
+    engine: KuzuStorageEngine | None = None,
+) -> Tuple[int, int]:
+    """Delete reports dated before ``before`` and the highlights no remaining report carries.
 
-    for index, signal in enumerate(signals):
-        highlight_id = _escape(f"{report_id}:{index}")
-        headline = _escape(signal.headline)
-        impact = _escape(signal.impact)
-        source = _escape(signal.source)
-        summary = _escape(signal.summary or "")
-        url = _escape(signal.url or "")
+    Works through ``batch_size`` reports per transaction so the write lock is
+    released between batches. Returns the number of reports and highlights
+    deleted.
+    """
 
-        try:
-            conn.execute(
-                "INSERT INTO Highlight(id, report_id, headline, impact, source, summary, url) "
-                f"VALUES ('{highlight_id}', '{report_id}', '{headline}', '{impact}', '{source}', '{summary}', '{url}')"
+    engine = engine or get_storage_engine()
+    engine.ensure_schema()
+    reports = highlights = 0
+    while True:
+        with engine.writer() as conn, _transaction(conn):
+            result = conn.execute(
+                "MATCH (r:Report) WHERE r.report_date < $before RETURN r.id LIMIT $limit",
+                {"before": before.isoformat(), "limit": batch_size},
             )
-            conn.execute(
-                f"INSERT INTO ReportHighlights(report_id, highlight_id) VALUES ('{report_id}', '{highlight_id}')"
+            report_ids = [row[0] for row in result.get_all()]
+            if not report_ids:
+                break
+            result = conn.execute(
+                "MATCH (r:Report)-[:HAS_HIGHLIGHT]->(h:Highlight) WHERE r.id IN $ids RETURN DISTINCT h.id",
+                {"ids": report_ids},
             )
-        except Exception as error:
-            logger.debug("Highlight insert skipped for %s: %s", highlight_id, error)
-            continue
+            candidates = [row[0] for row in result.get_all()]
+            conn.execute("MATCH (r:Report) WHERE r.id IN $ids DETACH DELETE r", {"ids": report_ids})
+            result = conn.execute(
+                "MATCH (h:Highlight) WHERE h.id IN $ids AND NOT EXISTS { MATCH (:Report)-[:HAS_HIGHLIGHT]->(h) } "
+                "DETACH DELETE h RETURN count(*)",
+                {"ids": candidates},
+            )
+            highlights += result.get_next()[0]
+        reports += len(report_ids)
+        logger.info("Pruned %d reports before %s from %s", reports, before.isoformat(), engine.path)
+        if len(report_ids) < batch_size:
+            break
+    return reports, highlights
+
+
+__all__ = [
+    "HistoryEntry",
+    "KuzuBulkWriter",
+    "KuzuStorageEngine",
+    "ReportHistory",
+    "SCHEMA_VERSION",
+    "close_storage_engines",
+    "default_report_history",
+    "get_storage_engine",
+    "persist_raw_signals",
+    "persist_report_summary",
+    "persist_to_kuzu",
+    "prune_reports",
+]
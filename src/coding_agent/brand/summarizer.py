@@ -2,96 +2,395 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import Counter
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field, replace
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Sequence, Set, Tuple
 
-from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.models import IMPACT_LEVELS, BrandReport, BrandSignal, SignalBatch
+from coding_agent.brand.neardup import MinHashLSH
+from coding_agent.brand.scoring import ScoreContext, ScoringPolicy
+
+_IMPACT_RANK = {name: rank for rank, name in enumerate(IMPACT_LEVELS)}
+
+
+def _impact_rank(impact: str) -> int:
+    return _IMPACT_RANK.get(impact, len(_IMPACT_RANK))
+
+
+def _normalize(headline: str, summary: str | None) -> Tuple[str, str | None]:
+    headline = " ".join(headline.split())
+    summary = " ".join(summary.split()) if summary else None
+    return headline, summary or None
+
+
+def _dedupe_key(headline: str, summary: str | None) -> Tuple[str, str | None]:
+    return headline.lower(), summary.lower() if summary else None
+
+
+def _normalized_copy(signal: BrandSignal, headline: str, summary: str | None) -> BrandSignal:
+    return signal.trusted_copy(headline=headline, summary=summary)
+
+
+def unique_rows(batch: SignalBatch) -> SignalBatch:
+    """Rows of ``batch`` with whitespace-normalized text, minus blank headlines and exact repeats.
+
+    Repeats compare headline and summary case-insensitively; the first one wins.
+    """
+
+    seen = set()
+    kept: list[int] = []
+    headlines: list[str] = []
+    summaries: list[str | None] = []
+    for index, (raw_headline, raw_summary) in enumerate(zip(batch.headlines, batch.summaries)):
+        headline, summary = _normalize(raw_headline, raw_summary)
+        key = _dedupe_key(headline, summary)
+        if headline and key not in seen:
+            seen.add(key)
+            kept.append(index)
+            headlines.append(headline)
+            summaries.append(summary)
+    return replace(batch.take(kept), headlines=tuple(headlines), summaries=tuple(summaries))
+
+
+def collapse_near_duplicates(
+    signals: Sequence[BrandSignal] | SignalBatch, lsh: MinHashLSH
+) -> tuple[BrandSignal, ...]:
+    """Keep one signal per near-duplicate headline cluster, weighted by ``cluster_size``.
+
+    The representative is the cluster's highest-impact member (the earliest on
+    ties). Results are ordered by cluster size, largest first, and otherwise
+    keep input order. Only the representatives are built as ``BrandSignal``.
+    """
+
+    batch = signals if isinstance(signals, SignalBatch) else SignalBatch.from_signals(signals)
+    # Codes of the standard levels are their ranks; any other impact ranks last.
+    ranks = [min(code, len(IMPACT_LEVELS)) for code in batch.impact_codes]
+    representatives = []
+    for members in lsh.cluster(batch.headlines):
+        best = min(members, key=lambda index: (ranks[index], index))
+        size = sum(batch.cluster_sizes[index] for index in members)
+        representatives.append((members[0], size, best))
+    representatives.sort(key=lambda item: (-item[1], item[0]))
+    return tuple(
+        batch.signal(best).trusted_copy(cluster_size=size) for _first, size, best in representatives
+    )
+
+
+def _carried_by(signal: BrandSignal) -> str:
+    return f" (carried by {signal.cluster_size} outlets)" if signal.cluster_size > 1 else ""
+
+
+_FALLBACK = BrandSignal(
+    source="internal",
+    headline="No external signals available",
+    impact="low",
+    summary="The automated collector did not find new items within the sampling window.",
+)
+
+
+def _build_report(
+    brand_id: str,
+    report_date,
+    highlights: Tuple[BrandSignal, ...],
+    *,
+    total: int,
+    impact_counts: Mapping[str, int],
+    unique_sources: int,
+    clusters: int,
+    syndicated: int,
+    scoring: ScoringPolicy | None = None,
+) -> BrandReport:
+    """Assemble the report from its highlights and counters.
+
+    ``total``, ``impact_counts`` and ``unique_sources`` count unique signals
+    before near-duplicates are collapsed; ``clusters`` counts the stories
+    they collapse into. With ``scoring`` the highlights are cut to its
+    top-scoring ones, best first.
+    """
+
+    if not highlights:
+        highlights, total, impact_counts, unique_sources = (_FALLBACK,), 1, {"low": 1}, 1
+        clusters, syndicated = 1, 0
+    elif scoring is not None:
+        highlights = scoring.select(highlights)
+
+    share_high = round(impact_counts.get("high", 0) / total, 2) if total else 0.0
+    share_medium = round(impact_counts.get("medium", 0) / total, 2) if total else 0.0
+
+    top_signal = next((s for s in highlights if s.impact == "high"), highlights[0])
+
+    overview_parts: list[str] = []
+    overview_parts.append(
+        f"Key highlight: {top_signal.headline}{_carried_by(top_signal)}."
+    )
+    overview_parts.append(
+        f"Signal mix includes {impact_counts.get('high', 0)} high-impact and {impact_counts.get('medium', 0)} medium-impact items across {unique_sources} sources."
+    )
+    overview = " ".join(overview_parts)
+
+    actions: list[str] = []
+    for signal in highlights:
+        if signal.impact == "high":
+            actions.append(f"Investigate: {signal.headline}")
+        elif signal.impact == "medium":
+            actions.append(f"Monitor: {signal.headline}")
+        if len(actions) == 4:
+            break
+    if not actions:
+        actions.append("Monitor brand sentiment for additional changes.")
+    if len(actions) == 1:
+        actions.append("Review competitor activity for emerging campaigns.")
+
+    risks: list[str] = []
+    if impact_counts.get("high", 0) == 0:
+        risks.append("No high-impact external signals detected; consider manual scan to confirm stability.")
+    if total < 3:
+        risks.append("Limited signal volume; treat conclusions as directional.")
+
+    metrics = {
+        "total_signals": float(total),
+        "high_signals": float(impact_counts.get("high", 0)),
+        "medium_signals": float(impact_counts.get("medium", 0)),
+        "low_signals": float(impact_counts.get("low", 0)),
+        "high_signal_ratio": float(share_high),
+        "medium_signal_ratio": float(share_medium),
+        "unique_sources": float(unique_sources),
+        "clusters": float(clusters),
+        "syndicated_copies": float(syndicated),
+    }
+
+    return BrandReport.trusted(
+        brand_id=brand_id,
+        report_date=report_date,
+        highlights=highlights,
+        metrics=metrics,
+        actions=tuple(actions),
+        overview=overview,
+        risks=tuple(risks),
+    )
 
 
 @dataclass
 class HeuristicSummarizer:
-    """Simple rule-based summarizer suitable for MVP/testing."""
+    """Simple rule-based summarizer suitable for MVP/testing.
 
-    def summarize(self, brand_id: str, report_date, signals: Iterable[BrandSignal]) -> BrandReport:
-        unique_signals: list[BrandSignal] = []
-        seen = set()
-        for signal in signals:
-            normalized_headline = " ".join(signal.headline.split())
-            normalized_summary = " ".join(signal.summary.split()) if signal.summary else None
-            key = (normalized_headline.lower(), normalized_summary.lower() if normalized_summary else None)
-            if normalized_headline and key not in seen:
-                seen.add(key)
-                unique_signals.append(
-                    BrandSignal(
-                        source=signal.source,
-                        headline=normalized_headline,
-                        impact=signal.impact,
-                        url=signal.url,
-                        summary=normalized_summary,
-                    )
-                )
-
-        signals_tuple = tuple(unique_signals)
-        if not signals_tuple:
-            fallback = BrandSignal(
-                source="internal",
-                headline="No external signals available",
-                impact="low",
-                summary="The automated collector did not find new items within the sampling window.",
-            )
-            signals_tuple = (fallback,)
+    Exact repeats are dropped first, then syndicated copies are collapsed
+    with MinHash/LSH into one highlight each (see :func:`collapse_near_duplicates`).
+    Every cluster becomes a highlight unless a ``scoring`` policy ranks and caps them.
+    """
 
-        impact_counts = Counter(signal.impact for signal in signals_tuple)
-        total = len(signals_tuple)
-        share_high = round(impact_counts.get("high", 0) / total, 2) if total else 0.0
-        share_medium = round(impact_counts.get("medium", 0) / total, 2) if total else 0.0
-        unique_sources = len({signal.source for signal in signals_tuple})
+    lsh: MinHashLSH = field(default_factory=MinHashLSH)
+    scoring: ScoringPolicy | None = None
 
-        top_signal = next((s for s in signals_tuple if s.impact == "high"), signals_tuple[0])
+    def summarize(
+        self, brand_id: str, report_date, signals: Iterable[BrandSignal] | SignalBatch
+    ) -> BrandReport:
+        batch = signals if isinstance(signals, SignalBatch) else SignalBatch.from_signals(signals)
+        unique = unique_rows(batch)
 
-        overview_parts: list[str] = []
-        overview_parts.append(
-            f"Key highlight: {top_signal.headline}."
-        )
-        overview_parts.append(
-            f"Signal mix includes {impact_counts.get('high', 0)} high-impact and {impact_counts.get('medium', 0)} medium-impact items across {unique_sources} sources."
+        signals_tuple = collapse_near_duplicates(unique, self.lsh)
+        return _build_report(
+            brand_id,
+            report_date,
+            signals_tuple,
+            total=len(unique),
+            impact_counts=unique.impact_counts(),
+            unique_sources=len(set(unique.sources)),
+            clusters=len(signals_tuple),
+            syndicated=sum(signal.cluster_size - 1 for signal in signals_tuple),
+            scoring=self.scoring,
         )
-        overview = " ".join(overview_parts)
-
-        actions: list[str] = []
-        for signal in signals_tuple:
-            if signal.impact == "high":
-                actions.append(f"Investigate: {signal.headline}")
-            elif signal.impact == "medium":
-                actions.append(f"Monitor: {signal.headline}")
-        if not actions:
-            actions.append("Monitor brand sentiment for additional changes.")
-        if len(actions) == 1:
-            actions.append("Review competitor activity for emerging campaigns.")
-
-        risks: list[str] = []
-        if impact_counts.get("high", 0) == 0:
-            risks.append("No high-impact external signals detected; consider manual scan to confirm stability.")
-        if total < 3:
-            risks.append("Limited signal volume; treat conclusions as directional.")
-
-        metrics = {
-            "total_signals": total,
-            "high_signals": impact_counts.get("high", 0),
-            "medium_signals": impact_counts.get("medium", 0),
-            "low_signals": impact_counts.get("low", 0),
-            "high_signal_ratio": share_high,
-            "medium_signal_ratio": share_medium,
-            "unique_sources": unique_sources,
+
+
+# Source counts are only known for the whole input, so retention scores every source alike.
+_RETENTION_CONTEXT = ScoreContext(source_counts={}, total=0)
+
+
+@dataclass
+class _Cluster:
+    first: int
+    signal: BrandSignal
+    rank: int
+    index: int
+    size: int
+    members: List[int]
+    keys: List[str]
+    version: int = 0
+
+
+class _TopClusters:
+    """Running counters plus the ``limit`` highest-priority near-duplicate clusters."""
+
+    def __init__(self, summarizer: "StreamingSummarizer") -> None:
+        self.lsh = summarizer.lsh
+        self.scoring = summarizer.scoring
+        self.limit = max(summarizer.max_highlights, summarizer.scoring.max_highlights if summarizer.scoring else 0)
+        self.member_signatures = summarizer.member_signatures
+        # Exact repeat detection: keys of retained clusters, plus the keys of evicted ones up to seen_capacity.
+        self.keys: Set[str] = set()
+        self.evicted_keys: Dict[str, None] = {}
+        self.seen_capacity = summarizer.seen_capacity
+        self.clusters: Dict[int, _Cluster] = {}
+        self.owner: Dict[int, int] = {}  # indexed member -> first index of its cluster
+        self.signatures: Dict[int, Tuple[int, ...]] = {}
+        self.buckets: Dict[Tuple[int, ...], List[int]] = {}
+        self.heap: List[Tuple[Tuple[float, ...], int, int]] = []
+        self.count = 0  # unique signals
+        self.cluster_count = 0
+        self.weight = 0
+        self.impacts: Counter = Counter()
+        self.sources: Set[str] = set()
+
+    def _priority(self, cluster: _Cluster) -> Tuple[float, ...]:
+        # Evicted first: lower score (or impact, then fewer copies), then older first_seen, then later arrival.
+        recency = cluster.signal.first_seen.toordinal() if cluster.signal.first_seen else 0
+        if self.scoring is not None:
+            score = self.scoring.scorer(cluster.signal.trusted_copy(cluster_size=cluster.size), _RETENTION_CONTEXT)
+            return (score, recency, -cluster.first)
+        return (-cluster.rank, cluster.size, recency, -cluster.first)
+
+    def _push(self, cluster: _Cluster) -> None:
+        cluster.version += 1
+        heapq.heappush(self.heap, (self._priority(cluster), cluster.version, cluster.first))
+        if len(self.heap) > 4 * self.limit + 16:
+            self.heap = [(self._priority(c), c.version, c.first) for c in self.clusters.values()]
+            heapq.heapify(self.heap)
+
+    def _index(self, cluster: _Cluster, member: int, signature: Tuple[int, ...]) -> None:
+        if len(cluster.members) >= self.member_signatures:
+            return
+        cluster.members.append(member)
+        self.owner[member] = cluster.first
+        self.signatures[member] = signature
+        for key in self.lsh.band_keys(signature):
+            self.buckets.setdefault(key, []).append(member)
+
+    def _evict(self) -> None:
+        while len(self.clusters) > self.limit:
+            _priority, version, first = heapq.heappop(self.heap)
+            cluster = self.clusters.get(first)
+            if cluster is None or cluster.version != version:
+                continue
+            del self.clusters[first]
+            self.keys.difference_update(cluster.keys)
+            for key in cluster.keys:
+                self.evicted_keys[key] = None
+            while len(self.evicted_keys) > self.seen_capacity:
+                del self.evicted_keys[next(iter(self.evicted_keys))]
+            for member in cluster.members:
+                for key in self.lsh.band_keys(self.signatures.pop(member)):
+                    bucket = self.buckets[key]
+                    bucket.remove(member)
+                    if not bucket:
+                        del self.buckets[key]
+                del self.owner[member]
+
+    def add(self, signal: BrandSignal) -> None:
+        headline, summary = _normalize(signal.headline, signal.summary)
+        if not headline:
+            return
+        key = "\x1f".join(filter(None, _dedupe_key(headline, summary)))
+        if key in self.keys or key in self.evicted_keys:
+            return
+        self.sources.add(signal.source)
+        self.impacts[signal.impact] += 1
+        self.weight += signal.cluster_size
+        index = self.count
+        self.count += 1
+
+        signature = self.lsh.signature(headline)
+        roots = {
+            self.owner[member]
+            for band_key in self.lsh.band_keys(signature)
+            for member in self.buckets.get(band_key, ())
+            if self.lsh.similarity(signature, self.signatures[member]) >= self.lsh.threshold
         }
+        rank = _impact_rank(signal.impact)
+        if not roots:
+            normalized = _normalized_copy(signal, headline, summary)
+            cluster = _Cluster(
+                first=index, signal=normalized, rank=rank, index=index, size=signal.cluster_size, members=[], keys=[]
+            )
+            self.clusters[index] = cluster
+            self.cluster_count += 1
+            cluster.keys.append(key)
+            self.keys.add(key)
+            self._index(cluster, index, signature)
+            self._push(cluster)
+            self._evict()
+            return
 
-        return BrandReport(
-            brand_id=brand_id,
-            report_date=report_date,
-            highlights=signals_tuple,
-            metrics=metrics,
-            actions=tuple(actions[:4]),
-            overview=overview,
-            risks=tuple(risks),
+        target = self.clusters[min(roots)]
+        for root in sorted(roots - {target.first}):
+            # The new signal bridges two stories that were kept apart so far.
+            other = self.clusters.pop(root)
+            self.cluster_count -= 1
+            target.size += other.size
+            if (other.rank, other.index) < (target.rank, target.index):
+                target.signal, target.rank, target.index = other.signal, other.rank, other.index
+            for member in other.members:
+                self.owner[member] = target.first
+            target.members.extend(other.members)
+            target.keys.extend(other.keys)
+        target.size += signal.cluster_size
+        if (rank, index) < (target.rank, target.index):
+            target.signal = _normalized_copy(signal, headline, summary)
+            target.rank, target.index = rank, index
+        target.keys.append(key)
+        self.keys.add(key)
+        self._index(target, index, signature)
+        self._push(target)
+
+    def highlights(self) -> Tuple[BrandSignal, ...]:
+        ordered = sorted(self.clusters.values(), key=lambda cluster: (-cluster.size, cluster.first))
+        return tuple(cluster.signal.trusted_copy(cluster_size=cluster.size) for cluster in ordered)
+
+
+@dataclass
+class StreamingSummarizer:
+    """Single-pass summarizer whose memory depends on ``max_highlights``, not on the input size.
+
+    ``signals`` may be any iterator and is consumed once. Totals, impact mix
+    and sources are kept as running counters while only the top
+    ``max_highlights`` near-duplicate clusters are held, in a heap keyed by
+    impact, copy count and recency, or with a ``scoring`` policy by its
+    scorer's per-signal score (impact, keyword hits, copy count) and
+    recency. Exact repeats are matched against the keys of the retained
+    clusters' members and the keys of the last ``seen_capacity`` members of
+    evicted clusters, so a distinct signal is never dropped as a repeat. While nothing is evicted the report equals
+    :class:`HeuristicSummarizer`'s; after an eviction, a late rewording of an
+    evicted story starts a new cluster and is counted again. The ``scoring``
+    policy then ranks the retained clusters and keeps its top ones; source
+    diversity only affects that final ranking, within the retained set.
+    """
+
+    max_highlights: int = 50
+    lsh: MinHashLSH = field(default_factory=MinHashLSH)
+    scoring: ScoringPolicy | None = None
+    seen_capacity: int = 100_000
+    member_signatures: int = 16
+
+    def __post_init__(self) -> None:
+        if self.max_highlights < 1:
+            raise ValueError("max_highlights must be positive")
+
+    def summarize(self, brand_id: str, report_date: date, signals: Iterable[BrandSignal]) -> BrandReport:
+        top = _TopClusters(self)
+        for signal in signals:
+            top.add(signal)
+        return _build_report(
+            brand_id,
+            report_date,
+            top.highlights(),
+            total=top.count,
+            impact_counts=top.impacts,
+            unique_sources=len(top.sources),
+            clusters=top.cluster_count,
+            syndicated=top.weight - top.cluster_count,
+            scoring=self.scoring,
         )
+
+
+__all__ = ["HeuristicSummarizer", "StreamingSummarizer", "collapse_near_duplicates", "unique_rows"]
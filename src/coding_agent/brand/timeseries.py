@@ -0,0 +1,227 @@
+"""Append-only, array-backed per-brand metric time series."""
+
+from __future__ import annotations
+
+import fcntl
+import math
+import operator
+import os
+import threading
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Tuple
+
+from coding_agent.brand.paths import DATA_ROOT, sanitize_brand_id
+
+_DAYS = "days.i32"
+_PENDING = "rewrite.pending"
+_VALUES = ".f64"
+_NAN = float("nan")
+
+
+def _read(path: Path, typecode: str, start: int = 0, stop: int | None = None) -> array:
+    values = array(typecode)
+    try:
+        with path.open("rb") as handle:
+            handle.seek(start * values.itemsize)
+            data = handle.read(-1 if stop is None else (stop - start) * values.itemsize)
+    except FileNotFoundError:
+        return values
+    values.frombytes(data[: len(data) - len(data) % values.itemsize])
+    return values
+
+
+@dataclass(frozen=True)
+class MetricSeries:
+    """One metric of one brand over a date range; missing days are NaN."""
+
+    brand_id: str
+    metric: str
+    days: Tuple[date, ...]
+    values: array
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def deltas(self) -> array:
+        """Change from the previous stored day; the first entry is NaN."""
+
+        values = self.values
+        if not values:
+            return array("d")
+        return array("d", [_NAN]) + array("d", map(operator.sub, values[1:], values))
+
+    def moving_average(self, window: int) -> array:
+        """Trailing mean over the last ``window`` stored days, skipping missing values.
+
+        Computed from prefix sums, so the cost does not depend on ``window``.
+        """
+
+        if window < 1:
+            raise ValueError("window must be positive")
+        present = [not math.isnan(value) for value in self.values]
+        sums = list(accumulate((value if ok else 0.0 for value, ok in zip(self.values, present)), initial=0.0))
+        counts = list(accumulate(present, initial=0))
+        averages = array("d")
+        for end in range(1, len(sums)):
+            begin = max(0, end - window)
+            count = counts[end] - counts[begin]
+            averages.append((sums[end] - sums[begin]) / count if count else _NAN)
+        return averages
+
+
+class MetricsTimeSeries:
+    """Typed columns of report metrics, one directory per brand.
+
+    ``days.i32`` holds the report dates as ``int32`` ordinals in ascending
+    order and every metric has a parallel ``<metric>.f64`` column of doubles
+    (NaN where a report lacked the metric). Appending a later day adds one
+    fixed-width row to each file; re-reporting the last day overwrites that
+    row in place and only an out-of-order backfill rewrites the columns.
+    Metric columns are written before the day column, which acts as the
+    commit point, so rows left by a crash are ignored and trimmed by the next
+    write. A backfill writes every new column to a temporary file and records
+    the renames in ``rewrite.pending`` before applying them, ``days.i32``
+    last; a rewrite interrupted part-way is finished by the next writer. Range queries bisect the day column and read only the matching
+    slice of the metric column. Writers are serialized per brand with
+    ``flock``, so several processes may share a root.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = Path(root or DATA_ROOT) / ".metrics"
+        self._lock = threading.Lock()
+
+    def _folder(self, brand_id: str) -> Path:
+        return self.root / sanitize_brand_id(brand_id)
+
+    @contextmanager
+    def _locked(self, folder: Path) -> Iterator[None]:
+        folder.mkdir(parents=True, exist_ok=True)
+        with self._lock, (folder / ".lock").open("a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            self._roll_forward(folder)
+            yield
+
+    @staticmethod
+    def _roll_forward(folder: Path) -> None:
+        """Apply the renames of an interrupted rewrite, in their recorded order."""
+
+        pending = folder / _PENDING
+        try:
+            renames = pending.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in renames:
+            name, tmp_name = line.split("\t")
+            if (folder / tmp_name).exists():
+                os.replace(folder / tmp_name, folder / name)
+        pending.unlink()
+
+    def _columns(self, folder: Path) -> Dict[str, Path]:
+        return {path.name[: -len(_VALUES)]: path for path in folder.glob(f"*{_VALUES}")}
+
+    def metrics(self, brand_id: str) -> Tuple[str, ...]:
+        return tuple(sorted(self._columns(self._folder(brand_id))))
+
+    def days(self, brand_id: str) -> Tuple[date, ...]:
+        return tuple(map(date.fromordinal, _read(self._folder(brand_id) / _DAYS, "i")))
+
+    def append(self, brand_id: str, report_date: date, metrics: Mapping[str, float]) -> None:
+        """Record ``metrics`` for ``report_date``, replacing any row already stored for that day."""
+
+        folder = self._folder(brand_id)
+        ordinal = report_date.toordinal()
+        with self._locked(folder):
+            days = _read(folder / _DAYS, "i")
+            columns = self._columns(folder)
+            for name in metrics:
+                columns.setdefault(name, folder / f"{name}{_VALUES}")
+            row = {name: float(metrics.get(name, _NAN)) for name in columns}
+
+            if days and ordinal < days[-1]:
+                self._rewrite(folder, days, columns, ordinal, row)
+                return
+            replace = bool(days) and ordinal == days[-1]
+            position = len(days) - 1 if replace else len(days)
+            for name, path in columns.items():
+                with path.open("ab") as handle:
+                    # Pad new columns with NaN and trim rows a crash left past the commit point.
+                    size = handle.tell() // 8
+                    if size < position:
+                        handle.write(array("d", [_NAN] * (position - size)).tobytes())
+                    handle.truncate(position * 8)
+                    handle.write(array("d", [row[name]]).tobytes())
+            if not replace:
+                with (folder / _DAYS).open("ab") as handle:
+                    handle.truncate(len(days) * 4)
+                    handle.write(array("i", [ordinal]).tobytes())
+
+    def _rewrite(
+        self, folder: Path, days: array, columns: Dict[str, Path], ordinal: int, row: Dict[str, float]
+    ) -> None:
+        index = bisect_left(days, ordinal)
+        insert = index == len(days) or days[index] != ordinal
+        for leftover in folder.glob("*.tmp"):
+            leftover.unlink()
+        suffix = f".{uuid.uuid4().hex}.tmp"
+        staged: Dict[Path, bytes] = {}
+        for name, path in columns.items():
+            values = _read(path, "d", 0, len(days))
+            values.extend([_NAN] * (len(days) - len(values)))
+            if insert:
+                values.insert(index, row[name])
+            else:
+                values[index] = row[name]
+            staged[path] = values.tobytes()
+        if insert:
+            days.insert(index, ordinal)
+            # Last, so the day column never commits rows its columns do not hold yet.
+            staged[folder / _DAYS] = days.tobytes()
+        for path, data in staged.items():
+            path.with_name(path.name + suffix).write_bytes(data)
+        tmp_pending = folder / f"{_PENDING}{suffix}"
+        tmp_pending.write_text("".join(f"{path.name}\t{path.name}{suffix}\n" for path in staged), encoding="utf-8")
+        os.replace(tmp_pending, folder / _PENDING)
+        self._roll_forward(folder)
+
+    def series(
+        self, brand_id: str, metric: str, start: date | None = None, end: date | None = None
+    ) -> MetricSeries:
+        """``metric`` for ``brand_id`` between ``start`` and ``end`` (inclusive)."""
+
+        folder = self._folder(brand_id)
+        days = _read(folder / _DAYS, "i")
+        lo = bisect_left(days, start.toordinal()) if start else 0
+        hi = bisect_right(days, end.toordinal()) if end else len(days)
+        hi = max(lo, hi)
+        values = _read(folder / f"{metric}{_VALUES}", "d", lo, hi)
+        values.extend([_NAN] * (hi - lo - len(values)))
+        return MetricSeries(
+            brand_id=brand_id,
+            metric=metric,
+            days=tuple(map(date.fromordinal, days[lo:hi])),
+            values=values,
+        )
+
+
+_default_series: MetricsTimeSeries | None = None
+_default_lock = threading.Lock()
+
+
+def default_metrics_series() -> MetricsTimeSeries:
+    """Process-wide store under ``DATA_ROOT/.metrics``."""
+
+    global _default_series
+    with _default_lock:
+        if _default_series is None:
+            _default_series = MetricsTimeSeries()
+        return _default_series
+
+
+__all__ = ["MetricSeries", "MetricsTimeSeries", "default_metrics_series"]
@@ -0,0 +1,190 @@
+"""Pooled HTTP transport shared by network providers and email senders."""
+
+from __future__ import annotations
+
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NameResolutionError, NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from coding_agent.brand.resolver import DnsCache, default_resolver, is_internal_address
+
+DEFAULT_USER_AGENT = "BrandOS/0.1 (+https://github.com/amadad/brandOS)"
+
+
+class _PinnedConnectionMixin:
+    """Opens the socket against addresses from the shared ``DnsCache``.
+
+    urllib3 keeps the TCP target in ``_dns_host`` separately from ``host``, so TLS
+    SNI, certificate checks and the ``Host`` header still use the hostname.
+    Refusing internal addresses here, at connect time, means a hostname that
+    re-resolves to a private IP after ``_validate_url`` passed is still blocked.
+    Every refusal is a urllib3 connection error, which ``requests`` raises as
+    ``requests.ConnectionError``; a failed lookup never falls back to an
+    unpinned connection.
+    """
+
+    resolver: DnsCache
+    allow_internal: bool = False
+
+    def _new_conn(self) -> socket.socket:
+        hostname = self._dns_host
+        try:
+            addresses = self.resolver.resolve(hostname)
+        except socket.gaierror as error:
+            # Never fall back to urllib3's own lookup: it would connect unpinned and unchecked.
+            raise NameResolutionError(hostname, self, error) from error
+        if not addresses:
+            raise NameResolutionError(hostname, self, socket.gaierror(f"no addresses for {hostname}"))
+
+        if not self.allow_internal:
+            for address in addresses:
+                if is_internal_address(address):
+                    raise NewConnectionError(self, f"{hostname} resolves to private/internal IP: {address}")
+
+        last_error: Exception | None = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except NewConnectionError as error:
+                    last_error = error
+        finally:
+            self._dns_host = hostname
+        raise last_error
+
+
+def _pinned_pool_classes(resolver: DnsCache, allow_internal: bool) -> dict[str, type]:
+    attrs = {"resolver": resolver, "allow_internal": allow_internal}
+    connection_http = type("PinnedHTTPConnection", (_PinnedConnectionMixin, HTTPConnection), attrs)
+    connection_https = type("PinnedHTTPSConnection", (_PinnedConnectionMixin, HTTPSConnection), attrs)
+    return {
+        "http": type("PinnedHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": connection_http}),
+        "https": type("PinnedHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": connection_https}),
+    }
+
+
+class _PinnedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct (non-proxied) pools resolve through a ``DnsCache``."""
+
+    def __init__(self, resolver: DnsCache, allow_internal: bool = False, **kwargs: Any) -> None:
+        self._resolver = resolver
+        self._allow_internal = allow_internal
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _pinned_pool_classes(self._resolver, self._allow_internal)
+
+
+
+@dataclass
+class HttpTransport:
+    """Keep-alive ``requests`` session with per-host pooling and retry-with-backoff.
+
+    A single instance is safe to share across threads; connections to the same
+    host are reused from a pool of ``pool_maxsize`` sockets. ``Accept-Encoding``
+    advertises every codec urllib3 can decode here (brotli/zstd when installed).
+    Only idempotent methods are retried, so POSTs are never replayed. When a
+    ``resolver`` is set, direct connections are pinned to its cached addresses
+    and, unless ``allow_internal`` is set, refused for private/internal IPs.
+    """
+
+    pool_connections: int = 16
+    pool_maxsize: int = 16
+    max_retries: int = 3
+    backoff_factor: float = 0.3
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    user_agent: str = DEFAULT_USER_AGENT
+    resolver: DnsCache | None = field(default=None, repr=False)
+    allow_internal: bool = False
+    session: requests.Session = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.session = self._build_session()
+
+    def _build_adapter(self) -> HTTPAdapter:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_forcelist,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        options: dict[str, Any] = {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "max_retries": retry,
+        }
+        if self.resolver is not None:
+            return _PinnedHTTPAdapter(self.resolver, allow_internal=self.allow_internal, **options)
+        return HTTPAdapter(**options)
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = self._build_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {
+                "User-Agent": self.user_agent,
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+        return session
+
+    def get(
+        self,
+        url: str,
+        *,
+        timeout: float,
+        headers: Mapping[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.get(url, timeout=timeout, headers=dict(headers or {}), stream=stream)
+
+    def post(
+        self,
+        url: str,
+        *,
+        timeout: float,
+        json: Any = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        return self.session.post(url, json=json, headers=dict(headers or {}), timeout=timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "HttpTransport":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_default_transport: HttpTransport | None = None
+_default_lock = threading.Lock()
+
+
+def default_transport() -> HttpTransport:
+    """Return the process-wide transport used when none is injected."""
+
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport(resolver=default_resolver())
+        return _default_transport
+
+
+__all__ = ["HttpTransport", "default_transport"]
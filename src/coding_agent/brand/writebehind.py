@@ -0,0 +1,347 @@
+"""Write-behind persistence: report results are persisted off the delivery path."""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from coding_agent.brand.fileio import write_batch
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.paths import DATA_ROOT
+from coding_agent.brand.signal_store import default_signal_store
+from coding_agent.brand.storage import KuzuBulkWriter, persist_raw_signals, persist_report_summary
+from coding_agent.brand.timeseries import default_metrics_series
+
+logger = logging.getLogger(__name__)
+
+WRITE_BEHIND_DEADLINE = 30.0
+
+
+@dataclass(frozen=True)
+class PersistJob:
+    """Everything needed to persist one delivered report."""
+
+    brand_id: str
+    report: BrandReport
+    message_id: str
+    signals: Tuple[BrandSignal, ...]
+
+    def to_dict(self) -> dict:
+        return {
+            "brand_id": self.brand_id,
+            "report": self.report.model_dump(mode="json"),
+            "message_id": self.message_id,
+            "signals": [signal.to_record() for signal in self.signals],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "PersistJob":
+        return cls(
+            brand_id=payload["brand_id"],
+            report=BrandReport.model_validate(payload["report"]),
+            message_id=payload["message_id"],
+            signals=tuple(BrandSignal.model_validate(item) for item in payload["signals"]),
+        )
+
+
+def _is_linked(handle: IO[str], path: Path) -> bool:
+    """Whether ``path`` still names the file open as ``handle``."""
+
+    try:
+        current = path.stat()
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(handle.fileno())
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+class _Spool:
+    """Append-only JSON-lines journal of jobs that are queued but not yet persisted.
+
+    Each process writes its own file and holds an exclusive ``flock`` on it, so
+    a file that can be locked by someone else belongs to a process that died.
+    A file is only trusted after its lock is held and it is still the one at its
+    path: between ``open`` and ``flock`` another process may recover and unlink
+    it.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        folder.mkdir(parents=True, exist_ok=True)
+        self.folder = folder
+        while True:
+            self.path = folder / f"{os.getpid()}-{time.time_ns()}.jsonl"
+            self._handle: IO[str] = self.path.open("a", encoding="utf-8")
+            fcntl.flock(self._handle, fcntl.LOCK_EX)
+            if _is_linked(self._handle, self.path):
+                break
+            self._handle.close()  # recovered as an orphan before we locked it
+        self._pending: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _append(self, record: dict) -> None:
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def put(self, job_id: int, job: PersistJob) -> None:
+        with self._lock:
+            self._append({"op": "put", "id": job_id, "job": job.to_dict()})
+            self._pending.add(job_id)
+
+    def ack(self, job_ids: Sequence[int]) -> None:
+        with self._lock:
+            self._pending.difference_update(job_ids)
+            if self._pending:
+                self._append({"op": "ack", "ids": list(job_ids)})
+            else:
+                # Nothing outstanding: start the journal over instead of growing it.
+                self._handle.truncate(0)
+                self._handle.seek(0)
+
+    def orphans(self) -> Iterator[Tuple[Path, List[PersistJob]]]:
+        """Yield unacknowledged jobs from spool files of processes that are gone."""
+
+        for path in sorted(self.folder.glob("*.jsonl")):
+            if path == self.path:
+                continue
+            with path.open("r+", encoding="utf-8") as handle:
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue  # still owned by a live process
+                if not _is_linked(handle, path):
+                    continue  # already recovered by another process
+                jobs: Dict[int, dict] = {}
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn final line from a crash mid-write
+                    if record["op"] == "put":
+                        jobs[record["id"]] = record["job"]
+                    else:
+                        for job_id in record["ids"]:
+                            jobs.pop(job_id, None)
+                yield path, [PersistJob.from_dict(payload) for payload in jobs.values()]
+
+    def close(self) -> None:
+        with self._lock:
+            pending = bool(self._pending)
+            self._handle.close()
+        if not pending:
+            self.path.unlink(missing_ok=True)
+
+
+class WriteBehindQueue:
+    """Bounded queue drained by one background writer.
+
+    ``submit`` journals the job to the spool and returns immediately unless the
+    queue is full, in which case it blocks for up to ``put_timeout`` seconds
+    (backpressure). A job that still does not fit is not raised to the caller,
+    whose report has already been delivered: it is logged and left in the spool,
+    so the next process replays it through :meth:`recover`. The writer hands the sink
+    batches of up to ``batch_size`` jobs, waiting up to ``linger`` seconds to
+    coalesce jobs from concurrent brands. Jobs are acknowledged in the spool only
+    after the sink succeeds; a failed batch is logged and left in the spool, so
+    it is replayed by the next process that calls :meth:`recover`.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[Sequence[PersistJob]], None],
+        *,
+        maxsize: int = 256,
+        batch_size: int = 32,
+        linger: float = 0.05,
+        put_timeout: float | None = 30.0,
+        spool_dir: Path | None = None,
+    ) -> None:
+        self.sink = sink
+        self.batch_size = batch_size
+        self.linger = linger
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue[Tuple[int, PersistJob]] = queue.Queue(maxsize=maxsize)
+        self._spool = _Spool(spool_dir) if spool_dir is not None else None
+        self._next_id = 0
+        self._unfinished = 0
+        self._failed = 0
+        self._deferred = 0
+        self._state = threading.Condition()
+        self._stopping = False
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._worker.start()
+
+    @property
+    def pending(self) -> int:
+        """Jobs submitted but not yet handed back by the sink."""
+
+        with self._state:
+            return self._unfinished
+
+    @property
+    def failed(self) -> int:
+        with self._state:
+            return self._failed
+
+    @property
+    def deferred(self) -> int:
+        """Jobs that did not fit in the queue and were left in the spool."""
+
+        with self._state:
+            return self._deferred
+
+    def submit(self, job: PersistJob) -> bool:
+        """Queue ``job``; returns ``False`` when it was deferred to the spool."""
+
+        with self._state:
+            if self._stopping:
+                raise RuntimeError("write-behind queue is closed")
+            job_id = self._next_id
+            self._next_id += 1
+            self._unfinished += 1
+        if self._spool is not None:
+            self._spool.put(job_id, job)
+        try:
+            self._queue.put((job_id, job), timeout=self.put_timeout)
+        except queue.Full:
+            with self._state:
+                self._unfinished -= 1
+                self._deferred += 1
+                self._state.notify_all()
+            if self._spool is not None:
+                logger.warning("Write-behind queue is full; report for %s left in the spool", job.brand_id)
+            else:
+                logger.error("Write-behind queue is full; report for %s was not persisted", job.brand_id)
+            return False
+        return True
+
+    def recover(self) -> int:
+        """Re-queue jobs left behind by crashed processes; returns how many."""
+
+        if self._spool is None:
+            return 0
+        recovered = 0
+        for path, jobs in self._spool.orphans():
+            for job in jobs:
+                self.submit(job)
+            recovered += len(jobs)
+            path.unlink(missing_ok=True)
+            if jobs:
+                logger.info("Recovered %d un-persisted reports from %s", len(jobs), path.name)
+        return recovered
+
+    def _next_batch(self) -> List[Tuple[int, PersistJob]] | None:
+        while True:
+            try:
+                batch = [self._queue.get(timeout=0.1)]
+                break
+            except queue.Empty:
+                if self._stopping:
+                    return None
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            job_ids = [job_id for job_id, _job in batch]
+            try:
+                self.sink([job for _job_id, job in batch])
+            except Exception:
+                logger.exception("Persisting %d reports failed; they stay in the spool", len(batch))
+                with self._state:
+                    self._failed += len(batch)
+            else:
+                if self._spool is not None:
+                    self._spool.ack(job_ids)
+            with self._state:
+                self._unfinished -= len(batch)
+                self._state.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted job has been handed to the sink."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._state:
+            while self._unfinished:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._state.wait(remaining)
+        return True
+
+    def close(self, timeout: float = WRITE_BEHIND_DEADLINE) -> int:
+        """Drain the queue for at most ``timeout`` seconds and stop the writer.
+
+        Returns the number of jobs still outstanding; they remain in the spool.
+        """
+
+        with self._state:
+            if self._closed:
+                return self._unfinished
+            self._stopping = True
+        self._worker.join(timeout)
+        with self._state:
+            self._closed = not self._worker.is_alive()
+            outstanding = self._unfinished
+        if outstanding:
+            logger.warning("Write-behind closed with %d reports still queued", outstanding)
+        if self._spool is not None and self._closed:
+            self._spool.close()
+        return outstanding
+
+
+def persist_jobs(jobs: Sequence[PersistJob]) -> None:
+    """Write a batch of reports to the signal store, metric series, archive and Kùzu (one transaction)."""
+
+    store = default_signal_store()
+    series = default_metrics_series()
+    writer = KuzuBulkWriter()
+    # Archive files of the whole batch are published, and fsynced, together.
+    with write_batch():
+        for job in jobs:
+            store.put_many(job.signals, job.report.report_date)
+            series.append(job.brand_id, job.report.report_date, job.report.metrics)
+            persist_raw_signals(job.brand_id, job.report.report_date, job.signals)
+            persist_report_summary(job.brand_id, job.report, job.message_id)
+            writer.add_report(job.brand_id, job.report, job.message_id, job.signals)
+    writer.flush()
+
+
+_default_queue: WriteBehindQueue | None = None
+_default_lock = threading.Lock()
+
+
+def default_write_behind() -> WriteBehindQueue:
+    """Process-wide queue persisting into the configured archive and Kùzu store.
+
+    Spool files live under ``DATA_ROOT/.spool``; jobs orphaned by a crashed
+    process are replayed when the queue is first created, and the queue is
+    drained at interpreter exit.
+    """
+
+    global _default_queue
+    with _default_lock:
+        if _default_queue is None:
+            _default_queue = WriteBehindQueue(persist_jobs, spool_dir=DATA_ROOT / ".spool")
+            _default_queue.recover()
+            atexit.register(_default_queue.close)
+        return _default_queue
+
+
+__all__ = ["PersistJob", "WriteBehindQueue", "default_write_behind", "persist_jobs"]
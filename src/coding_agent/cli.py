@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import argparse
 import logging
+from concurrent.futures import Executor
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple
 
-import requests
 from dotenv import load_dotenv
 
 from coding_agent.brand import (
@@ -17,21 +17,30 @@ from coding_agent.brand import (
     BrandReportToolkit,
     BrandSignal,
     BrandTask,
-    HeuristicSummarizer,
+    ConcurrentSignalsGatherer,
+    EmailSender,
     InMemoryEmailSender,
     FileSignalsProvider,
+    SignalsProvider,
     StaticSignalsProvider,
     WebPageSignalsProvider,
     GoogleNewsProvider,
+    SignalBatch,
     build_resend_from_env,
-    get_brand_profile,
-    apply_relevance_filter,
 )
-from coding_agent.brand.storage import (
-    persist_raw_signals,
-    persist_report_summary,
-    persist_to_kuzu,
+from coding_agent.brand.batch import (
+    BatchManifest,
+    cpu_pool,
+    filter_signals_job,
+    run_brand_batch,
+    summarize_job,
+    write_run_manifest,
 )
+from coding_agent.brand.config import list_brand_ids
+from coding_agent.brand.signal_store import default_signal_store
+from coding_agent.brand.http_cache import default_http_cache
+from coding_agent.brand.storage import DATA_ROOT
+from coding_agent.brand.writebehind import WRITE_BEHIND_DEADLINE, PersistJob, default_write_behind
 from coding_agent.adapters import (
     AgentsToolkitFactory,
     CoderAgentAdapter,
@@ -50,6 +59,7 @@ from coding_agent.runtime import CodingAgentRuntime, ExecutionObserver
 logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 SAMPLE_DIR = PROJECT_ROOT / "docs" / "sample_signals"
+GATHER_DEADLINE = 12.0
 
 GENERIC_FALLBACK_SIGNAL = BrandSignal(
     source="fallback",
@@ -90,27 +100,36 @@ def _default_signals_provider(
     brand_id: str,
     signals_file: Path | None,
     brand_url: str | None,
+    deadline: float = GATHER_DEADLINE,
 ) -> Iterable[BrandSignal]:
     if signals_file and signals_file.exists():
         provider = FileSignalsProvider(path=signals_file)
         return provider.load(brand_id)
 
+    cache = default_http_cache()
+    providers: list[SignalsProvider] = []
     if brand_url:
-        provider = WebPageSignalsProvider(url=brand_url)
-        try:
-            signals = tuple(provider.load(brand_id))
-            if signals:
-                return signals
-        except requests.RequestException as error:
-            logger.warning("Web provider failed for %s: %s", brand_url, error)
-
-    try:
-        news_provider = GoogleNewsProvider(query=f"{brand_id} brand")
-        news_signals = tuple(news_provider.load(brand_id))
-        if news_signals:
-            return news_signals
-    except requests.RequestException as error:
-        logger.warning("Google News provider failed for %s: %s", brand_id, error)
+        providers.append(WebPageSignalsProvider(url=brand_url, cache=cache))
+    providers.append(GoogleNewsProvider(query=f"{brand_id} brand", cache=cache))
+
+    gathered = ConcurrentSignalsGatherer(providers=providers, deadline=deadline).gather(brand_id)
+    for outcome in gathered.outcomes:
+        logger.info(
+            "Provider %s for %s: %s (%d signals, %.2fs)",
+            outcome.name,
+            brand_id,
+            outcome.status,
+            outcome.signal_count,
+            outcome.elapsed,
+        )
+    logger.info(
+        "HTTP cache: %d hits, %d revalidated, %d misses",
+        cache.stats.hits,
+        cache.stats.revalidated,
+        cache.stats.misses,
+    )
+    if gathered.signals:
+        return gathered.signals
 
     sample_signals = _load_sample_signals(brand_id)
     return StaticSignalsProvider(sample_signals).load(brand_id)
@@ -130,7 +149,9 @@ def _compose_plaintext_email(task: BrandTask, report: BrandReport) -> Tuple[str,
         "Highlights:",
     ]
     for signal in report.highlights:
-        body_lines.append(f"- [{signal.source}] {signal.headline} ({signal.impact})")
+        marker = "NEW " if signal.first_seen == report.report_date else ""
+        carried = f", carried by {signal.cluster_size} outlets" if signal.cluster_size > 1 else ""
+        body_lines.append(f"- {marker}[{signal.source}] {signal.headline} ({signal.impact}{carried})")
         if signal.summary:
             body_lines.append(f"  {signal.summary}")
 
@@ -156,51 +177,47 @@ def _compose_plaintext_email(task: BrandTask, report: BrandReport) -> Tuple[str,
     return subject, "\n".join(body_lines)
 
 
-def run_brand_report_demo(
-    brand_id: str = "brandos",
-    signals_file: Path | None = None,
-    brand_url: str | None = None,
-    send_via_resend: bool = False,
-    resend_sender: str | None = None,
-    recipients: Tuple[str, ...] | None = None,
-) -> str:
-    """Run the brand report pipeline with configurable inputs."""
+def _build_brand_pipeline(
+    signals_file: Path | None,
+    brand_url: str | None,
+    email_sender: EmailSender,
+    cpu_executor: Executor | None = None,
+) -> BrandReportPipeline:
+    """Assemble the brand pipeline; CPU stages run on ``cpu_executor`` when given."""
 
     def gather_signals(task: BrandTask):
         print("GatherSignals: collecting brand intelligence")
         return tuple(_default_signals_provider(task.brand_id, signals_file, brand_url))
 
     def filter_signals(task: BrandTask, signals: tuple[BrandSignal, ...]) -> tuple[BrandSignal, ...]:
-        profile = get_brand_profile(task.brand_id)
-        filtered, rejected = apply_relevance_filter(signals, profile)
-        for entry in rejected:
-            logger.info("Rejected '%s': %s", entry.signal.headline, entry.reason)
-        if filtered:
-            return filtered
-        logger.warning("All signals rejected for %s; falling back to curated samples", task.brand_id)
-        fallback_signals = _load_sample_signals(task.brand_id)
-        return tuple(fallback_signals)
-
-    summarizer = HeuristicSummarizer()
+        if cpu_executor is not None:
+            batch = SignalBatch.from_signals(signals)
+            filtered, rejected = cpu_executor.submit(filter_signals_job, task.brand_id, batch).result()
+        else:
+            filtered, rejected = filter_signals_job(task.brand_id, signals)
+        for headline, reason in rejected:
+            logger.info("Rejected '%s': %s", headline, reason)
+        if not filtered:
+            logger.warning("All signals rejected for %s; falling back to curated samples", task.brand_id)
+            filtered = _load_sample_signals(task.brand_id)
+        # Mark which highlights were already reported on an earlier day.
+        return default_signal_store().annotate(filtered, task.report_date)
 
     def summarize(task: BrandTask, signals: tuple[BrandSignal, ...]) -> BrandReport:
         print(f"SummarizeInsights: {len(signals)} signals")
-        return summarizer.summarize(task.brand_id, task.report_date, signals)
+        if cpu_executor is not None:
+            return cpu_executor.submit(summarize_job, task.brand_id, task.report_date, signals).result()
+        return summarize_job(task.brand_id, task.report_date, signals)
 
     def compose_email(task: BrandTask, report: BrandReport) -> tuple[str, str]:
         print("ComposeEmail: generating digest")
         return _compose_plaintext_email(task, report)
 
-    if send_via_resend:
-        email_sender = build_resend_from_env(resend_sender)
-    else:
-        email_sender = InMemoryEmailSender()
-
     def send_email(task: BrandTask, subject: str, body: str) -> str:
         print(f"SendEmail: to={','.join(task.recipients)} subject='{subject}'")
         return email_sender.send(task, subject, body)
 
-    pipeline = BrandReportPipeline(
+    return BrandReportPipeline(
         toolkit=BrandReportToolkit(
             gather_signals=gather_signals,
             filter_signals=filter_signals,
@@ -210,6 +227,18 @@ def run_brand_report_demo(
         )
     )
 
+
+def _build_email_sender(send_via_resend: bool, resend_sender: str | None) -> EmailSender:
+    if send_via_resend:
+        return build_resend_from_env(resend_sender)
+    return InMemoryEmailSender()
+
+
+def _run_brand_report(
+    pipeline: BrandReportPipeline,
+    brand_id: str,
+    recipients: Tuple[str, ...] | None,
+) -> str:
     result = pipeline.run(
         BrandTask(
             brand_id=brand_id,
@@ -218,12 +247,80 @@ def run_brand_report_demo(
         )
     )
 
-    persist_raw_signals(brand_id, result.report.report_date, result.signals)
-    persist_report_summary(brand_id, result.report, result.message_id)
-    persist_to_kuzu(brand_id, result.report, result.message_id, result.signals)
+    # Persistence happens on the write-behind queue so delivery latency does
+    # not include archive and database writes.
+    default_write_behind().submit(
+        PersistJob(
+            brand_id=brand_id,
+            report=result.report,
+            message_id=result.message_id,
+            signals=result.signals,
+        )
+    )
+    return result.message_id
 
+
+def run_brand_report_demo(
+    brand_id: str = "brandos",
+    signals_file: Path | None = None,
+    brand_url: str | None = None,
+    send_via_resend: bool = False,
+    resend_sender: str | None = None,
+    recipients: Tuple[str, ...] | None = None,
+) -> str:
+    """Run the brand report pipeline with configurable inputs."""
+
+    pipeline = _build_brand_pipeline(
+        signals_file, brand_url, _build_email_sender(send_via_resend, resend_sender)
+    )
+    message_id = _run_brand_report(pipeline, brand_id, recipients)
     print("BrandReport: ready for delivery")
-    return result.message_id
+    return message_id
+
+
+def run_brand_batch_demo(
+    brand_ids: Iterable[str],
+    signals_file: Path | None = None,
+    brand_url: str | None = None,
+    send_via_resend: bool = False,
+    resend_sender: str | None = None,
+    recipients: Tuple[str, ...] | None = None,
+    workers: int = 8,
+    cpu_workers: int | None = None,
+) -> BatchManifest:
+    """Run the brand report pipeline for many brands in one process.
+
+    Brands share an I/O thread pool (and the process-wide HTTP transport and
+    cache); filtering and summarizing run on a bounded process pool unless
+    ``cpu_workers`` is 0. A failing brand is recorded and skipped. Reports are
+    persisted in coalesced batches by the write-behind queue, which is drained
+    before the run manifest is written under ``DATA_ROOT/.runs``.
+    """
+
+    email_sender = _build_email_sender(send_via_resend, resend_sender)
+    cpu_executor = cpu_pool(cpu_workers) if cpu_workers != 0 else None
+    try:
+        pipeline = _build_brand_pipeline(signals_file, brand_url, email_sender, cpu_executor)
+        manifest = run_brand_batch(
+            list(brand_ids),
+            lambda brand_id: _run_brand_report(pipeline, brand_id, recipients),
+            max_workers=workers,
+        )
+    finally:
+        if cpu_executor is not None:
+            cpu_executor.shutdown(wait=True)
+
+    if not default_write_behind().flush(WRITE_BEHIND_DEADLINE):
+        logger.warning("Persistence still in progress for batch %s; it will finish at exit", manifest.run_id)
+
+    manifest_path = write_run_manifest(manifest, DATA_ROOT)
+    for record in manifest.records:
+        logger.info("Brand %s: %s (%.2fs)", record.brand_id, record.status, record.elapsed)
+    print(
+        f"BrandBatch: {len(manifest.succeeded)} ok, {len(manifest.failed)} failed "
+        f"in {manifest.elapsed:.2f}s; manifest at {manifest_path}"
+    )
+    return manifest
 
 
 def _demo_plan() -> ChangePlan:
@@ -270,6 +367,18 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Coding agent demos")
     parser.add_argument("--pipeline", choices=("coding", "brand"), default="coding")
     parser.add_argument("--brand", default="brandos", help="Brand identifier for reporting")
+    parser.add_argument("--brands", help="Comma-separated brand identifiers to report on in one batch")
+    parser.add_argument(
+        "--all-profiles",
+        action="store_true",
+        help="Report on every brand defined in the brand profiles file",
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Brands processed concurrently in a batch")
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        help="Process-pool size for filtering/summarizing in a batch (0 runs them inline)",
+    )
     parser.add_argument("--signals-file", type=Path, help="Path to JSON signals file")
     parser.add_argument("--brand-url", help="Fetch highlights from this brand URL")
     parser.add_argument(
@@ -288,14 +397,29 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    if args.pipeline == "brand":
+    recipients = tuple(email.strip() for email in args.recipients.split(",")) if args.recipients else None
+    if args.pipeline == "brand" and (args.brands or args.all_profiles):
+        brand_ids = list_brand_ids() if args.all_profiles else [
+            brand.strip() for brand in args.brands.split(",") if brand.strip()
+        ]
+        run_brand_batch_demo(
+            brand_ids,
+            signals_file=args.signals_file,
+            brand_url=args.brand_url,
+            send_via_resend=args.send_resend,
+            resend_sender=args.resend_from,
+            recipients=recipients,
+            workers=args.workers,
+            cpu_workers=args.cpu_workers,
+        )
+    elif args.pipeline == "brand":
         run_brand_report_demo(
             brand_id=args.brand,
             signals_file=args.signals_file,
             brand_url=args.brand_url,
             send_via_resend=args.send_resend,
             resend_sender=args.resend_from,
-            recipients=tuple(email.strip() for email in args.recipients.split(",")) if args.recipients else None,
+            recipients=recipients,
         )
     else:
         run_demo_task()
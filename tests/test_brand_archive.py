@@ -0,0 +1,159 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from coding_agent.brand.archive import (
+    JsonSignalArchive,
+    ParquetSignalArchive,
+    SignalQuery,
+    get_signal_archive,
+)
+from coding_agent.brand.models import BrandReport, BrandSignal
+
+try:
+    import pyarrow
+except ImportError:  # the Parquet cases are skipped
+    pyarrow = None
+
+needs_pyarrow = pytest.mark.skipif(pyarrow is None, reason="pyarrow is not installed")
+
+
+def _signals(prefix: str):
+    return [
+        BrandSignal(source="news", headline=f"{prefix} launch", impact="high", url="https://a.test"),
+        BrandSignal(source="blog", headline=f"{prefix} recap", summary="Weekly recap"),
+    ]
+
+
+@pytest.fixture(params=["json", pytest.param("parquet", marks=needs_pyarrow)])
+def archive(request, tmp_path):
+    if request.param == "json":
+        return JsonSignalArchive(tmp_path)
+    return ParquetSignalArchive(tmp_path)
+
+
+def _fill(archive):
+    archive.write_signals("acme", date(2024, 4, 30), _signals("April"))
+    archive.write_signals("acme", date(2024, 5, 1), _signals("May"))
+    archive.write_signals("globex", date(2024, 5, 1), _signals("Globex"))
+
+
+def _scan(archive, **query):
+    return [
+        (item.brand_id, item.report_date, item.signal.headline)
+        for batch in archive.scan_signals(SignalQuery(**query))
+        for item in batch
+    ]
+
+
+def test_scan_pushes_down_predicates(archive):
+    _fill(archive)
+
+    assert sorted(_scan(archive, brand_ids=("acme",), start=date(2024, 5, 1))) == [
+        ("acme", date(2024, 5, 1), "May launch"),
+        ("acme", date(2024, 5, 1), "May recap"),
+    ]
+    assert sorted(_scan(archive, end=date(2024, 4, 30), impacts=("high",))) == [
+        ("acme", date(2024, 4, 30), "April launch"),
+    ]
+    assert len(_scan(archive, sources=("blog",))) == 3
+    assert _scan(archive, brand_ids=("nobody",)) == []
+
+
+def test_rewriting_a_day_replaces_it(archive):
+    _fill(archive)
+    archive.write_signals("acme", date(2024, 5, 1), [BrandSignal(source="news", headline="Rerun")])
+
+    assert _scan(archive, brand_ids=("acme",), start=date(2024, 5, 1)) == [("acme", date(2024, 5, 1), "Rerun")]
+    assert len(_scan(archive)) == 5
+
+
+@needs_pyarrow
+def test_signal_fields_round_trip_in_both_formats(tmp_path):
+    signal = BrandSignal(
+        source="news",
+        headline="Acme launch",
+        impact="high",
+        url="https://a.test",
+        summary="Details",
+        first_seen=date(2024, 4, 28),
+        cluster_size=3,
+        keyword_hits=2,
+    )
+    stored = []
+    for archive in (JsonSignalArchive(tmp_path / "json"), ParquetSignalArchive(tmp_path / "parquet")):
+        archive.write_signals("acme", date(2024, 5, 1), [signal, BrandSignal(source="blog", headline="Recap")])
+        stored.append([item.signal for batch in archive.scan_signals() for item in batch])
+
+    assert stored[0] == stored[1]
+    assert stored[0][0] == signal
+
+
+def test_summaries_round_trip(archive):
+    report = BrandReport(brand_id="acme", report_date=date(2024, 5, 1), overview="Quiet", metrics={"mentions": 2})
+    archive.write_summary("acme", report, "msg-1")
+    archive.write_summary("acme", report.model_copy(update={"overview": "Busy"}), "msg-2")
+
+    summaries = archive.read_summaries(SignalQuery(brand_ids=("acme",)))
+
+    assert [(stored.overview, message_id) for stored, message_id in summaries] == [("Busy", "msg-2")]
+
+
+@needs_pyarrow
+def test_parquet_compacts_day_parts_into_one_file_per_period(tmp_path):
+    archive = ParquetSignalArchive(tmp_path, partition="month")
+    _fill(archive)
+
+    def files():
+        return sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.parquet"))
+
+    assert files() == [
+        ".archive/signals/period=2024-04/part-2024-04-30-acme.parquet",
+        ".archive/signals/period=2024-05/part-2024-05-01-acme.parquet",
+        ".archive/signals/period=2024-05/part-2024-05-01-globex.parquet",
+    ]
+    assert archive.compact(date(2024, 6, 1)) == 3
+    assert files() == [
+        ".archive/signals/period=2024-04/compacted.parquet",
+        ".archive/signals/period=2024-05/compacted.parquet",
+    ]
+    batches = list(archive.scan_signals(batch_size=1))
+    assert all(len(batch) == 1 for batch in batches)
+
+    archive.write_signals("acme", date(2024, 5, 1), [BrandSignal(source="news", headline="Rerun")])
+    assert _scan(archive, brand_ids=("acme",), start=date(2024, 5, 1)) == [("acme", date(2024, 5, 1), "Rerun")]
+    assert archive.compact(date(2024, 6, 1)) == 1
+    assert len(_scan(archive)) == 5
+
+
+@needs_pyarrow
+def test_parquet_writes_from_separate_handles_are_not_lost(tmp_path):
+    writers = [ParquetSignalArchive(tmp_path) for _ in range(4)]
+
+    def write(index):
+        archive = writers[index % len(writers)]
+        archive.write_signals(f"brand-{index % 5}", date(2024, 5, 1 + index // 5), _signals(str(index)))
+        if index % 7 == 0:
+            archive.compact(date(2024, 5, 3))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(40)))
+
+    assert len(_scan(writers[0])) == 80
+    writers[1].compact(date(2024, 6, 1))
+    assert list(tmp_path.rglob("part-*.parquet")) == []
+    assert len(_scan(writers[0])) == 80
+
+
+def test_get_signal_archive(tmp_path):
+    assert get_signal_archive("json", tmp_path) is get_signal_archive("json", tmp_path)
+    with pytest.raises(ValueError):
+        get_signal_archive("csv", tmp_path)
+
+
+@needs_pyarrow
+def test_auto_prefers_parquet(tmp_path):
+    assert isinstance(get_signal_archive("auto", tmp_path), ParquetSignalArchive)
+    with pytest.raises(ValueError):
+        ParquetSignalArchive(tmp_path, partition="week")
@@ -0,0 +1,57 @@
+import json
+from datetime import date
+
+from coding_agent.brand.batch import (
+    cpu_pool,
+    filter_signals_job,
+    run_brand_batch,
+    summarize_job,
+    write_run_manifest,
+)
+from coding_agent.brand.models import BrandSignal
+
+
+def test_batch_isolates_failures_and_keeps_order():
+    def run_brand(brand_id: str) -> str:
+        if brand_id == "broken":
+            raise RuntimeError("provider exploded")
+        return f"msg-{brand_id}"
+
+    manifest = run_brand_batch(["alpha", "broken", "beta", "alpha"], run_brand, max_workers=3)
+
+    assert [record.brand_id for record in manifest.records] == ["alpha", "broken", "beta"]
+    assert manifest.succeeded == ("alpha", "beta")
+    assert manifest.failed == ("broken",)
+    broken = manifest.records[1]
+    assert broken.message_id is None
+    assert broken.error == "RuntimeError: provider exploded"
+    assert manifest.records[0].message_id == "msg-alpha"
+
+
+def test_write_run_manifest(tmp_path):
+    manifest = run_brand_batch(["alpha"], lambda brand_id: "msg-1")
+
+    output = write_run_manifest(manifest, tmp_path)
+
+    assert output.parent == tmp_path / ".runs"
+    payload = json.loads(output.read_text())
+    assert payload["run_id"] == manifest.run_id
+    assert payload["succeeded"] == 1 and payload["failed"] == 0
+    assert payload["records"][0]["brand_id"] == "alpha"
+    assert payload["records"][0]["status"] == "ok"
+
+
+def test_cpu_jobs_run_in_process_pool():
+    signals = (
+        BrandSignal(source="news", headline="Ollie launches caregiver support program", impact="high"),
+        BrandSignal(source="news", headline="Celebrity gossip roundup"),
+    )
+
+    with cpu_pool(1) as pool:
+        filtered, rejected = pool.submit(filter_signals_job, "ollie", signals).result()
+        report = pool.submit(summarize_job, "ollie", date(2024, 1, 1), filtered).result()
+
+    assert filtered == filter_signals_job("ollie", signals)[0]
+    assert all(isinstance(reason, str) for _, reason in rejected)
+    assert report.brand_id == "ollie"
+    assert report.report_date == date(2024, 1, 1)
@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+from coding_agent.brand.config import BrandProfile, ProfileRegistry, ProfileStore, compile_profile
+
+PROFILES = """
+acme:
+  company_summary: Acme builds rockets.
+  keywords: [Acme, Rockets]
+  competitors: [Globex]
+  stop_phrases: [Looney]
+"""
+
+
+def test_compile_profile_reuses_identical_content():
+    first = compile_profile(BrandProfile(brand_id="acme", company_summary="x", keywords=["Acme"]))
+    second = compile_profile(BrandProfile(brand_id="acme", company_summary="x", keywords=["Acme"]))
+
+    assert first is second
+    assert first.keywords == frozenset({"acme"})
+    assert first.matcher.find("ACME news")["keyword"] == {"acme"}
+
+
+def test_registry_compiles_each_brand_once_per_config_version(tmp_path: Path):
+    config = tmp_path / "profiles.yaml"
+    config.write_text(PROFILES, encoding="utf-8")
+    registry = ProfileRegistry(config)
+
+    compiled = registry.get("ACME")
+    assert registry.get("acme") is compiled
+    assert compiled.competitors == frozenset({"globex"})
+    assert compiled.stop_phrases == frozenset({"looney"})
+
+    config.write_text(PROFILES.replace("Globex", "Initech"), encoding="utf-8")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = registry.get("acme")
+    assert reloaded is not compiled
+    assert reloaded.competitors == frozenset({"initech"})
+    assert reloaded.content_hash != compiled.content_hash
+
+
+def test_registry_falls_back_for_unknown_brand(tmp_path: Path):
+    registry = ProfileRegistry(tmp_path / "missing.yaml")
+
+    compiled = registry.get("new_brand")
+
+    assert compiled.keywords == frozenset({"new brand"})
+
+
+def _rewrite(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+TWO_BRANDS = PROFILES + """
+globex:
+  company_summary: Globex sells everything.
+  keywords: [Globex]
+"""
+
+
+def test_store_reloads_only_changed_brands(tmp_path: Path):
+    config = tmp_path / "profiles.yaml"
+    config.write_text(TWO_BRANDS, encoding="utf-8")
+    store = ProfileStore(config)
+    acme_entry = store.raw("acme")
+
+    assert store.version == 1
+    assert store.brand_ids() == ("acme", "globex")
+
+    _rewrite(config, TWO_BRANDS.replace("Globex sells everything.", "Globex sells less."))
+
+    assert store.version == 2
+    assert store.raw("acme") is acme_entry
+    assert store.brand_version("acme") == 1
+    assert store.brand_version("globex") == 2
+    assert store.profile("globex").company_summary == "Globex sells less."
+
+
+def test_store_keeps_last_good_snapshot_on_parse_error(tmp_path: Path):
+    config = tmp_path / "profiles.yaml"
+    config.write_text(PROFILES, encoding="utf-8")
+    store = ProfileStore(config)
+
+    _rewrite(config, "acme: [unterminated")
+
+    assert store.version == 1
+    assert store.profile("acme").keywords == ["Acme", "Rockets"]
+
+
+def test_registry_recompiles_only_changed_brand(tmp_path: Path):
+    config = tmp_path / "profiles.yaml"
+    config.write_text(TWO_BRANDS, encoding="utf-8")
+    registry = ProfileRegistry(store=ProfileStore(config))
+    acme, globex = registry.get("acme"), registry.get("globex")
+
+    _rewrite(config, TWO_BRANDS.replace("keywords: [Globex]", "keywords: [Globex, Hank]"))
+
+    assert registry.get("acme") is acme
+    assert registry.get("globex") is not globex
+    assert registry.get("globex").keywords == frozenset({"globex", "hank"})
@@ -1,5 +1,5 @@
 from datetime import date
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -19,17 +19,17 @@ def test_in_memory_email_sender_records_messages():
     assert sender.sent_messages[0]["subject"] == "subject"
 
 
-@patch("coding_agent.brand.emailer.requests.post")
-def test_resend_email_sender_calls_api(mock_post: MagicMock):
+def test_resend_email_sender_calls_api():
     mock_response = MagicMock()
     mock_response.json.return_value = {"id": "email-123"}
     mock_response.raise_for_status.return_value = None
-    mock_post.return_value = mock_response
+    transport = MagicMock()
+    transport.post.return_value = mock_response
 
-    sender = ResendEmailSender(api_key="key", sender="BrandOS <reports@brandos.com>")
+    sender = ResendEmailSender(api_key="key", sender="BrandOS <reports@brandos.com>", transport=transport)
     message_id = sender.send(make_task(), "subject", "body")
 
     assert message_id == "email-123"
-    mock_post.assert_called_once()
-    kwargs = mock_post.call_args.kwargs
+    transport.post.assert_called_once()
+    kwargs = transport.post.call_args.kwargs
     assert kwargs["headers"]["Authorization"] == "Bearer key"
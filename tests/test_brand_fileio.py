@@ -0,0 +1,64 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from coding_agent.brand import fileio
+from coding_agent.brand.fileio import AtomicWriteBatch, dumps_json, write_batch, write_json
+
+
+def test_dumps_json_is_compact_unless_pretty():
+    payload = {"headline": "Café opens", "items": [1, 2]}
+
+    compact = dumps_json(payload)
+    pretty = dumps_json(payload, pretty=True)
+
+    assert compact == '{"headline":"Café opens","items":[1,2]}'.encode("utf-8")
+    assert b"\n  " in pretty
+    assert json.loads(compact) == json.loads(pretty) == payload
+
+
+def test_batch_fsyncs_each_file_and_each_directory_once(tmp_path):
+    batch = AtomicWriteBatch()
+    for index in range(5):
+        batch.write_json(tmp_path / "acme" / f"day-{index % 2}" / f"{index}.json", {"index": index})
+
+    with patch("coding_agent.brand.fileio.os.sync") as sync, patch(
+        "coding_agent.brand.fileio._fsync_path", wraps=fileio._fsync_path
+    ) as fsync_path:
+        written = batch.commit()
+
+    synced = [call.args[0] for call in fsync_path.call_args_list]
+    assert len(written) == 5 and len(batch) == 0
+    assert not sync.called
+    assert sum(path.suffix == ".tmp" for path in synced) == 5
+    assert sorted(path for path in synced if path.is_dir()) == [tmp_path / "acme" / "day-0", tmp_path / "acme" / "day-1"]
+    assert json.loads((tmp_path / "acme" / "day-1" / "3.json").read_text()) == {"index": 3}
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_failed_batch_keeps_previous_content(tmp_path):
+    target = tmp_path / "summary.json"
+    write_json(target, {"version": 1})
+
+    with pytest.raises(RuntimeError):
+        with write_batch() as batch:
+            write_json(target, {"version": 2})
+            with write_batch() as inner:
+                assert inner is batch
+            raise RuntimeError("crash before commit")
+
+    real_replace = fileio.os.replace
+
+    def crash_on_rename(source, destination):
+        if destination == target:
+            raise OSError("disk gone")
+        return real_replace(source, destination)
+
+    with patch("coding_agent.brand.fileio.os.replace", side_effect=crash_on_rename), pytest.raises(OSError):
+        with write_batch(durable=False):
+            write_json(target, {"version": 3})
+
+    assert json.loads(target.read_text()) == {"version": 1}
+    assert [path.name for path in tmp_path.iterdir()] == ["summary.json"]
+    assert fileio.current_batch() is None
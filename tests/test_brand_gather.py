@@ -0,0 +1,82 @@
+import threading
+import time
+
+from coding_agent.brand.gather import ConcurrentSignalsGatherer
+from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.sources import StaticSignalsProvider
+
+
+class SlowProvider:
+    def __init__(self, delay: float, headline: str):
+        self.delay = delay
+        self.headline = headline
+
+    def load(self, brand_id: str):
+        time.sleep(self.delay)
+        return [BrandSignal(source="slow", headline=self.headline)]
+
+
+class FailingProvider:
+    def load(self, brand_id: str):
+        raise RuntimeError("boom")
+
+
+class BlockingProvider:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def load(self, brand_id: str):
+        self.release.wait(5)
+        return [BrandSignal(source="blocked", headline="Too late")]
+
+
+def test_gatherer_merges_providers_in_configured_order():
+    first = SlowProvider(0.05, "From slow provider")
+    second = StaticSignalsProvider([BrandSignal(source="static", headline="From static provider")])
+
+    result = ConcurrentSignalsGatherer(providers=[first, second], deadline=2).gather("brand")
+
+    assert [signal.headline for signal in result.signals] == ["From slow provider", "From static provider"]
+    assert result.finished == ("SlowProvider", "StaticSignalsProvider")
+    assert not result.failed and not result.timed_out
+
+
+def test_gatherer_runs_providers_concurrently():
+    providers = [SlowProvider(0.2, f"item {index}") for index in range(4)]
+
+    started = time.perf_counter()
+    result = ConcurrentSignalsGatherer(providers=providers, deadline=2).gather("brand")
+
+    assert time.perf_counter() - started < 0.6
+    assert len(result.signals) == 4
+    assert result.finished == ("SlowProvider", "SlowProvider#2", "SlowProvider#3", "SlowProvider#4")
+
+
+def test_gatherer_reports_failures_and_timeouts():
+    blocking = BlockingProvider()
+    static = StaticSignalsProvider([BrandSignal(source="static", headline="Kept")])
+
+    try:
+        started = time.perf_counter()
+        result = ConcurrentSignalsGatherer(
+            providers=[blocking, FailingProvider(), static], deadline=0.2
+        ).gather("brand")
+        elapsed = time.perf_counter() - started
+    finally:
+        blocking.release.set()
+
+    assert elapsed < 1
+    assert [signal.headline for signal in result.signals] == ["Kept"]
+    assert result.timed_out == ("BlockingProvider",)
+    assert result.failed == ("FailingProvider",)
+    assert result.outcomes[1].error == "boom"
+
+
+def test_failed_provider_elapsed_excludes_time_queued_behind_others():
+    providers = [SlowProvider(0.3, "first"), FailingProvider()]
+
+    result = ConcurrentSignalsGatherer(providers=providers, deadline=2, max_workers=1).gather("brand")
+
+    assert result.failed == ("FailingProvider",)
+    assert result.outcomes[0].elapsed >= 0.3
+    assert result.outcomes[1].elapsed < 0.1
@@ -0,0 +1,74 @@
+import pytest
+
+from coding_agent.brand.html_extract import (
+    LxmlHtmlExtractor,
+    SoupHtmlExtractor,
+    StreamingHtmlExtractor,
+    get_extractor,
+    lxml_html,
+)
+
+PAGE = """<!doctype html>
+<html>
+  <head>
+    <meta charset="utf-8">
+    <title> BrandOS &amp; Partners </title>
+    <meta name="description" content=" Creative agency for brands ">
+  </head>
+  <body>
+    <h1>Latest <b>Work</b></h1>
+    <div><p>New campaign   launched for <em>X</em>.</p></div>
+    <h2>About</h2>
+    <h3>Careers</h3>
+    <p>We are hiring.</p>
+    <h2>Latest Work</h2>
+  </body>
+</html>
+"""
+
+
+def chunked(text: str, size: int = 32):
+    body = text.encode("utf-8")
+    return [body[start : start + size] for start in range(0, len(body), size)]
+
+
+BACKENDS = [StreamingHtmlExtractor, SoupHtmlExtractor]
+if lxml_html is not None:
+    BACKENDS.append(LxmlHtmlExtractor)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_extractors_agree_with_beautifulsoup(backend):
+    page = backend().extract(chunked(PAGE), max_headings=5)
+
+    assert page.title == "BrandOS & Partners"
+    assert page.description == "Creative agency for brands"
+    assert page.headings == (
+        ("LatestWork", "New campaign   launched forX."),
+        ("About", "We are hiring."),
+        ("Careers", "We are hiring."),
+        ("Latest Work", None),
+    )
+
+
+def test_streaming_extractor_stops_after_requested_headings():
+    filler = "<section>" + "<p>filler</p>" * 5000 + "</section>"
+    html = PAGE.replace("</body>", filler + "</body>")
+    consumed = []
+
+    def source():
+        for chunk in chunked(html, 256):
+            consumed.append(chunk)
+            yield chunk
+
+    page = StreamingHtmlExtractor().extract(source(), max_headings=2)
+
+    assert [heading for heading, _ in page.headings] == ["LatestWork", "About"]
+    assert sum(len(chunk) for chunk in consumed) < 2048
+
+
+def test_get_extractor_prefers_fast_backend_and_rejects_unknown():
+    expected = LxmlHtmlExtractor if lxml_html is not None else StreamingHtmlExtractor
+    assert isinstance(get_extractor(), expected)
+    with pytest.raises(ValueError):
+        get_extractor("regex")
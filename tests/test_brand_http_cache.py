@@ -0,0 +1,130 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from coding_agent.brand.http_cache import HttpCache
+from coding_agent.brand.sources import GoogleNewsProvider
+
+RSS = b"""<rss><channel><item>
+  <title>GiveCare partners with HealthCo</title>
+  <link>https://news.example.com/article</link>
+</item></channel></rss>"""
+
+
+def make_response(status: int, body: bytes = b"", headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status
+    response.content = body
+    response.iter_content.side_effect = lambda chunk_size: iter([body])
+    response.headers = headers or {}
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_cache_revalidates_with_conditional_get(tmp_path: Path):
+    cache = HttpCache(tmp_path, ttl=0)
+    transport = MagicMock()
+    transport.get.side_effect = [
+        make_response(200, b"payload", {"ETag": '"v1"', "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"}),
+        make_response(304),
+    ]
+
+    first = cache.fetch(transport, "https://example.com/feed", timeout=1)
+    second = cache.fetch(transport, "https://example.com/feed", timeout=1)
+
+    assert first == second == b"payload"
+    conditional_headers = transport.get.call_args_list[1].kwargs["headers"]
+    assert conditional_headers["If-None-Match"] == '"v1"'
+    assert conditional_headers["If-Modified-Since"] == "Tue, 01 Jul 2025 00:00:00 GMT"
+    assert (cache.stats.misses, cache.stats.revalidated, cache.stats.hits) == (1, 1, 0)
+
+
+def test_cache_serves_fresh_entries_without_network_and_survives_restart(tmp_path: Path):
+    transport = MagicMock()
+    transport.get.return_value = make_response(200, b"payload")
+    HttpCache(tmp_path, ttl=60).fetch(transport, "https://example.com/a", timeout=1)
+
+    reopened = HttpCache(tmp_path, ttl=60)
+    assert reopened.fetch(transport, "https://example.com/a", timeout=1) == b"payload"
+    assert transport.get.call_count == 1
+    assert reopened.stats.hits == 1
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = HttpCache(tmp_path, ttl=60, max_bytes=10)
+    cache.store("https://example.com/a", b"aaaa", {})
+    cache.store("https://example.com/b", b"bbbb", {})
+    cache.read_body(cache.lookup("https://example.com/a"))
+    cache.store("https://example.com/c", b"cccc", {})
+
+    assert cache.lookup("https://example.com/a") is not None
+    assert cache.lookup("https://example.com/b") is None
+    assert cache.stats.evictions == 1
+    assert len(list(tmp_path.glob("*.body"))) == 2
+
+
+def test_google_news_provider_reads_through_cache(tmp_path: Path):
+    transport = MagicMock()
+    transport.get.return_value = make_response(200, RSS, {"ETag": '"feed"'})
+    provider = GoogleNewsProvider(query="givecare", transport=transport, cache=HttpCache(tmp_path))
+
+    first = list(provider.load("givecare"))
+    second = list(provider.load("givecare"))
+
+    assert first == second
+    assert first[0].headline.startswith("GiveCare")
+    assert transport.get.call_count == 1
+
+
+def test_stream_closed_early_stops_reading_and_is_not_cached(tmp_path: Path):
+    cache = HttpCache(tmp_path, ttl=60)
+    transport = MagicMock()
+    response = make_response(200, headers={"ETag": '"feed"'})
+    pulled = []
+
+    def chunks(chunk_size):
+        for chunk in (b"abc", b"def", b"ghi"):
+            pulled.append(chunk)
+            yield chunk
+
+    response.iter_content.side_effect = chunks
+    transport.get.return_value = response
+
+    stream = cache.stream(transport, "https://example.com/feed", timeout=1, max_bytes=100)
+    assert next(stream) == b"abc"
+    stream.close()
+
+    assert pulled == [b"abc"]
+    response.close.assert_called_once()
+    assert cache.lookup("https://example.com/feed") is None
+
+    assert b"".join(cache.stream(transport, "https://example.com/feed", timeout=1, max_bytes=100)) == b"abcdefghi"
+    assert cache.lookup("https://example.com/feed") is not None
+    assert (cache.stats.misses, cache.stats.hits) == (2, 0)
+
+
+def test_truncated_stream_is_not_cached(tmp_path: Path):
+    cache = HttpCache(tmp_path, ttl=60)
+    transport = MagicMock()
+    response = make_response(200)
+    response.iter_content.side_effect = lambda chunk_size: iter([b"abc", b"def"])
+    transport.get.return_value = response
+
+    assert b"".join(cache.stream(transport, "https://example.com/big", timeout=1, max_bytes=4)) == b"abcd"
+    assert cache.lookup("https://example.com/big") is None
+
+
+def test_stream_refetches_when_304_body_is_missing(tmp_path: Path):
+    cache = HttpCache(tmp_path, ttl=0)
+    transport = MagicMock()
+    transport.get.side_effect = [
+        make_response(200, b"payload", {"ETag": '"v1"'}),
+        make_response(304),
+        make_response(200, b"fresh", {"ETag": '"v2"'}),
+    ]
+    url = "https://example.com/feed"
+    assert b"".join(cache.stream(transport, url, timeout=1, max_bytes=100)) == b"payload"
+    cache._body_path(cache.lookup(url).key).unlink()
+
+    assert b"".join(cache.stream(transport, url, timeout=1, max_bytes=100)) == b"fresh"
+    assert "If-None-Match" not in (transport.get.call_args_list[2].kwargs["headers"] or {})
+    assert cache.read_body(cache.lookup(url)) == b"fresh"
@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+
+from coding_agent.brand import maintenance
+from coding_agent.brand.archive import JsonSignalArchive, ParquetSignalArchive, SignalQuery
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.rollups import RollupStore, period_of
+from coding_agent.brand.storage import KuzuStorageEngine, persist_to_kuzu, prune_reports
+
+try:
+    import pyarrow
+except ImportError:  # the Parquet cases are skipped
+    pyarrow = None
+
+needs_pyarrow = pytest.mark.skipif(pyarrow is None, reason="pyarrow is not installed")
+
+DAYS = [date(2024, 3, 30), date(2024, 3, 31), date(2024, 4, 1), date(2024, 4, 2)]
+
+
+def _report(day: date, mentions: float) -> BrandReport:
+    return BrandReport(brand_id="acme", report_date=day, overview=f"On {day}", metrics={"mentions": mentions})
+
+
+def _fill(archive) -> None:
+    for index, day in enumerate(DAYS):
+        archive.write_signals("acme", day, [BrandSignal(source="news", headline=f"Story {index}")])
+        archive.write_summary("acme", _report(day, float(index + 1)), f"msg-{index}")
+
+
+def _headlines(archive, **query):
+    return [item.signal.headline for batch in archive.scan_signals(SignalQuery(**query)) for item in batch]
+
+
+def test_json_compaction_folds_days_into_months(tmp_path):
+    archive = JsonSignalArchive(tmp_path)
+    _fill(archive)
+
+    assert archive.compact(date(2024, 4, 2)) == 3
+
+    assert sorted(path.name for path in (tmp_path / "acme").iterdir()) == [
+        "2024-03.json.gz",
+        "2024-04-02",
+        "2024-04.json.gz",
+    ]
+    assert _headlines(archive) == ["Story 0", "Story 1", "Story 2", "Story 3"]
+    assert _headlines(archive, start=date(2024, 4, 1)) == ["Story 2", "Story 3"]
+    assert [report.overview for report, _ in archive.read_summaries()][0] == "On 2024-03-30"
+    archive.write_signals("acme", date(2024, 3, 31), [BrandSignal(source="news", headline="Rerun")])
+    assert _headlines(archive, end=date(2024, 3, 31)) == ["Story 0", "Rerun"]
+
+
+@pytest.mark.parametrize("kind", ["json", pytest.param("parquet", marks=needs_pyarrow)])
+def test_prune_drops_expired_days(tmp_path, kind):
+    archive = JsonSignalArchive(tmp_path) if kind == "json" else ParquetSignalArchive(tmp_path)
+    _fill(archive)
+    archive.compact(date(2024, 3, 31))
+
+    assert archive.prune(date(2024, 4, 1)) == 2
+    assert _headlines(archive) == ["Story 2", "Story 3"]
+    assert [report.report_date for report, _ in archive.read_summaries()] == DAYS[2:]
+    assert archive.prune(date(2024, 4, 1)) == 0
+
+
+def test_rollups_keep_periods_that_lost_reports(tmp_path):
+    store = RollupStore(tmp_path)
+    reports = [_report(day, float(index + 1)) for index, day in enumerate(DAYS)]
+
+    assert period_of(date(2024, 4, 2), "week") == ("2024-W14", date(2024, 4, 1))
+    assert store.merge("month", reports, frozen_before=date(2024, 1, 1)) == 2
+    march = store.read("acme", "month")["2024-03"]["mentions"]
+    assert (march.count, march.total, march.minimum, march.maximum, march.mean) == (2, 3.0, 1.0, 2.0, 1.5)
+
+    store.merge("month", reports[1:], frozen_before=date(2024, 4, 1))
+    assert store.read("acme", "month")["2024-03"]["mentions"].count == 2
+    store.merge("week", reports, frozen_before=date(2024, 1, 1))
+    assert list(store.read("acme", "week")) == ["2024-W13", "2024-W14"]
+
+
+def test_prune_reports_keeps_highlights_still_referenced(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    shared = BrandSignal(source="news", headline="Still running")
+    for index, day in enumerate(DAYS):
+        signals = [shared, BrandSignal(source="news", headline=f"Only on {day}")]
+        persist_to_kuzu("acme", _report(day, 1.0), f"msg-{index}", signals, engine=engine)
+
+    assert prune_reports(date(2024, 4, 1), batch_size=1, engine=engine) == (2, 2)
+
+    with engine.connection() as conn:
+        reports = conn.execute("MATCH (r:Report) RETURN r.report_date ORDER BY r.report_date").get_all()
+        headlines = conn.execute("MATCH (h:Highlight) RETURN h.headline ORDER BY h.headline").get_all()
+    assert reports == [["2024-04-01"], ["2024-04-02"]]
+    assert headlines == [["Only on 2024-04-01"], ["Only on 2024-04-02"], ["Still running"]]
+    engine.close()
+
+
+def test_main_runs_every_step(tmp_path, capsys):
+    archive = JsonSignalArchive(tmp_path)
+    _fill(archive)
+    (tmp_path / ".runs").mkdir()
+    (tmp_path / ".runs" / "20240301T000000000000Z.json").write_text("{}")
+
+    result = maintenance.run_maintenance(
+        today=date(2024, 4, 3), retention_days=3, compact_after_days=1, root=tmp_path, archive=archive
+    )
+
+    assert result == maintenance.MaintenanceResult(
+        rollup_periods=4, compacted_days=3, pruned_days=1, pruned_manifests=1
+    )
+    assert RollupStore(tmp_path).read("acme", "month")["2024-03"]["mentions"].count == 2
+    assert maintenance.main(["--data-root", str(tmp_path), "--db", str(tmp_path / "missing.db")]) == 0
+    assert "pruned_reports=0" in capsys.readouterr().out
@@ -0,0 +1,30 @@
+import random
+
+from coding_agent.brand.matcher import TermMatcher
+
+
+def test_matcher_finds_overlapping_terms_across_categories():
+    matcher = TermMatcher({"keyword": ["he", "she", "hers"], "competitor": ["his", "She"]})
+
+    hits = matcher.find("USHERS and this")
+
+    assert hits["keyword"] == {"he", "she", "hers"}
+    assert hits["competitor"] == {"his", "she"}
+
+
+def test_matcher_word_boundary_mode():
+    matcher = TermMatcher({"keyword": ["care", "give care"]}, word_boundary=True)
+
+    assert matcher.find("Caregivers who give care.")["keyword"] == {"care", "give care"}
+    assert matcher.find("Caregivers and daycare")["keyword"] == set()
+
+
+def test_matcher_agrees_with_substring_scan():
+    rng = random.Random(7)
+    alphabet = "abc d"
+    terms = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() or "a" for _ in range(40)}
+    matcher = TermMatcher({"keyword": terms})
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert matcher.find(text)["keyword"] == {term for term in terms if term in text}
@@ -0,0 +1,60 @@
+import pickle
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from coding_agent.brand.benchmark import main, run_benchmark
+from coding_agent.brand.models import BrandReport, BrandSignal
+
+
+def test_trusted_factories_match_validated_models():
+    fields = {
+        "source": "news",
+        "headline": "Acme opens store",
+        "impact": "high",
+        "url": "https://example.com/a",
+        "summary": "Downtown",
+        "first_seen": date(2025, 1, 2),
+        "cluster_size": 3,
+        "keyword_hits": 2,
+    }
+    validated = BrandSignal(**fields)
+    trusted = BrandSignal.trusted(**fields)
+
+    assert trusted == validated
+    assert trusted.to_record() == validated.model_dump(mode="json")
+    assert BrandSignal.trusted(source="news", headline="x").to_record() == BrandSignal(
+        source="news", headline="x"
+    ).model_dump(mode="json")
+    assert trusted.trusted_copy(summary=None) == validated.model_copy(update={"summary": None})
+    with pytest.raises(TypeError, match="headlines"):
+        trusted.trusted_copy(headlines="typo")
+    assert trusted.model_copy(update={"impact": "low"}).impact == "low"
+    assert pickle.loads(pickle.dumps(trusted)) == validated
+    assert BrandSignal.model_validate_json(trusted.model_dump_json()) == validated
+    with pytest.raises(ValidationError):
+        trusted.headline = "changed"
+
+    report = BrandReport.trusted(brand_id="acme", report_date=date(2025, 1, 2), highlights=(trusted,), metrics={"total": 1.0})
+    assert report == BrandReport(brand_id="acme", report_date=date(2025, 1, 2), highlights=(validated,), metrics={"total": 1})
+
+
+def test_validation_still_guards_untrusted_input():
+    with pytest.raises(ValidationError):
+        BrandSignal.model_validate({"source": "news", "headline": "x", "cluster_size": "many"})
+    assert BrandSignal(source=" news ", headline=" Acme ").headline == "Acme"
+
+
+def test_benchmark_reports_every_step(capsys):
+    assert [row[0] for row in run_benchmark(signals=20, repeat=1)] == [
+        "construct",
+        "copy with update",
+        "serialize",
+        "relevance filter",
+        "near-dup signature",
+        "summarize",
+    ]
+    assert main(["--signals", "10", "--repeat", "1", "--min-rate", "1"]) == 0
+    assert "signals/s" in capsys.readouterr().out
+    assert main(["--signals", "10", "--repeat", "1", "--min-rate", "1e12"]) == 1
@@ -0,0 +1,37 @@
+import time
+
+from coding_agent.brand.neardup import MinHashLSH, shingles
+
+
+def test_minhash_lsh_clusters_are_stable_and_separate_unrelated_texts():
+    lsh = MinHashLSH()
+    texts = [
+        "Acme reports record quarterly earnings",
+        "Globex hires new CMO",
+        "ACME reports record quarterly earnings!",
+        "Initech opens a second office in Austin",
+    ]
+
+    assert lsh.signature(texts[0]) == MinHashLSH().signature(texts[0])
+    assert len(lsh.signature("Acme")) == lsh.bands * lsh.rows
+    assert lsh.similarity(lsh.signature("Acme"), lsh.signature("ACME!")) == 1.0
+    assert lsh.cluster(texts) == [[0, 2], [1], [3]]
+    assert lsh.cluster([]) == []
+
+
+def test_shingles_ignore_case_and_punctuation():
+    assert shingles("Acme, Inc.") == shingles("ACME inc")
+    assert shingles("") == set()
+
+
+def test_cluster_scales_linearly_with_syndicated_copies():
+    lsh = MinHashLSH()
+    copies = [f"Acme recalls kettles after safety review - outlet {index}" for index in range(4000)]
+
+    started = time.perf_counter()
+    clusters = lsh.cluster(copies)
+    elapsed = time.perf_counter() - started
+
+    assert len(clusters) == 1 and len(clusters[0]) == 4000
+    # Comparing every pair in the shared buckets took tens of seconds here.
+    assert elapsed < 5.0
@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand.queries import highlights_mentioning, last_reports, source_frequency
+from coding_agent.brand.storage import KuzuBulkWriter, KuzuStorageEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    writer = KuzuBulkWriter(engine)
+    history = [
+        ("acme", date(2024, 4, 28), [("news", "Acme opens Berlin office"), ("blog", "Quarterly recap")]),
+        ("acme", date(2024, 5, 1), [("news", "Acme launches caregiver app"), ("news", "Analysts upbeat")]),
+        ("acme", date(2024, 5, 2), [("social", "Caregiver community grows")]),
+        ("globex", date(2024, 5, 1), [("news", "Globex caregiver pilot")]),
+    ]
+    for brand_id, report_date, headlines in history:
+        signals = [BrandSignal(source=source, headline=headline) for source, headline in headlines]
+        report = BrandReport(brand_id=brand_id, report_date=report_date, overview="o", metrics={"mentions": 1})
+        writer.add_report(brand_id, report, f"msg-{report_date.isoformat()}", signals)
+    writer.flush()
+    yield engine
+    engine.close()
+
+
+def test_last_reports_newest_first(engine):
+    reports = last_reports("acme", limit=2, engine=engine)
+
+    assert [report.report_date for report in reports] == [date(2024, 5, 2), date(2024, 5, 1)]
+    assert reports[1].highlight_count == 2
+    assert reports[1].metrics == {"mentions": 1}
+    assert last_reports("unknown", engine=engine) == []
+
+
+def test_highlights_mentioning_term_in_range(engine):
+    found = highlights_mentioning("CAREGIVER", date(2024, 5, 1), date(2024, 5, 1), engine=engine)
+    assert {(record.brand_id, record.headline) for record in found} == {
+        ("acme", "Acme launches caregiver app"),
+        ("globex", "Globex caregiver pilot"),
+    }
+
+    acme_only = highlights_mentioning("caregiver", date(2024, 4, 1), date(2024, 5, 31), brand_id="acme", engine=engine)
+    assert [record.headline for record in acme_only] == ["Caregiver community grows", "Acme launches caregiver app"]
+
+
+def test_source_frequency_by_period(engine):
+    daily = source_frequency(date(2024, 5, 1), date(2024, 5, 2), brand_id="acme", engine=engine)
+    assert [(row.period, row.source, row.count) for row in daily] == [
+        ("2024-05-01", "news", 2),
+        ("2024-05-02", "social", 1),
+    ]
+
+    monthly = source_frequency(date(2024, 4, 1), date(2024, 5, 31), period="month", engine=engine)
+    assert [(row.period, row.source, row.count) for row in monthly] == [
+        ("2024-04", "blog", 1),
+        ("2024-04", "news", 1),
+        ("2024-05", "news", 3),
+        ("2024-05", "social", 1),
+    ]
+
+    with pytest.raises(ValueError):
+        source_frequency(date(2024, 4, 1), date(2024, 5, 31), period="week", engine=engine)
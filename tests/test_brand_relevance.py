@@ -1,8 +1,8 @@
 from datetime import date
 
 from coding_agent.brand.config import BrandProfile
-from coding_agent.brand.models import BrandSignal
-from coding_agent.brand.relevance import apply_relevance_filter
+from coding_agent.brand.models import BrandSignal, SignalBatch
+from coding_agent.brand.relevance import apply_relevance_filter, filter_signal_batch
 
 
 def make_profile() -> BrandProfile:
@@ -47,3 +47,48 @@ def test_relevance_requires_keyword():
 
     assert not filtered
     assert rejected[0].reason == "no matching brand keywords"
+
+
+def test_relevance_reports_competitor_and_keyword_hits():
+    signals = (
+        BrandSignal(source="news", headline="Care.com and GiveCare expand remote care", impact="medium"),
+    )
+
+    filtered, rejected = apply_relevance_filter(signals, make_profile())
+
+    assert not rejected
+    assert filtered[0].summary == "(Relevance: keywords givecare, remote; competitors care.com)"
+    assert filtered[0].keyword_hits == 3
+
+
+def test_relevance_word_boundary_mode_ignores_partial_words():
+    signals = (
+        BrandSignal(source="news", headline="Remotely operated drones", impact="low"),
+    )
+
+    loose, _ = apply_relevance_filter(signals, make_profile())
+    strict, rejected = apply_relevance_filter(signals, make_profile(), word_boundary=True)
+
+    assert len(loose) == 1
+    assert not strict
+    assert rejected[0].reason == "no matching brand keywords"
+
+
+def test_signal_batch_round_trips_and_filters_without_models():
+    signals = (
+        BrandSignal(source="news", headline="GiveCare adds remote visits", impact="high", first_seen=date(2025, 1, 2)),
+        BrandSignal(source="news", headline="Bosch GiveCare promo", impact="low"),
+        BrandSignal(source="blog", headline="Care.com update", impact="urgent", url="https://example.com", cluster_size=3),
+    )
+
+    batch = SignalBatch.from_signals(signals)
+    accepted, rejected = filter_signal_batch(batch, make_profile())
+
+    assert batch.to_signals() == signals
+    assert batch.impact_levels == ("high", "medium", "low", "urgent")
+    assert batch.impact_counts() == {"high": 1, "low": 1, "urgent": 1}
+    assert batch.sources[0] is batch.sources[1]
+    assert accepted.headlines == ("GiveCare adds remote visits", "Care.com update")
+    assert list(accepted.keyword_hits) == [2, 1]
+    assert accepted.to_signals() == apply_relevance_filter(signals, make_profile())[0]
+    assert [entry.signal for entry in rejected] == [signals[1]]
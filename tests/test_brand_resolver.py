@@ -0,0 +1,105 @@
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from coding_agent.brand.resolver import DnsCache
+from coding_agent.brand.sources import _validate_url
+from coding_agent.brand.transport import HttpTransport
+
+
+def fake_getaddrinfo(mapping, calls):
+    def resolve(host, port, proto=0):
+        calls.append(host)
+        if host not in mapping:
+            raise socket.gaierror("unknown host")
+        return [(socket.AF_INET, socket.SOCK_STREAM, proto, "", (address, 0)) for address in mapping[host]]
+
+    return resolve
+
+
+def test_dns_cache_resolves_each_host_once_per_ttl():
+    calls: list[str] = []
+    cache = DnsCache(ttl=60, getaddrinfo=fake_getaddrinfo({"news.example.com": ["93.184.216.34"] * 2}, calls))
+
+    assert cache.resolve("news.example.com") == ("93.184.216.34",)
+    assert cache.resolve("NEWS.example.com") == ("93.184.216.34",)
+    assert calls == ["news.example.com"]
+
+    expired = DnsCache(ttl=0, getaddrinfo=fake_getaddrinfo({"news.example.com": ["93.184.216.34"]}, calls))
+    expired.resolve("news.example.com")
+    expired.resolve("news.example.com")
+    assert len(calls) == 3
+
+
+def test_validate_url_uses_shared_cache_and_blocks_private_addresses():
+    calls: list[str] = []
+    resolver = DnsCache(
+        getaddrinfo=fake_getaddrinfo({"public.example": ["93.184.216.34"], "rebind.example": ["10.0.0.5"]}, calls)
+    )
+
+    assert _validate_url("https://public.example/page", resolver) == ("93.184.216.34",)
+    with pytest.raises(ValueError, match="private/internal"):
+        _validate_url("https://rebind.example/", resolver)
+    assert _validate_url("https://missing.example/", resolver) == ()
+
+
+def test_resolve_many_runs_without_blocking():
+    async def main():
+        cache = DnsCache()
+        results = await cache.resolve_many(["localhost", "LOCALHOST"])
+        return cache, results
+
+    cache, results = asyncio.run(main())
+    assert list(results) == ["localhost"]
+    assert cache.resolve("localhost") == results["localhost"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = self.headers["Host"].encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+def test_transport_pins_connections_to_cached_addresses(local_server):
+    calls: list[str] = []
+    resolver = DnsCache(getaddrinfo=fake_getaddrinfo({"brand.test": ["127.0.0.1"]}, calls))
+
+    with HttpTransport(resolver=resolver, allow_internal=True, max_retries=0) as transport:
+        response = transport.get(f"http://brand.test:{local_server}/", timeout=2)
+        assert response.text == f"brand.test:{local_server}"
+
+    with HttpTransport(resolver=resolver, max_retries=0) as transport:
+        with pytest.raises(requests.ConnectionError, match="private/internal"):
+            transport.get(f"http://brand.test:{local_server}/", timeout=2)
+    assert calls == ["brand.test"]
+
+
+@pytest.mark.parametrize("host", ["unknown.test", "empty.test"])
+def test_transport_never_connects_unpinned_when_resolution_fails(local_server, host):
+    resolver = DnsCache(getaddrinfo=fake_getaddrinfo({"empty.test": []}, []))
+
+    with patch("urllib3.util.connection.create_connection") as create_connection:
+        with HttpTransport(resolver=resolver, allow_internal=True, max_retries=0) as transport:
+            with pytest.raises(requests.ConnectionError):
+                transport.get(f"http://{host}:{local_server}/", timeout=2)
+    create_connection.assert_not_called()
@@ -0,0 +1,82 @@
+from datetime import date
+
+import pytest
+
+from coding_agent.brand.config import BrandProfile, compile_profile
+from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.scoring import ScoringPolicy, WeightedScorer, build_scoring_policy, register_scorer
+from coding_agent.brand.summarizer import HeuristicSummarizer, StreamingSummarizer
+
+
+def test_policy_ranks_by_impact_hits_diversity_and_cluster_size():
+    signals = (
+        BrandSignal(source="blog", headline="Routine mention", impact="low"),
+        BrandSignal(source="wire", headline="Acme recalls kettles", impact="medium", cluster_size=8),
+        BrandSignal(source="news", headline="Acme opens store", impact="medium", keyword_hits=3),
+        BrandSignal(source="news", headline="Acme hires CMO", impact="high"),
+        BrandSignal(source="news", headline="Acme sponsors league", impact="medium"),
+        BrandSignal(source="rare", headline="Acme joins index", impact="medium"),
+    )
+
+    selected = ScoringPolicy(max_highlights=4).select(signals)
+
+    assert [signal.headline for signal in selected] == [
+        "Acme recalls kettles",
+        "Acme opens store",
+        "Acme hires CMO",
+        "Acme joins index",
+    ]
+    without_diversity = ScoringPolicy(scorer=WeightedScorer(source_diversity=0.0), max_highlights=4).select(signals)
+    assert without_diversity[-1].headline == "Acme sponsors league"
+
+
+def test_build_policy_uses_registered_scorers():
+    register_scorer("headline_length", lambda config: lambda signal, context: len(signal.headline) * config["scale"])
+
+    policy = build_scoring_policy({"scorer": "headline_length", "max_highlights": 1, "scale": -1})
+    weighted = build_scoring_policy({"impact": {"high": 10}, "cluster_size": 0})
+
+    assert policy.select((BrandSignal(source="a", headline="Long headline"), BrandSignal(source="b", headline="Short")))[
+        0
+    ].headline == "Short"
+    assert weighted.scorer.impact == {"high": 10.0, "medium": 2.0, "low": 1.0}
+    assert weighted.scorer.cluster_size == 0.0
+    with pytest.raises(ValueError):
+        build_scoring_policy({"scorer": "missing"})
+
+
+def test_profile_scoring_caps_report_highlights():
+    compiled = compile_profile(
+        BrandProfile(brand_id="acme", company_summary="x", keywords=["acme"], scoring={"max_highlights": 2})
+    )
+    fallback = compile_profile(
+        BrandProfile(brand_id="acme", company_summary="x", keywords=["acme"], scoring={"scorer": "missing"})
+    )
+    signals = [
+        BrandSignal(source=f"outlet-{index}", headline=headline, impact=impact)
+        for index, (headline, impact) in enumerate(
+            [("Acme opens store", "low"), ("Globex sues Acme", "high"), ("Acme wins award", "medium")]
+        )
+    ]
+
+    report = HeuristicSummarizer(scoring=compiled.scoring).summarize("acme", date(2025, 1, 15), signals)
+
+    assert compiled.scoring.max_highlights == 2
+    assert fallback.scoring == ScoringPolicy()
+    assert [signal.headline for signal in report.highlights] == ["Globex sues Acme", "Acme wins award"]
+    assert report.metrics["total_signals"] == 3
+
+
+def test_streaming_retention_uses_the_policy_score():
+    signals = [
+        BrandSignal(source="wire", headline="Acme names a new finance chief", impact="high"),
+        BrandSignal(source="wire", headline="Globex moves its headquarters", impact="high"),
+        BrandSignal(source="blog", headline="Acme rocket tested at night", impact="low", keyword_hits=3),
+        BrandSignal(source="blog", headline="Acme rocket fuel supplier signed", impact="low", keyword_hits=3),
+    ]
+    policy = ScoringPolicy(WeightedScorer(keyword_hits=10.0), max_highlights=2)
+
+    report = StreamingSummarizer(max_highlights=2, scoring=policy).summarize("acme", date(2025, 1, 2), iter(signals))
+
+    assert [signal.headline for signal in report.highlights] == [signal.headline for signal in signals[2:]]
+    assert report.highlights == HeuristicSummarizer(scoring=policy).summarize("acme", date(2025, 1, 2), signals).highlights
@@ -0,0 +1,88 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from coding_agent.brand.models import BrandSignal
+from coding_agent.brand.signal_store import BloomFilter, SignalStore, normalize_url, signal_key
+
+
+def test_signal_key_ignores_case_whitespace_and_tracking_params():
+    original = BrandSignal(source="news", headline="Acme  ships App", url="https://Acme.test/post/?utm_source=x#top")
+    repeat = BrandSignal(source="blog", headline="acme ships app", url="https://acme.test/post", impact="high")
+    other = BrandSignal(source="news", headline="Acme ships App", summary="More detail")
+
+    assert normalize_url("HTTPS://Acme.test/a/?b=2&a=1&fbclid=z") == "https://acme.test/a?a=1&b=2"
+    assert signal_key(original) == signal_key(repeat)
+    assert signal_key(original) != signal_key(other)
+
+
+def test_bloom_filter_has_no_false_negatives_and_round_trips(tmp_path):
+    bloom = BloomFilter(1_000, 0.01)
+    keys = [f"key-{index}" for index in range(1_000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    assert sum(f"other-{index}" in bloom for index in range(10_000)) < 300
+    bloom.save(tmp_path / "bloom.bin")
+    loaded = BloomFilter.load(tmp_path / "bloom.bin")
+    assert loaded is not None and loaded.count == 1_000
+    assert all(key in loaded for key in keys)
+
+
+def test_store_keeps_one_copy_and_tracks_first_seen(tmp_path):
+    store = SignalStore(tmp_path, capacity=8)
+    story = BrandSignal(source="news", headline="Acme opens a store")
+    fresh = BrandSignal(source="news", headline="Acme hires a CEO")
+
+    store.put_many([story], date(2024, 5, 2))
+    store.put_many([story], date(2024, 5, 1))
+    annotated = store.annotate([story, fresh], date(2024, 5, 3))
+
+    assert len(store) == 1
+    assert store.seen(signal_key(story)) and not store.seen(signal_key(fresh))
+    assert store.get(signal_key(story)) == story
+    assert [signal.first_seen for signal in annotated] == [date(2024, 5, 1), date(2024, 5, 3)]
+    store.close()
+
+
+def test_store_reopens_and_rebuilds_stale_filter(tmp_path):
+    store = SignalStore(tmp_path, capacity=4)
+    signals = [BrandSignal(source="news", headline=f"Story {index}") for index in range(10)]
+    threads = [
+        threading.Thread(target=store.put_many, args=(signals[index::2], date(2024, 5, 1))) for index in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+    (tmp_path / "bloom.bin").unlink()
+
+    reopened = SignalStore(tmp_path, capacity=4)
+    assert len(reopened) == 10
+    assert all(reopened.seen(signal_key(signal)) for signal in signals)
+    reopened.close()
+
+
+def _put_stories(root, prefix):
+    store = SignalStore(root, capacity=4)
+    for index in range(0, 40, 4):
+        store.put_many(
+            [BrandSignal(source="news", headline=f"{prefix} story {item}") for item in range(index, index + 4)],
+            date(2024, 5, 1),
+        )
+    store.close()
+
+
+def test_store_is_safe_across_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        list(pool.map(_put_stories, [tmp_path, tmp_path], ["first", "second"]))
+
+    store = SignalStore(tmp_path, capacity=4)
+    assert len(store) == 80
+    assert store.seen(signal_key(BrandSignal(source="news", headline="second story 39")))
+    assert sorted(path.name for path in tmp_path.iterdir() if path.suffix == ".tmp") == []
+    store.close()
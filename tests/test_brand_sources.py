@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from coding_agent.brand.models import BrandSignal
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from coding_agent.brand.sources import (
     FileSignalsProvider,
@@ -33,8 +33,7 @@ def test_static_signals_provider():
     assert signals == [signal]
 
 
-@patch("coding_agent.brand.sources.requests.get")
-def test_web_page_signals_provider(mock_get: MagicMock):
+def test_web_page_signals_provider():
     mock_response = MagicMock()
     mock_response.text = """
         <html>
@@ -45,10 +44,12 @@ def test_web_page_signals_provider(mock_get: MagicMock):
           </body>
         </html>
     """
+    mock_response.iter_content.return_value = [mock_response.text.encode("utf-8")]
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    transport = MagicMock()
+    transport.get.return_value = mock_response
 
-    provider = WebPageSignalsProvider(url="https://example.com")
+    provider = WebPageSignalsProvider(url="https://example.com", transport=transport)
     signals = list(provider.load("brand"))
 
     assert len(signals) >= 1
@@ -56,8 +57,7 @@ def test_web_page_signals_provider(mock_get: MagicMock):
     assert signals[0].summary == "Creative agency for brands"
 
 
-@patch("coding_agent.brand.sources.requests.get")
-def test_google_news_provider(mock_get: MagicMock):
+def test_google_news_provider():
     mock_response = MagicMock()
     mock_response.text = """
     <rss><channel>
@@ -68,12 +68,77 @@ def test_google_news_provider(mock_get: MagicMock):
       </item>
     </channel></rss>
     """
+    mock_response.iter_content.return_value = [mock_response.text.encode("utf-8")]
     mock_response.raise_for_status.return_value = None
-    mock_get.return_value = mock_response
+    transport = MagicMock()
+    transport.get.return_value = mock_response
 
-    provider = GoogleNewsProvider(query="givecare")
+    provider = GoogleNewsProvider(query="givecare", transport=transport)
     signals = list(provider.load("givecare"))
 
     assert len(signals) == 1
     assert signals[0].headline.startswith("GiveCare")
     assert signals[0].url == "https://news.example.com/article"
+    assert "news.google.com" in transport.get.call_args.args[0]
+
+
+def _feed(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>Story {index}</title><link>https://outlet{index}.example/a</link></item>"
+        for index in range(count)
+    )
+    return f"<rss><channel><title>Feed</title>{items}</channel></rss>".encode("utf-8")
+
+
+def _chunked(body: bytes, size: int, consumed: list):
+    for start in range(0, len(body), size):
+        consumed.append(start)
+        yield body[start : start + size]
+
+
+def test_google_news_provider_streams_and_stops_after_max_items():
+    body = _feed(200)
+    consumed: list = []
+    response = MagicMock()
+    response.iter_content.return_value = _chunked(body, 64, consumed)
+    transport = MagicMock()
+    transport.get.return_value = response
+
+    provider = GoogleNewsProvider(query="brand", max_items=3, transport=transport)
+    signals = list(provider.load("brand"))
+
+    assert [signal.headline for signal in signals] == ["Story 0", "Story 1", "Story 2"]
+    assert signals[1].source == "outlet1.example"
+    assert len(consumed) * 64 < len(body) / 10
+    assert transport.get.call_args.kwargs["stream"] is True
+    response.close.assert_called_once()
+
+
+def test_google_news_provider_caps_bytes_read():
+    body = _feed(50)
+    response = MagicMock()
+    response.iter_content.return_value = _chunked(body, 64, [])
+    transport = MagicMock()
+    transport.get.return_value = response
+
+    provider = GoogleNewsProvider(query="brand", max_items=50, max_bytes=400, transport=transport)
+    signals = list(provider.load("brand"))
+
+    assert 0 < len(signals) < 10
+
+
+def test_google_news_provider_buffered_mode_matches_streaming():
+    body = _feed(8)
+    buffered_response = MagicMock(text=body.decode("utf-8"))
+    streamed_response = MagicMock()
+    streamed_response.iter_content.return_value = [body]
+    buffered_transport = MagicMock()
+    buffered_transport.get.return_value = buffered_response
+    streamed_transport = MagicMock()
+    streamed_transport.get.return_value = streamed_response
+
+    buffered = list(GoogleNewsProvider(query="q", streaming=False, transport=buffered_transport).load("b"))
+    streamed = list(GoogleNewsProvider(query="q", transport=streamed_transport).load("b"))
+
+    assert buffered == streamed
+    assert len(streamed) == 5
@@ -0,0 +1,287 @@
+import threading
+from datetime import date
+from unittest.mock import patch
+
+import kuzu
+import pytest
+
+from coding_agent.brand.archive import JsonSignalArchive
+from coding_agent.brand.fileio import write_batch
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand import migrate, storage
+from coding_agent.brand.signal_store import signal_key
+from coding_agent.brand.storage import (
+    SCHEMA_VERSION,
+    KuzuBulkWriter,
+    KuzuStorageEngine,
+    ReportHistory,
+    get_storage_engine,
+    persist_to_kuzu,
+)
+
+
+def _report(overview: str = "Steady week") -> BrandReport:
+    return BrandReport(
+        brand_id="acme",
+        report_date=date(2024, 5, 1),
+        overview=overview,
+        highlights=[BrandSignal(source="news", headline="Acme ships it's new app")],
+        metrics={"mentions": 3},
+    )
+
+
+def _count(engine: KuzuStorageEngine, table: str) -> int:
+    with engine.connection() as conn:
+        return conn.execute(f"MATCH (n:{table}) RETURN count(n)").get_next()[0]
+
+
+def _count_edges(engine: KuzuStorageEngine, table: str) -> int:
+    with engine.connection() as conn:
+        return conn.execute(f"MATCH ()-[e:{table}]->() RETURN count(e)").get_next()[0]
+
+
+def test_engine_migrates_once_and_reuses_database(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    signals = [BrandSignal(source="news", headline="Acme ships it's new app", url="https://acme.test")]
+
+    with patch("coding_agent.brand.storage.kuzu.Database", wraps=kuzu.Database) as database:
+        with patch.object(engine, "migrate", wraps=engine.migrate) as migrate:
+            persist_to_kuzu("acme", _report(), "msg-1", signals, engine=engine)
+            persist_to_kuzu("acme", _report(), "msg-2", signals, engine=engine)
+
+    assert database.call_count == 1
+    assert migrate.call_count == 1
+    assert _count(engine, "Report") == 2
+    assert _count(engine, "Highlight") == 1
+    assert _count_edges(engine, "HAS_HIGHLIGHT") == 2
+    with engine.connection() as conn:
+        headline = conn.execute("MATCH (h:Highlight) RETURN h.headline LIMIT 1").get_next()[0]
+    assert headline == "Acme ships it's new app"
+    engine.close()
+
+
+def test_migration_is_skipped_for_current_database(tmp_path):
+    path = tmp_path / "brandos.db"
+    first = KuzuStorageEngine(path)
+    assert first.migrate() == SCHEMA_VERSION
+    first.close()
+
+    second = KuzuStorageEngine(path)
+    assert second.migrate() == SCHEMA_VERSION
+    second.close()
+    assert second.closed
+
+
+def test_concurrent_writers_share_engine(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db", pool_size=2)
+
+    def write(index: int) -> None:
+        signals = [BrandSignal(source="news", headline=f"Headline {index}")]
+        persist_to_kuzu("acme", _report(), f"msg-{index}", signals, engine=engine)
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _count(engine, "Report") == 6
+    assert len(engine._idle) <= 2
+    engine.close()
+
+
+def test_get_storage_engine_is_shared_per_path(tmp_path):
+    assert get_storage_engine(tmp_path / "a.db") is get_storage_engine(tmp_path / "a.db")
+    assert get_storage_engine(tmp_path / "a.db") is not get_storage_engine(tmp_path / "b.db")
+
+
+def test_persist_is_an_idempotent_upsert(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    signals = [BrandSignal(source="news", headline=f"Headline {index}") for index in range(3)]
+
+    persist_to_kuzu("acme", _report("First pass"), "msg-1", signals, engine=engine)
+    persist_to_kuzu("acme", _report("Second pass"), "msg-1", signals, engine=engine)
+
+    assert _count(engine, "Brand") == 1
+    assert _count(engine, "Report") == 1
+    assert _count(engine, "Highlight") == 3
+    assert _count_edges(engine, "HAS_REPORT") == 1
+    assert _count_edges(engine, "HAS_HIGHLIGHT") == 3
+    assert _count_edges(engine, "FROM_SOURCE") == 3
+    with engine.connection() as conn:
+        overview = conn.execute("MATCH (r:Report) RETURN r.overview").get_next()[0]
+    assert overview == "Second pass"
+    engine.close()
+
+
+def test_bulk_writer_copies_large_tables_and_merges_existing_rows(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    first = [BrandSignal(source="news", headline="Existing headline")]
+    persist_to_kuzu("acme", _report(), "msg-1", first, engine=engine)
+
+    writer = KuzuBulkWriter(engine, copy_threshold=2)
+    signals = [
+        BrandSignal(source="news", headline="Updated, with \"quotes\"\nand a newline"),
+        BrandSignal(source="blog", headline="Brand new it's here", url="https://acme.test"),
+    ]
+    writer.add_report("acme", _report(), "msg-1", signals)
+    writer.add_report("globex", _report(), "msg-2", signals)
+    with patch.object(writer, "_copy", wraps=writer._copy) as copy:
+        counts = writer.flush()
+
+    assert counts["Highlight"] == 2
+    assert {call.args[1] for call in copy.call_args_list} >= {"Highlight", "HAS_HIGHLIGHT", "FROM_SOURCE"}
+    assert len(writer) == 0
+    assert _count(engine, "Brand") == 2
+    assert _count(engine, "Report") == 2
+    assert _count(engine, "Highlight") == 3
+    assert _count(engine, "Source") == 2
+    assert _count_edges(engine, "HAS_HIGHLIGHT") == 4
+    key = signal_key(signals[0])
+    with engine.connection() as conn:
+        sources = conn.execute(
+            "MATCH (:Highlight {id: $key})-[:FROM_SOURCE]->(s:Source) RETURN s.name", {"key": key}
+        ).get_all()
+        headline = conn.execute("MATCH (h:Highlight) WHERE h.id = $key RETURN h.headline", {"key": key}).get_next()[0]
+        reports = conn.execute(
+            "MATCH (r:Report)-[:HAS_HIGHLIGHT]->(:Highlight {id: $key}) RETURN r.brand_id ORDER BY r.brand_id",
+            {"key": key},
+        ).get_all()
+    assert sources == [["news"]]
+    assert headline == "Updated, with \"quotes\"\nand a newline"
+    assert reports == [["acme"], ["globex"]]
+    engine.close()
+
+
+def test_failed_flush_writes_nothing_and_keeps_rows(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    writer = KuzuBulkWriter(engine)
+    writer.add_report("acme", _report(), "msg-1", [BrandSignal(source="news", headline="Headline")])
+    real_merge = storage._merge_statement
+
+    def failing_merge(table: str) -> str:
+        if table == "Highlight":
+            return "MATCH (n:Missing) RETURN n"
+        return real_merge(table)
+
+    with patch("coding_agent.brand.storage._merge_statement", side_effect=failing_merge):
+        with pytest.raises(RuntimeError):
+            writer.flush()
+
+    assert _count(engine, "Report") == 0
+    assert len(writer) == 7
+    writer.flush()
+    assert _count(engine, "Report") == 1
+    engine.close()
+
+
+def test_migration_moves_link_tables_to_relationships(tmp_path):
+    path = tmp_path / "brandos.db"
+    database = kuzu.Database(str(path))
+    conn = kuzu.Connection(database)
+    conn.execute("CREATE NODE TABLE SchemaVersion(id INT64, version INT64, PRIMARY KEY(id))")
+    for statement in storage.SCHEMA_MIGRATIONS[0]:
+        conn.execute(statement)
+    conn.execute("CREATE (:SchemaVersion {id: 0, version: 1})")
+    conn.execute("CREATE (:Brand {id: 'acme', name: 'Acme'})")
+    conn.execute(
+        "CREATE (:Report {id: 'acme:2024-05-01:m', brand_id: 'acme', report_date: '2024-05-01'}), "
+        "(:BrandReports {report_id: 'acme:2024-05-01:m', brand_id: 'acme', created_at: '2024-05-01'})"
+    )
+    for index in range(2):
+        conn.execute(
+            f"CREATE (:Highlight {{id: 'acme:2024-05-01:m:{index}', report_id: 'acme:2024-05-01:m', "
+            f"headline: 'H{index}', source: 'news'}})"
+        )
+    conn.close()
+    database.close()
+
+    assert migrate.main(["--db", str(path), "--check"]) == 1
+    assert migrate.main(["--db", str(path)]) == 0
+    assert migrate.main(["--db", str(path), "--check"]) == 0
+
+    engine = KuzuStorageEngine(path)
+    assert engine.stored_version() == SCHEMA_VERSION
+    with engine.connection() as conn:
+        rows = conn.execute(
+            "MATCH (:Brand {id: 'acme'})-[:HAS_REPORT]->(:Report)-[e:HAS_HIGHLIGHT]->(h:Highlight)"
+            "-[:FROM_SOURCE]->(s:Source) RETURN e.position, h.headline, s.name ORDER BY e.position"
+        ).get_all()
+        tables = {row[0] for row in conn.execute("CALL show_tables() RETURN name").get_all()}
+    assert rows == [[0, "H0", "news"], [1, "H1", "news"]]
+    assert "BrandReports" not in tables and "ReportHighlights" not in tables
+    engine.close()
+
+
+def test_repeated_highlight_keeps_earliest_first_seen(tmp_path):
+    engine = KuzuStorageEngine(tmp_path / "brandos.db")
+    signal = BrandSignal(source="news", headline="Acme opens a store", url="https://acme.test/store?utm_source=x")
+    later = _report().model_copy(update={"report_date": date(2024, 5, 3)})
+    earlier = _report().model_copy(update={"report_date": date(2024, 4, 30)})
+
+    persist_to_kuzu("acme", later, "msg-3", [signal], engine=engine)
+    persist_to_kuzu("acme", _report(), "msg-1", [signal.model_copy(update={"url": "https://ACME.test/store"})], engine=engine)
+    persist_to_kuzu("acme", earlier, "msg-0", [signal], engine=engine)
+    persist_to_kuzu("acme", later, "msg-3", [signal], engine=engine)
+
+    assert _count(engine, "Highlight") == 1
+    assert _count_edges(engine, "HAS_HIGHLIGHT") == 3
+    with engine.connection() as conn:
+        first_seen = conn.execute("MATCH (h:Highlight) RETURN h.first_seen").get_next()[0]
+    assert first_seen == "2024-04-30"
+    engine.close()
+
+
+def test_migration_merges_repeated_highlights_by_content(tmp_path):
+    path = tmp_path / "brandos.db"
+    database = kuzu.Database(str(path))
+    conn = kuzu.Connection(database)
+    conn.execute("CREATE NODE TABLE SchemaVersion(id INT64, version INT64, PRIMARY KEY(id))")
+    for statements in storage.SCHEMA_MIGRATIONS[:2]:
+        for statement in statements:
+            conn.execute(statement)
+    conn.execute("CREATE (:SchemaVersion {id: 0, version: 2})")
+    conn.execute("CREATE (:Brand {id: 'acme', name: 'Acme'}), (:Source {name: 'news'})")
+    for day in ("2024-05-02", "2024-05-01"):
+        report_id = f"acme:{day}:m"
+        conn.execute(
+            "MATCH (b:Brand {id: 'acme'}), (s:Source {name: 'news'}) "
+            "CREATE (b)-[:HAS_REPORT {created_at: $day}]->(r:Report {id: $report_id, brand_id: 'acme', report_date: $day}) "
+            "CREATE (r)-[:HAS_HIGHLIGHT {position: 0}]->(h:Highlight {id: $report_id + ':0', report_id: $report_id, "
+            "headline: 'Same story', impact: 'high', source: 'news', summary: '', url: ''})-[:FROM_SOURCE]->(s)",
+            {"day": day, "report_id": report_id},
+        )
+    conn.close()
+    database.close()
+
+    engine = KuzuStorageEngine(path)
+    assert engine.migrate() == SCHEMA_VERSION
+    assert _count(engine, "Highlight") == 1
+    assert _count_edges(engine, "HAS_HIGHLIGHT") == 2
+    assert _count_edges(engine, "FROM_SOURCE") == 1
+    with engine.connection() as conn:
+        row = conn.execute("MATCH (h:Highlight) RETURN h.id, h.first_seen, h.impact").get_next()
+    assert row == [signal_key(BrandSignal(source="news", headline="Same story")), "2024-05-01", "high"]
+    engine.close()
+
+
+def test_report_history_reads_through_and_invalidates_on_write(tmp_path):
+    archive = JsonSignalArchive(tmp_path)
+    history = ReportHistory(archive, max_entries=3)
+    monday, tuesday = date(2024, 5, 6), date(2024, 5, 7)
+    storage.persist_raw_signals("acme", monday, [BrandSignal(source="news", headline="Monday")], archive=archive)
+    storage.persist_report_summary("acme", _report().model_copy(update={"report_date": monday}), "m1", archive=archive)
+
+    assert history.warm(7, today=tuesday) == 1
+    previous = history.previous("acme", tuesday)
+    assert previous.message_id == "m1" and [s.headline for s in previous.signals] == ["Monday"]
+    assert history.get("acme", tuesday).report is None
+    assert (history.hits, history.misses) == (1, 1)
+
+    with write_batch(durable=False):
+        storage.persist_report_summary("acme", _report().model_copy(update={"report_date": tuesday}), "m2", archive=archive)
+        assert history.get("acme", tuesday).report is None  # not published yet
+    assert history.get("acme", tuesday).message_id == "m2"
+    for day in range(1, 4):
+        history.get("globex", date(2024, 5, day))
+    assert len(history) == 3 and history.get("acme", monday).message_id == "m1"
@@ -1,7 +1,8 @@
+import random
 from datetime import date
 
-from coding_agent.brand.models import BrandSignal
-from coding_agent.brand.summarizer import HeuristicSummarizer
+from coding_agent.brand.models import BrandSignal, SignalBatch
+from coding_agent.brand.summarizer import HeuristicSummarizer, StreamingSummarizer
 
 
 def test_heuristic_summarizer_generates_metrics():
@@ -18,3 +19,82 @@ def test_heuristic_summarizer_generates_metrics():
     assert report.overview is not None
     assert report.actions[0].startswith("Investigate")
     assert len(report.actions) >= 2
+
+
+def test_syndicated_copies_collapse_into_one_weighted_highlight():
+    outlets = ["Adweek", "Ad Age", "Campaign", "The Drum", "Marketing Dive"]
+    signals = [
+        BrandSignal(source=outlet, headline=f"Barbarian launches immersive campaign for QSR brand - {outlet}")
+        for outlet in outlets
+    ]
+    signals.insert(2, BrandSignal(source="wire", headline="Barbarian Launches Immersive Campaign For QSR Brand", impact="high"))
+    signals.append(BrandSignal(source="news", headline="Globex hires a new chief marketing officer"))
+
+    report = HeuristicSummarizer().summarize("brand", date(2025, 1, 15), signals)
+
+    assert [(signal.source, signal.cluster_size) for signal in report.highlights] == [("wire", 6), ("news", 1)]
+    assert "carried by 6 outlets" in report.overview
+    assert report.metrics["total_signals"] == 7
+    assert report.metrics["clusters"] == 2
+    assert report.metrics["syndicated_copies"] == 5
+    assert report.metrics["unique_sources"] == 7
+
+
+
+def _mixed_signals():
+    outlets = ["Adweek", "Ad Age", "Campaign"]
+    signals = [
+        BrandSignal(source="news", headline="Acme opens  flagship store", summary="Downtown", impact="medium"),
+        BrandSignal(source="blog", headline="acme opens flagship store", summary="downtown"),
+        BrandSignal(source="social", headline="Buzz", impact="low"),
+    ]
+    signals += [
+        BrandSignal(source=outlet, headline=f"Acme recalls kettles after safety review - {outlet}", impact="medium")
+        for outlet in outlets
+    ]
+    signals.append(BrandSignal(source="wire", headline="ACME recalls kettles after safety review", impact="high"))
+    signals.append(BrandSignal(source="news", headline="   "))
+    return signals
+
+
+def test_streaming_summarizer_matches_heuristic_for_small_inputs():
+    signals = _mixed_signals()
+
+    expected = HeuristicSummarizer().summarize("brand", date(2025, 1, 15), signals)
+    streamed = StreamingSummarizer().summarize("brand", date(2025, 1, 15), iter(signals))
+
+    assert streamed == expected
+    assert HeuristicSummarizer().summarize("brand", date(2025, 1, 15), SignalBatch.from_signals(signals)) == expected
+    assert StreamingSummarizer().summarize("brand", date(2025, 1, 15), iter(())) == HeuristicSummarizer().summarize(
+        "brand", date(2025, 1, 15), ()
+    )
+
+
+def test_streaming_summarizer_keeps_only_top_k_clusters():
+    def mentions():
+        for index in range(400):
+            rng = random.Random(index)
+            headline = " ".join(f"{rng.getrandbits(32):08x}" for _ in range(4))
+            impact = "high" if index % 100 == 7 else "low"
+            yield BrandSignal(source=f"outlet-{index % 9}", headline=headline, impact=impact)
+
+    summarizer = StreamingSummarizer(max_highlights=5)
+    report = summarizer.summarize("brand", date(2025, 1, 15), mentions())
+
+    assert len(report.highlights) == 5
+    assert [signal.impact for signal in report.highlights].count("high") == 4
+    expected = HeuristicSummarizer().summarize("brand", date(2025, 1, 15), tuple(mentions()))
+    assert report.metrics == expected.metrics
+    assert report.highlights == expected.highlights[:1] + tuple(
+        signal for signal in expected.highlights if signal.impact == "high"
+    )
+
+
+def test_streaming_summarizer_drops_only_true_repeats():
+    signals = [BrandSignal(source="news", headline=f"{index:08x} {index * 7919:08x} story") for index in range(300)]
+
+    def total(summarizer, stream):
+        return summarizer.summarize("brand", date(2025, 1, 15), iter(stream)).metrics["total_signals"]
+
+    assert total(StreamingSummarizer(max_highlights=2, seen_capacity=1), signals) == 300
+    assert total(StreamingSummarizer(max_highlights=2), signals + signals[:3] + signals[-3:]) == 300
@@ -0,0 +1,77 @@
+import math
+import os
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from coding_agent.brand.timeseries import MetricsTimeSeries
+
+
+def _values(series):
+    return [None if math.isnan(value) else value for value in series]
+
+
+def test_append_and_range_query(tmp_path):
+    store = MetricsTimeSeries(tmp_path)
+    for day, total in ((1, 4), (2, 6), (3, 5), (5, 9)):
+        store.append("acme", date(2024, 5, day), {"total_signals": total})
+    store.append("acme", date(2024, 5, 5), {"total_signals": 10, "unique_sources": 3})
+
+    series = store.series("acme", "total_signals", date(2024, 5, 2), date(2024, 5, 5))
+
+    assert series.days == (date(2024, 5, 2), date(2024, 5, 3), date(2024, 5, 5))
+    assert list(series.values) == [6.0, 5.0, 10.0]
+    assert _values(series.deltas()) == [None, -1.0, 5.0]
+    assert list(series.moving_average(2)) == [6.0, 5.5, 7.5]
+    assert _values(store.series("acme", "unique_sources").values) == [None, None, None, 3.0]
+    assert store.metrics("acme") == ("total_signals", "unique_sources")
+    assert len(store.series("acme", "total_signals", date(2024, 6, 1))) == 0
+
+
+def test_backfill_and_torn_rows(tmp_path):
+    store = MetricsTimeSeries(tmp_path)
+    store.append("acme", date(2024, 5, 3), {"total_signals": 3})
+    store.append("acme", date(2024, 5, 1), {"total_signals": 1})
+    store.append("acme", date(2024, 5, 3), {"total_signals": 30})
+    # A crash after a metric row was written but before the day was committed.
+    with (tmp_path / ".metrics" / "acme" / "total_signals.f64").open("ab") as handle:
+        handle.write(b"\0" * 8)
+    store.append("acme", date(2024, 5, 4), {"total_signals": 4})
+
+    series = store.series("acme", "total_signals")
+    assert series.days == (date(2024, 5, 1), date(2024, 5, 3), date(2024, 5, 4))
+    assert list(series.values) == [1.0, 30.0, 4.0]
+    assert _values(series.moving_average(10)) == [1.0, 15.5, 35 / 3]
+    with pytest.raises(ValueError):
+        series.moving_average(0)
+
+
+def test_interrupted_backfill_is_finished_by_the_next_write(tmp_path):
+    store = MetricsTimeSeries(tmp_path)
+    store.append("acme", date(2024, 5, 1), {"mentions": 1, "sources": 10})
+    store.append("acme", date(2024, 5, 3), {"mentions": 3, "sources": 30})
+    real_replace = os.replace
+    renamed = []
+
+    def crash_after_first_column(source, target):
+        if str(source).endswith(".tmp") and not str(target).endswith(".pending"):
+            if renamed:
+                raise OSError("crash")
+            renamed.append(target)
+        real_replace(source, target)
+
+    with patch("coding_agent.brand.timeseries.os.replace", side_effect=crash_after_first_column):
+        with pytest.raises(OSError):
+            store.append("acme", date(2024, 5, 2), {"mentions": 2, "sources": 20})
+    store.append("acme", date(2024, 5, 4), {"mentions": 4, "sources": 40})
+
+    assert store.days("acme") == tuple(date(2024, 5, day) for day in (1, 2, 3, 4))
+    assert list(store.series("acme", "mentions").values) == [1.0, 2.0, 3.0, 4.0]
+    assert list(store.series("acme", "sources").values) == [10.0, 20.0, 30.0, 40.0]
+    assert sorted(path.name for path in (tmp_path / ".metrics" / "acme").iterdir()) == [
+        ".lock",
+        "days.i32",
+        "mentions.f64",
+        "sources.f64",
+    ]
@@ -0,0 +1,19 @@
+from coding_agent.brand.transport import HttpTransport, default_transport
+
+
+def test_transport_mounts_pooled_retrying_adapter():
+    transport = HttpTransport(pool_connections=4, pool_maxsize=8, max_retries=2, backoff_factor=0.5)
+
+    adapter = transport.session.get_adapter("https://news.google.com/rss")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert "gzip" in transport.session.headers["Accept-Encoding"]
+    transport.close()
+
+
+def test_default_transport_is_shared():
+    assert default_transport() is default_transport()
@@ -0,0 +1,151 @@
+import fcntl
+import threading
+from datetime import date
+
+import pytest
+
+from coding_agent.brand.models import BrandReport, BrandSignal
+from coding_agent.brand import writebehind
+from coding_agent.brand.writebehind import PersistJob, WriteBehindQueue
+
+
+def _job(brand_id: str) -> PersistJob:
+    return PersistJob(
+        brand_id=brand_id,
+        report=BrandReport(brand_id=brand_id, report_date=date(2024, 5, 1), overview="o"),
+        message_id=f"msg-{brand_id}",
+        signals=(BrandSignal(source="news", headline=f"{brand_id} update"),),
+    )
+
+
+class GatedSink:
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.batches = []
+
+    def __call__(self, jobs):
+        self.started.set()
+        self.release.wait(5)
+        self.batches.append([job.brand_id for job in jobs])
+
+
+def test_jobs_are_coalesced_into_batches():
+    sink = GatedSink()
+    write_behind = WriteBehindQueue(sink, batch_size=10, linger=0)
+
+    write_behind.submit(_job("first"))
+    assert sink.started.wait(2)
+    for brand_id in ("a", "b", "c"):
+        write_behind.submit(_job(brand_id))
+    sink.release.set()
+
+    assert write_behind.flush(2)
+    assert sink.batches == [["first"], ["a", "b", "c"]]
+    assert write_behind.close() == 0
+
+
+def test_full_queue_applies_backpressure():
+    sink = GatedSink()
+    write_behind = WriteBehindQueue(sink, maxsize=1, put_timeout=0.05)
+
+    write_behind.submit(_job("in-flight"))
+    assert sink.started.wait(2)
+    write_behind.submit(_job("queued"))
+    assert write_behind.submit(_job("deferred")) is False
+    assert write_behind.pending == 2
+    assert write_behind.deferred == 1
+
+    sink.release.set()
+    assert write_behind.close() == 0
+
+
+def test_deferred_jobs_are_replayed_from_the_spool(tmp_path):
+    sink = GatedSink()
+    write_behind = WriteBehindQueue(sink, maxsize=1, put_timeout=0.05, spool_dir=tmp_path)
+
+    write_behind.submit(_job("in-flight"))
+    assert sink.started.wait(2)
+    write_behind.submit(_job("queued"))
+    assert write_behind.submit(_job("deferred")) is False
+    sink.release.set()
+    assert write_behind.close() == 0
+    assert sink.batches == [["in-flight"], ["queued"]]
+
+    persisted = []
+    next_run = WriteBehindQueue(lambda jobs: persisted.extend(jobs), spool_dir=tmp_path)
+    assert next_run.recover() == 1
+    assert next_run.flush(2)
+    assert [job.brand_id for job in persisted] == ["deferred"]
+    next_run.close()
+
+
+def test_close_honours_deadline():
+    sink = GatedSink()
+    write_behind = WriteBehindQueue(sink)
+    write_behind.submit(_job("slow"))
+    assert sink.started.wait(2)
+
+    assert write_behind.close(timeout=0.05) == 1
+    with pytest.raises(RuntimeError):
+        write_behind.submit(_job("late"))
+    sink.release.set()
+
+
+def test_unpersisted_jobs_survive_in_the_spool(tmp_path):
+    def failing_sink(jobs):
+        raise OSError("disk full")
+
+    crashed = WriteBehindQueue(failing_sink, spool_dir=tmp_path)
+    crashed.submit(_job("acme"))
+    crashed.submit(_job("globex"))
+    assert crashed.flush(2)
+    assert crashed.failed == 2
+    crashed.close()
+    assert len(list(tmp_path.glob("*.jsonl"))) == 1
+
+    persisted = []
+    recovered = WriteBehindQueue(lambda jobs: persisted.extend(jobs), spool_dir=tmp_path)
+    assert recovered.recover() == 2
+    assert recovered.flush(2)
+    assert sorted(job.brand_id for job in persisted) == ["acme", "globex"]
+    assert persisted[0].report.report_date == date(2024, 5, 1)
+    recovered.close()
+    assert list(tmp_path.glob("*.jsonl")) == []
+
+
+def test_live_spool_files_are_not_recovered(tmp_path):
+    sink = GatedSink()
+    live = WriteBehindQueue(sink, spool_dir=tmp_path)
+    live.submit(_job("acme"))
+
+    other = WriteBehindQueue(lambda jobs: None, spool_dir=tmp_path)
+    assert other.recover() == 0
+
+    sink.release.set()
+    live.close()
+    other.close()
+
+
+def test_spool_file_recovered_before_it_is_locked_is_replaced(tmp_path, monkeypatch):
+    flock = fcntl.flock
+    stolen = []
+
+    def racing_flock(handle, operation):
+        if not stolen:
+            # Another process recovers and unlinks the file between open and flock.
+            stolen.append(next(tmp_path.glob("*.jsonl")))
+            stolen[0].unlink()
+        flock(handle, operation)
+
+    monkeypatch.setattr(writebehind.fcntl, "flock", racing_flock)
+    persisted = []
+    write_behind = WriteBehindQueue(lambda jobs: persisted.extend(jobs), spool_dir=tmp_path)
+    monkeypatch.setattr(writebehind.fcntl, "flock", flock)
+
+    spool_path = write_behind._spool.path
+    assert spool_path != stolen[0]
+    assert spool_path.exists()
+    write_behind.submit(_job("acme"))
+    assert write_behind.flush(2)
+    write_behind.close()
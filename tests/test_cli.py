@@ -1,7 +1,9 @@
-from pathlib import Path
+from datetime import date
 from unittest.mock import patch
 
-from coding_agent.cli import run_brand_report_demo, run_demo_task
+from coding_agent.brand import BrandReport, BrandSignal, BrandTask
+from coding_agent.brand.signal_store import SignalStore
+from coding_agent.cli import _compose_plaintext_email, run_brand_report_demo, run_demo_task
 
 
 def test_run_demo_task_produces_pr_url(capsys):
@@ -13,17 +15,36 @@ def test_run_demo_task_produces_pr_url(capsys):
     assert pr_url.startswith("https://")
 
 
-def test_run_brand_report_demo_outputs_email(capsys):
-    with patch(
-        "coding_agent.cli.persist_raw_signals", return_value=Path("/tmp/signals.json")
-    ) as persist_raw, patch(
-        "coding_agent.cli.persist_report_summary", return_value=Path("/tmp/summary.json")
-    ) as persist_summary, patch("coding_agent.cli.persist_to_kuzu") as persist_kuzu:
+def test_run_brand_report_demo_outputs_email(capsys, tmp_path):
+    store = SignalStore(tmp_path / "signals")
+    with patch("coding_agent.cli.default_write_behind") as write_behind, patch(
+        "coding_agent.cli.default_signal_store", return_value=store
+    ):
         message_id = run_brand_report_demo()
 
-    persist_raw.assert_called_once()
-    persist_summary.assert_called_once()
-    persist_kuzu.assert_called_once()
+    write_behind.return_value.submit.assert_called_once()
+    job = write_behind.return_value.submit.call_args.args[0]
+    assert job.brand_id == "brandos"
+    assert job.message_id == message_id
+    assert job.signals
+    assert all(signal.first_seen == job.report.report_date for signal in job.signals)
     captured = capsys.readouterr().out
     assert "BrandReport" in captured
     assert message_id.startswith("mem-")
+
+
+def test_email_flags_highlights_first_seen_today():
+    today = date(2024, 5, 2)
+    report = BrandReport(
+        brand_id="acme",
+        report_date=today,
+        highlights=(
+            BrandSignal(source="news", headline="Fresh", first_seen=today),
+            BrandSignal(source="news", headline="Carried over", first_seen=date(2024, 5, 1)),
+        ),
+    )
+
+    _subject, body = _compose_plaintext_email(BrandTask(brand_id="acme", report_date=today, recipients=()), report)
+
+    assert "- NEW [news] Fresh (medium)" in body
+    assert "- [news] Carried over (medium)" in body